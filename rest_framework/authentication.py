@@ -3,9 +3,19 @@ Provides various authentication policies.
 """
 import base64
 import binascii
+import datetime
+import hashlib
+import pickle
+import threading
+import time
+from collections import OrderedDict
 
 from django.contrib.auth import authenticate, get_user_model
+from django.core.cache import cache as default_cache
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
 from django.middleware.csrf import CsrfViewMiddleware
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import HTTP_HEADER_ENCODING, exceptions
@@ -33,6 +43,10 @@ class CSRFCheck(CsrfViewMiddleware):
 class BaseAuthentication:
     """
     All authentication classes should extend BaseAuthentication.
+
+    Authentication classes may also implement `.aauthenticate()`, which is
+    awaited instead of running `.authenticate()` in a thread when the view
+    is async.
     """
 
     def authenticate(self, request):
@@ -211,6 +225,212 @@ class TokenAuthentication(BaseAuthentication):
         return self.keyword
 
 
+class _LocalCache:
+    """
+    A thread-safe, in-process LRU cache whose entries expire after a timeout.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            try:
+                expires, value = self.entries[key]
+            except KeyError:
+                return None
+            if expires <= time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout):
+        if self.size <= 0 or timeout <= 0:
+            return
+        with self.lock:
+            self.entries[key] = (time.monotonic() + timeout, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Token based authentication that caches the user and token of each key,
+    in a local LRU cache and in the shared Django cache, so that most
+    requests don't query the database.
+
+    Unknown keys are also cached, for `invalid_timeout` seconds, so that
+    requests with invalid tokens don't reach the database either.
+
+    Saving or deleting a token, or saving its user, discards the cached
+    entries for the token in this process and in the shared cache. Other
+    processes may use their local entries for up to `local_timeout` seconds.
+    """
+    cache = default_cache
+    cache_format = 'token_auth_%(digest)s'
+    timeout = 300
+    invalid_timeout = 10
+    local_cache_size = 1024
+    local_timeout = 5
+
+    # Cached in place of the snapshot of an unknown key.
+    INVALID = 'invalid'
+
+    @classmethod
+    def get_local_cache(cls):
+        if '_local_cache' not in cls.__dict__:
+            cls._local_cache = _LocalCache(cls.local_cache_size)
+        return cls._local_cache
+
+    @classmethod
+    def get_cache_key(cls, key):
+        # Raw keys are not used in cache keys, which may be logged.
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return cls.cache_format % {'digest': digest}
+
+    @classmethod
+    def invalidate(cls, keys):
+        """
+        Discard the cached entries for the given token keys.
+        """
+        cache_keys = [cls.get_cache_key(key) for key in keys]
+        local_cache = cls.get_local_cache()
+        for cache_key in cache_keys:
+            local_cache.delete(cache_key)
+        cls.cache.delete_many(cache_keys)
+
+    @classmethod
+    def connect_signals(cls, model):
+        """
+        Invalidate cached entries when a token of `model` is saved or
+        deleted, or when the user of a token is saved, such as when it is
+        deactivated.
+        """
+        def token_changed(sender, instance, **kwargs):
+            cls.invalidate([instance.key])
+
+        def user_changed(sender, instance, update_fields=None, **kwargs):
+            # Logging in only updates `last_login`, which isn't worth
+            # invalidating the cached tokens of the user for.
+            if update_fields is not None and set(update_fields) <= {'last_login'}:
+                return
+            if instance.pk is not None:
+                keys = model.objects.filter(user=instance).values_list('key', flat=True)
+                cls.invalidate(list(keys))
+
+        user_model = model._meta.get_field('user').related_model
+        dispatch_uid = ('cached_token_authentication', cls, model)
+        post_save.connect(token_changed, sender=model, weak=False, dispatch_uid=dispatch_uid)
+        post_delete.connect(token_changed, sender=model, weak=False, dispatch_uid=dispatch_uid)
+        post_save.connect(user_changed, sender=user_model, weak=False, dispatch_uid=dispatch_uid)
+        cls._signals_connected = model
+
+    def authenticate_credentials(self, key):
+        model = self.get_model()
+        if self.__class__.__dict__.get('_signals_connected') is not model:
+            self.connect_signals(model)
+
+        cache_key = self.get_cache_key(key)
+        local_cache = self.get_local_cache()
+        cached = local_cache.get(cache_key)
+        if cached is None:
+            cached = self.cache.get(cache_key)
+            timeout = self.invalid_timeout if cached == self.INVALID else self.timeout
+            if cached is None:
+                cached = self.get_snapshot(model, key)
+                timeout = self.invalid_timeout if cached == self.INVALID else self.timeout
+                self.cache.set(cache_key, cached, timeout)
+            local_cache.set(cache_key, cached, min(self.local_timeout, timeout))
+
+        if cached == self.INVALID:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        # Each request gets its own copies of the user and token.
+        user, token = pickle.loads(cached)
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        return (user, token)
+
+    def get_snapshot(self, model, key):
+        """
+        Return the pickled `(user, token)` for the key, or `INVALID`.
+        """
+        try:
+            token = model.objects.select_related('user').get(key=key)
+        except model.DoesNotExist:
+            return self.INVALID
+        return pickle.dumps((token.user, token))
+
+
+class HashedTokenAuthentication(TokenAuthentication):
+    """
+    Token based authentication using `HashedToken`, which only stores a
+    digest of each token's secret. Users may have many tokens, which may
+    expire.
+
+    Tokens are looked up by the prefix of their key, and the secret is
+    compared against the stored digest in constant time. The time a token
+    was last used is written at most once every `last_used_interval`
+    seconds, rather than on every request.
+    """
+
+    last_used_interval = 60
+
+    def get_model(self):
+        if self.model is not None:
+            return self.model
+        from rest_framework.authtoken.models import HashedToken
+        return HashedToken
+
+    def authenticate_credentials(self, key):
+        model = self.get_model()
+        prefix, secret = model.split_key(key)
+        if not prefix or not secret:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        try:
+            token = model.objects.select_related('user').get(prefix=prefix)
+        except model.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        if not token.check_secret(secret):
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        now = timezone.now()
+        if token.is_expired(now):
+            raise exceptions.AuthenticationFailed(_('Token has expired.'))
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        self.update_last_used(token, now)
+        return (token.user, token)
+
+    def update_last_used(self, token, now):
+        threshold = now - datetime.timedelta(seconds=self.last_used_interval)
+        if token.last_used is not None and token.last_used > threshold:
+            return
+        # Only the first of any concurrent requests updates the row.
+        queryset = type(token).objects.filter(pk=token.pk).filter(
+            Q(last_used__isnull=True) | Q(last_used__lte=threshold)
+        )
+        queryset.update(last_used=now)
+        token.last_used = now
+
+
 class RemoteUserAuthentication(BaseAuthentication):
     """
     REMOTE_USER authentication.
@@ -6,7 +6,7 @@ from django.core.exceptions import ValidationError
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
-from rest_framework.authtoken.models import Token, TokenProxy
+from rest_framework.authtoken.models import HashedToken, Token, TokenProxy
 
 User = get_user_model()
 
@@ -52,3 +52,20 @@ class TokenAdmin(admin.ModelAdmin):
 
 
 admin.site.register(TokenProxy, TokenAdmin)
+
+
+class HashedTokenAdmin(admin.ModelAdmin):
+    list_display = ('prefix', 'user', 'name', 'created', 'expires_at', 'last_used')
+    fields = ('prefix', 'user', 'name', 'created', 'expires_at', 'last_used')
+    readonly_fields = ('prefix', 'user', 'created', 'last_used')
+    search_fields = ('prefix', 'user__username')
+    list_select_related = ('user',)
+    ordering = ('-created',)
+
+    def has_add_permission(self, request):
+        # Keys are only available when tokens are created, so tokens are
+        # issued through `HashedToken.objects.create_token()` instead.
+        return False
+
+
+admin.site.register(HashedToken, HashedTokenAdmin)
@@ -5,3 +5,15 @@ from django.utils.translation import gettext_lazy as _
 class AuthTokenConfig(AppConfig):
     name = 'rest_framework.authtoken'
     verbose_name = _("Auth Token")
+
+    def ready(self):
+        from rest_framework.authentication import CachedTokenAuthentication
+        from rest_framework.settings import api_settings
+
+        # Tokens may be revoked by processes that never authenticate a
+        # request, so cached tokens are invalidated from every process, if
+        # the cached authentication is used by default. Otherwise the signals
+        # are connected when a view first uses it.
+        for authentication_class in api_settings.DEFAULT_AUTHENTICATION_CLASSES:
+            if issubclass(authentication_class, CachedTokenAuthentication):
+                authentication_class.connect_signals(authentication_class().get_model())
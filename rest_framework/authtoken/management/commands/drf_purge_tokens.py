@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from rest_framework.authtoken.models import HashedToken
+
+
+class Command(BaseCommand):
+    help = 'Delete expired DRF hashed tokens'
+
+    def purge_expired_tokens(self, batch_size):
+        # Delete in batches, so that large tables aren't locked for long.
+        now = timezone.now()
+        expired = HashedToken.objects.filter(expires_at__lte=now).order_by()
+        deleted = 0
+        while True:
+            pks = list(expired.values_list('pk', flat=True)[:batch_size])
+            if not pks:
+                return deleted
+            count, _ = HashedToken.objects.filter(pk__in=pks).delete()
+            deleted += count
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '-b',
+            '--batch-size',
+            type=int,
+            dest='batch_size',
+            default=1000,
+            help='Number of tokens to delete at a time',
+        )
+
+    def handle(self, *args, **options):
+        deleted = self.purge_expired_tokens(options['batch_size'])
+        self.stdout.write(f'Deleted {deleted} expired tokens')
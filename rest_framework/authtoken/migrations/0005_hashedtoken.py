@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:28
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authtoken', '0004_alter_tokenproxy_options'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HashedToken',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('prefix', models.CharField(max_length=16, unique=True, verbose_name='Prefix')),
+                ('digest', models.CharField(max_length=64, verbose_name='Digest')),
+                ('name', models.CharField(blank=True, max_length=100, verbose_name='Name')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Created')),
+                ('expires_at', models.DateTimeField(blank=True, db_index=True, null=True, verbose_name='Expires at')),
+                ('last_used', models.DateTimeField(blank=True, null=True, verbose_name='Last used')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='hashed_tokens', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+            ],
+            options={
+                'verbose_name': 'Hashed token',
+                'verbose_name_plural': 'Hashed tokens',
+                'abstract': False,
+            },
+        ),
+    ]
@@ -1,7 +1,10 @@
+import hashlib
+import hmac
 import secrets
 
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 
@@ -61,3 +64,85 @@ class TokenProxy(Token):
         abstract = 'rest_framework.authtoken' not in settings.INSTALLED_APPS
         verbose_name = _("Token")
         verbose_name_plural = _("Tokens")
+
+
+class HashedTokenManager(models.Manager):
+    def create_token(self, user, expires_at=None, name=''):
+        """
+        Create a token for the user, and return a tuple of `(token, key)`.
+
+        The key is only available when the token is created, since only a
+        digest of its secret is stored.
+        """
+        secret = self.model.generate_secret()
+        token = self.create(
+            user=user,
+            prefix=self.model.generate_prefix(),
+            digest=self.model.hash_secret(secret),
+            expires_at=expires_at,
+            name=name,
+        )
+        return (token, '%s%s%s' % (token.prefix, self.model.separator, secret))
+
+
+class HashedToken(models.Model):
+    """
+    An authorization token that only stores a digest of its secret.
+
+    Keys have the form `<prefix>.<secret>`. The prefix is stored as-is, in
+    an indexed column that tokens are looked up by, and the secret is
+    compared against the stored digest. Users may have many tokens, which
+    may expire.
+    """
+    separator = '.'
+
+    prefix = models.CharField(_("Prefix"), max_length=16, unique=True)
+    digest = models.CharField(_("Digest"), max_length=64)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, related_name='hashed_tokens',
+        on_delete=models.CASCADE, verbose_name=_("User")
+    )
+    name = models.CharField(_("Name"), max_length=100, blank=True)
+    created = models.DateTimeField(_("Created"), auto_now_add=True)
+    expires_at = models.DateTimeField(_("Expires at"), null=True, blank=True, db_index=True)
+    last_used = models.DateTimeField(_("Last used"), null=True, blank=True)
+
+    objects = HashedTokenManager()
+
+    class Meta:
+        abstract = 'rest_framework.authtoken' not in settings.INSTALLED_APPS
+        verbose_name = _("Hashed token")
+        verbose_name_plural = _("Hashed tokens")
+
+    @classmethod
+    def generate_prefix(cls):
+        return secrets.token_hex(8)
+
+    @classmethod
+    def generate_secret(cls):
+        return secrets.token_hex(20)
+
+    @classmethod
+    def hash_secret(cls, secret):
+        # Secrets are random, so a fast digest can't be brute forced.
+        return hashlib.sha256(secret.encode()).hexdigest()
+
+    @classmethod
+    def split_key(cls, key):
+        """
+        Return a tuple of `(prefix, secret)` for the key, either of which
+        may be empty if the key is malformed.
+        """
+        prefix, _, secret = key.partition(cls.separator)
+        return (prefix, secret)
+
+    def check_secret(self, secret):
+        return hmac.compare_digest(self.digest, self.hash_secret(secret))
+
+    def is_expired(self, now=None):
+        if self.expires_at is None:
+            return False
+        return self.expires_at <= (now or timezone.now())
+
+    def __str__(self):
+        return self.prefix
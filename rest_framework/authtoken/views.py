@@ -1,5 +1,7 @@
+from django.utils import timezone
+
 from rest_framework import parsers, renderers
-from rest_framework.authtoken.models import Token
+from rest_framework.authtoken.models import HashedToken, Token
 from rest_framework.authtoken.serializers import AuthTokenSerializer
 from rest_framework.compat import coreapi, coreschema
 from rest_framework.response import Response
@@ -14,6 +16,8 @@ class ObtainAuthToken(APIView):
     parser_classes = (parsers.FormParser, parsers.MultiPartParser, parsers.JSONParser,)
     renderer_classes = (renderers.JSONRenderer,)
     serializer_class = AuthTokenSerializer
+    token_model = Token
+    token_lifetime = None
 
     if coreapi_schema.is_enabled():
         schema = ManualSchema(
@@ -55,8 +59,23 @@ class ObtainAuthToken(APIView):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         user = serializer.validated_data['user']
-        token, created = Token.objects.get_or_create(user=user)
-        return Response({'token': token.key})
+        return Response(self.get_token_data(user))
+
+    def get_token_data(self, user):
+        """
+        Return the user's `Token`, creating it if required, or issue a new
+        `HashedToken` that expires after `token_lifetime`, if it is set.
+        """
+        if issubclass(self.token_model, HashedToken):
+            expires_at = None
+            if self.token_lifetime is not None:
+                expires_at = timezone.now() + self.token_lifetime
+            token, key = self.token_model.objects.create_token(user, expires_at=expires_at)
+            return {'token': key, 'expires_at': expires_at}
+
+        token, created = self.token_model.objects.get_or_create(user=user)
+        return {'token': token.key}
 
 
 obtain_auth_token = ObtainAuthToken.as_view()
+obtain_hashed_token = ObtainAuthToken.as_view(token_model=HashedToken)
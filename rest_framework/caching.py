@@ -0,0 +1,332 @@
+"""
+Provides conditional request handling, and caching of rendered responses,
+for the `GET` and `HEAD` requests handled by a view.
+
+Usage: decorate a view handler, such as `.get()` or `.retrieve()`, with
+`@cache_response(...)`. Views that modify objects may include
+`ResponseCacheMixin`, to invalidate the cached responses when they do.
+"""
+import functools
+import hashlib
+import uuid
+from calendar import timegm
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.core.cache import cache as default_cache
+from django.http import HttpResponse
+from django.utils.cache import cc_delim_re, get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from rest_framework.response import Response
+
+
+def _get_queryset(view):
+    """
+    Returns a tuple of `(queryset, is_detail)` for a generic view, with the
+    filtered queryset, limited to the object that it looks up for detail views.
+    """
+    queryset = view.filter_queryset(view.get_queryset())
+    lookup_url_kwarg = view.lookup_url_kwarg or view.lookup_field
+    if lookup_url_kwarg in view.kwargs:
+        queryset = queryset.filter(**{view.lookup_field: view.kwargs[lookup_url_kwarg]})
+        return (queryset, True)
+    return (queryset, False)
+
+
+def etag_from_field(field_name):
+    """
+    Returns an ETag function for generic views, using a field that changes
+    whenever the object does, such as a version number.
+
+    Detail views read the field for the object that they look up. List views
+    read the primary key and the field of every object, so that adding,
+    changing or deleting any of them changes the ETag.
+    """
+    def etag_func(view, request, *args, **kwargs):
+        queryset, is_detail = _get_queryset(view)
+        if is_detail:
+            value = queryset.values_list(field_name, flat=True).first()
+            if value is None:
+                return None
+            return hashlib.md5(str(value).encode(), usedforsecurity=False).hexdigest()
+
+        signature = hashlib.md5(usedforsecurity=False)
+        for row in queryset.order_by('pk').values_list('pk', field_name).iterator():
+            signature.update(('%r\n' % (row,)).encode())
+        return signature.hexdigest()
+    return etag_func
+
+
+def last_modified_from_field(field_name):
+    """
+    Returns a Last-Modified function for generic views, using a field that
+    holds the time at which the object was last modified.
+
+    Only detail views are given a Last-Modified time. The objects in a list
+    may be deleted without changing the greatest value of the field, so list
+    views should use `etag_from_field()` instead.
+    """
+    def last_modified_func(view, request, *args, **kwargs):
+        queryset, is_detail = _get_queryset(view)
+        if not is_detail:
+            return None
+        return queryset.values_list(field_name, flat=True).first()
+    return last_modified_func
+
+
+class ResponseCache:
+    """
+    Answers conditional requests using the validators returned by the ETag
+    and Last-Modified functions, and caches the rendered content of
+    successful responses for `timeout` seconds, if it is set.
+
+    Cached content and headers are stored for each view class, path and
+    query, accepted media type, API version, validators, authenticated user,
+    and value of the request headers in `vary_headers` and in the `Vary`
+    header of the stored responses. The cached responses of a view class
+    are invalidated together by `invalidate()`.
+    """
+    cache = default_cache
+    cache_format = 'response_%(signature)s'
+    generation_format = 'response_generation_%(view)s'
+    vary_format = 'response_vary_%(signature)s'
+    vary_headers = ('Accept-Language', 'Authorization', 'Cookie')
+
+    def __init__(self, etag_func=None, last_modified_func=None, timeout=None):
+        self.etag_func = etag_func
+        self.last_modified_func = last_modified_func
+        self.timeout = timeout
+
+    def get_validators(self, view, request, *args, **kwargs):
+        """
+        Return a tuple of `(etag, last_modified)`, either of which may be
+        `None`. The ETag is quoted, and the Last-Modified time is a timestamp.
+        """
+        etag = last_modified = None
+        if self.etag_func is not None:
+            etag = self.etag_func(view, request, *args, **kwargs)
+            if etag is not None:
+                etag = quote_etag(str(etag))
+        if self.last_modified_func is not None:
+            value = self.last_modified_func(view, request, *args, **kwargs)
+            if value is not None:
+                last_modified = timegm(value.utctimetuple())
+        return (etag, last_modified)
+
+    def get_conditional_response(self, request, etag, last_modified):
+        """
+        Return a `304 Not Modified` or `412 Precondition Failed` response if
+        the request's conditions are met, or `None`.
+        """
+        if etag is None and last_modified is None:
+            return None
+        response = get_conditional_response(
+            request._request, etag=etag, last_modified=last_modified
+        )
+        if response is not None:
+            self.set_validators(response, etag, last_modified)
+        return response
+
+    def set_validators(self, response, etag, last_modified):
+        if etag is not None and not response.has_header('ETag'):
+            response['ETag'] = etag
+        if last_modified is not None and not response.has_header('Last-Modified'):
+            response['Last-Modified'] = http_date(last_modified)
+
+    def get_view_name(self, view):
+        view_class = type(view)
+        return '%s.%s' % (view_class.__module__, view_class.__qualname__)
+
+    def get_generation(self, view):
+        """
+        Return the token that the cached responses of the view are stored
+        under, which `invalidate()` replaces.
+        """
+        key = self.generation_format % {'view': self.get_view_name(view)}
+        generation = self.cache.get(key)
+        if generation is None:
+            # Start a new generation, rather than reusing the responses stored
+            # before the token was evicted.
+            self.cache.add(key, uuid.uuid4().hex, None)
+            generation = self.cache.get(key)
+        return generation
+
+    def invalidate(self, view):
+        """
+        Discard the cached responses of the view's class.
+        """
+        key = self.generation_format % {'view': self.get_view_name(view)}
+        self.cache.set(key, uuid.uuid4().hex, None)
+
+    def get_signature(self, parts):
+        signature = '\n'.join(repr(part) for part in parts)
+        return hashlib.sha256(signature.encode()).hexdigest()
+
+    def get_user_key(self, request):
+        """
+        Return a value identifying the authenticated user or credentials,
+        so that responses stored for one user are never served to another.
+        """
+        user = request.user
+        if user is not None and user.is_authenticated:
+            return ('user', user.pk)
+        if request.auth is not None:
+            return ('auth', str(request.auth))
+        return None
+
+    def get_vary_key(self, view, request):
+        """
+        Return the key that the headers named in the `Vary` header of the
+        stored responses for the path are kept under.
+        """
+        parts = [
+            self.get_view_name(view),
+            self.get_generation(view),
+            request.get_full_path(),
+        ]
+        return self.vary_format % {'signature': self.get_signature(parts)}
+
+    def get_cache_key(self, view, request, etag, last_modified, headers=()):
+        parts = [
+            self.get_view_name(view),
+            self.get_generation(view),
+            request.get_full_path(),
+            request.accepted_media_type,
+            request.version,
+            etag,
+            last_modified,
+            self.get_user_key(request),
+        ]
+        for header in (*self.vary_headers, *headers):
+            parts.append(request.headers.get(header))
+        return self.cache_format % {'signature': self.get_signature(parts)}
+
+    def get_cached_response(self, view, request, etag, last_modified):
+        headers = self.cache.get(self.get_vary_key(view, request), ())
+        key = self.get_cache_key(view, request, etag, last_modified, headers)
+        cached = self.cache.get(key)
+        if cached is None:
+            return None
+        content, headers = cached
+        response = HttpResponse(content)
+        for header, value in headers:
+            response[header] = value
+        return response
+
+    def store_response(self, view, request, response, etag, last_modified):
+        """
+        Store the rendered content and headers of successful responses, once
+        rendered, unless they vary on every request header.
+        """
+        if not isinstance(response, Response) or response.status_code != 200:
+            return
+
+        def store(response):
+            headers = []
+            if response.has_header('Vary'):
+                headers = sorted({
+                    header.strip().lower() for header in cc_delim_re.split(response['Vary'])
+                })
+                if '*' in headers:
+                    return
+            self.cache.set(self.get_vary_key(view, request), headers, self.timeout)
+            key = self.get_cache_key(view, request, etag, last_modified, headers)
+            self.cache.set(key, (response.content, list(response.items())), self.timeout)
+
+        response.add_post_render_callback(store)
+
+    def get_response(self, view, request, args, kwargs):
+        """
+        Return a tuple of `(response, validators)`, with a response if the
+        request can be answered without calling the handler, or else the
+        validators to set on the handler's response.
+        """
+        etag, last_modified = self.get_validators(view, request, *args, **kwargs)
+        response = self.get_conditional_response(request, etag, last_modified)
+        if response is not None:
+            return (response, None)
+
+        if self.timeout is not None:
+            response = self.get_cached_response(view, request, etag, last_modified)
+            if response is not None:
+                self.set_validators(response, etag, last_modified)
+                return (response, None)
+        return (None, (etag, last_modified))
+
+    def finalize_response(self, view, request, response, validators):
+        etag, last_modified = validators
+        if response.status_code == 200:
+            self.set_validators(response, etag, last_modified)
+        if self.timeout is not None:
+            self.store_response(view, request, response, etag, last_modified)
+        return response
+
+
+def cache_response(etag_func=None, last_modified_func=None, timeout=None, cache_class=None):
+    """
+    Decorator for the handlers of `GET` requests to views and viewsets.
+
+    The ETag and Last-Modified functions are called with the view, the
+    request, and the handler's arguments, after the request has been
+    authenticated and the permission checks and throttles have passed.
+    Requests whose conditions are met are answered with `304 Not Modified`
+    before the handler is called.
+
+    If `timeout` is set, the rendered content and headers of successful
+    responses are cached for that many seconds. The cache class defaults to the view's
+    `response_cache_class`, or `ResponseCache`.
+    """
+    def decorator(handler):
+        def get_response_cache(view):
+            klass = cache_class or getattr(view, 'response_cache_class', ResponseCache)
+            return klass(etag_func, last_modified_func, timeout)
+
+        if iscoroutinefunction(handler):
+            @functools.wraps(handler)
+            async def wrapped(view, request, *args, **kwargs):
+                if request.method not in ('GET', 'HEAD'):
+                    return await handler(view, request, *args, **kwargs)
+                response_cache = get_response_cache(view)
+                response, validators = await sync_to_async(response_cache.get_response)(
+                    view, request, args, kwargs
+                )
+                if response is not None:
+                    return response
+                response = await handler(view, request, *args, **kwargs)
+                return response_cache.finalize_response(view, request, response, validators)
+        else:
+            @functools.wraps(handler)
+            def wrapped(view, request, *args, **kwargs):
+                if request.method not in ('GET', 'HEAD'):
+                    return handler(view, request, *args, **kwargs)
+                response_cache = get_response_cache(view)
+                response, validators = response_cache.get_response(view, request, args, kwargs)
+                if response is not None:
+                    return response
+                response = handler(view, request, *args, **kwargs)
+                return response_cache.finalize_response(view, request, response, validators)
+        return wrapped
+    return decorator
+
+
+class ResponseCacheMixin:
+    """
+    Invalidates the responses cached by `@cache_response` for a generic view
+    or viewset when objects are created, updated or destroyed through it.
+    """
+    response_cache_class = ResponseCache
+
+    def invalidate_cached_responses(self):
+        self.response_cache_class().invalidate(self)
+
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        self.invalidate_cached_responses()
+
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        self.invalidate_cached_responses()
+
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        self.invalidate_cached_responses()
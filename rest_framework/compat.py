@@ -19,8 +19,10 @@ def unicode_http_header(value):
 # django.contrib.postgres requires psycopg2
 try:
     from django.contrib.postgres import fields as postgres_fields
+    from django.contrib.postgres import search as postgres_search
 except ImportError:
     postgres_fields = None
+    postgres_search = None
 
 
 # coreapi is required for CoreAPI schema generation
@@ -49,6 +51,18 @@ try:
 except ImportError:
     yaml = None
 
+# orjson is optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# msgpack is optional
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 # inflection is optional
 try:
     import inflection
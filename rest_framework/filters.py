@@ -4,19 +4,25 @@ returned by list views.
 """
 import operator
 import warnings
+import weakref
 from functools import reduce
 
 from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
-from django.db import models
+from django.core.signals import setting_changed
+from django.db import connections, models
 from django.db.models.constants import LOOKUP_SEP
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Greatest
 from django.template import loader
 from django.utils.encoding import force_str
 from django.utils.text import smart_split, unescape_string_literal
+from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import RemovedInDRF317Warning
-from rest_framework.compat import coreapi, coreschema
+from rest_framework.compat import coreapi, coreschema, postgres_search
 from rest_framework.fields import CharField
+from rest_framework.serializers import ModelSerializer, Serializer
 from rest_framework.settings import api_settings
 
 
@@ -37,6 +43,55 @@ def search_smart_split(search_terms):
     return split_terms
 
 
+def _quote_name(queryset, name):
+    return connections[queryset.db].ops.quote_name(name)
+
+
+# Search and ordering plans only depend on the filter class, the model and
+# the configured fields, so they are built on first use and cached here.
+# {filter class: {(search backend, model, search fields, annotations): plan}}
+_search_plans = weakref.WeakKeyDictionary()
+# {serializer class: {(filter class, model, language): valid fields}}
+_ordering_fields = weakref.WeakKeyDictionary()
+
+
+def clear_cache():
+    """
+    Discard the cached search and ordering plans.
+    """
+    _search_plans.clear()
+    _ordering_fields.clear()
+
+
+def _clear_cache_on_setting_changed(*, setting, **kwargs):
+    if setting in ('REST_FRAMEWORK', 'INSTALLED_APPS'):
+        clear_cache()
+
+
+setting_changed.connect(_clear_cache_on_setting_changed)
+
+
+def _record_meta_lookups(view, count):
+    """
+    Add the metadata lookups made by a filter to the view's
+    `filter_meta_lookups`, since filter instances are discarded after use.
+    """
+    view.filter_meta_lookups = getattr(view, 'filter_meta_lookups', 0) + count
+
+
+def _has_static_fields(serializer_class):
+    """
+    Returns `True` if the fields of the serializer class don't depend on
+    instance state such as `self.context`.
+    """
+    for klass in serializer_class.__mro__:
+        if klass in (ModelSerializer, Serializer):
+            return True
+        if '__init__' in klass.__dict__ or 'get_fields' in klass.__dict__:
+            return False
+    return False
+
+
 class BaseFilterBackend:
     """
     A base class from which all filter backend classes should inherit.
@@ -59,6 +114,171 @@ class BaseFilterBackend:
         return []
 
 
+class BaseSearchBackend:
+    """
+    Search backends match search terms against the search fields that have
+    no lookup, or the `'@'` prefix, when used as the `search_backend` of
+    `SearchFilter`. Other search fields are still matched with lookups.
+    """
+    # Set to `False` to keep the existing ordering of the queryset, rather
+    # than ordering the results by how well they match the search terms.
+    order_by_rank = True
+
+    def get_queryset(self, queryset, search_fields, search_terms):
+        """
+        Return the queryset, with any annotations that the conditions use.
+        """
+        return queryset
+
+    def get_condition(self, queryset, search_fields, search_term):
+        """
+        Return a `Q` object matching the objects where any of the search
+        fields matches the search term.
+        """
+        raise NotImplementedError('.get_condition() must be overridden.')
+
+    def get_rank(self, queryset, search_fields, search_terms):
+        """
+        Return an expression ranking each object by how well it matches the
+        search terms, in the order that the results should be returned.
+        """
+        return None
+
+    def order_queryset(self, queryset, search_fields, search_terms):
+        if not self.order_by_rank:
+            return queryset
+        rank = self.get_rank(queryset, search_fields, search_terms)
+        if rank is None:
+            return queryset
+        # Ties are broken by the existing ordering.
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        return queryset.order_by(rank, *ordering)
+
+
+class PostgreSQLSearchBackend(BaseSearchBackend):
+    """
+    Full-text search on PostgreSQL, matching each search term as a
+    `SearchQuery` against a `SearchVector` of the search fields, and ordering
+    the results by `SearchRank`.
+
+    Set `vector_field` to the name of a `SearchVectorField` that holds a
+    precomputed, indexed vector, to avoid computing the vector for each row.
+    """
+    config = None
+    search_type = 'plain'
+    vector_field = None
+
+    def __init__(self):
+        assert postgres_search is not None, (
+            'psycopg must be installed to use `PostgreSQLSearchBackend`.'
+        )
+
+    def get_query(self, search_term):
+        return postgres_search.SearchQuery(
+            search_term, config=self.config, search_type=self.search_type
+        )
+
+    def get_queryset(self, queryset, search_fields, search_terms):
+        if self.vector_field is not None:
+            return queryset
+        vector = postgres_search.SearchVector(*search_fields, config=self.config)
+        return queryset.alias(_search_vector=vector)
+
+    def get_condition(self, queryset, search_fields, search_term):
+        name = self.vector_field or '_search_vector'
+        return models.Q(**{name: self.get_query(search_term)})
+
+    def get_rank(self, queryset, search_fields, search_terms):
+        query = reduce(operator.and_, (self.get_query(term) for term in search_terms))
+        rank = postgres_search.SearchRank(models.F(self.vector_field or '_search_vector'), query)
+        return rank.desc()
+
+
+class TrigramSearchBackend(BaseSearchBackend):
+    """
+    Fuzzy search on PostgreSQL, matching search terms that are similar to a
+    word in any of the search fields, and ordering the results by their
+    similarity. Requires the `pg_trgm` extension, and is best used with a
+    trigram index on each of the search fields.
+    """
+
+    def __init__(self):
+        assert postgres_search is not None, (
+            'psycopg must be installed to use `TrigramSearchBackend`.'
+        )
+
+    def get_condition(self, queryset, search_fields, search_term):
+        return reduce(operator.or_, (
+            models.Q(**{LOOKUP_SEP.join([search_field, 'trigram_word_similar']): search_term})
+            for search_field in search_fields
+        ))
+
+    def get_rank(self, queryset, search_fields, search_terms):
+        similarities = []
+        for search_term in search_terms:
+            term_similarities = [
+                postgres_search.TrigramWordSimilarity(search_term, search_field)
+                for search_field in search_fields
+            ]
+            if len(term_similarities) > 1:
+                similarities.append(Greatest(*term_similarities))
+            else:
+                similarities.extend(term_similarities)
+        return reduce(operator.add, similarities).desc()
+
+
+class SQLiteFTS5SearchBackend(BaseSearchBackend):
+    """
+    Full-text search on SQLite, matching search terms as phrases in an FTS5
+    table, and ordering the results by their `bm25` rank.
+
+    The FTS5 table defaults to the model's table name with an `'_fts'`
+    suffix, and should have a column named after each search field, with
+    the primary key of each object as its `rowid`. For example:
+
+        CREATE VIRTUAL TABLE myapp_article_fts USING fts5(
+            title, author__name, content=''
+        );
+
+    The table is not kept up to date by this backend.
+    """
+    table = None
+
+    def get_table(self, queryset):
+        return self.table or queryset.model._meta.db_table + '_fts'
+
+    def get_match(self, search_fields, search_terms):
+        columns = ' '.join(search_fields)
+        return ' AND '.join(
+            '{%s} : "%s"' % (columns, search_term.replace('"', '""'))
+            for search_term in search_terms
+        )
+
+    def get_condition(self, queryset, search_fields, search_term):
+        rowids = RawSQL(
+            'SELECT rowid FROM {table} WHERE {table} MATCH %s'.format(
+                table=_quote_name(queryset, self.get_table(queryset))
+            ),
+            [self.get_match(search_fields, [search_term])],
+        )
+        return models.Q(pk__in=rowids)
+
+    def get_rank(self, queryset, search_fields, search_terms):
+        opts = queryset.model._meta
+        fts_table = _quote_name(queryset, self.get_table(queryset))
+        rank = RawSQL(
+            'SELECT rank FROM {fts_table} WHERE {fts_table} MATCH %s '
+            'AND rowid = {table}.{pk}'.format(
+                fts_table=fts_table,
+                table=_quote_name(queryset, opts.db_table),
+                pk=_quote_name(queryset, opts.pk.column),
+            ),
+            [self.get_match(search_fields, search_terms)],
+        )
+        # Lower ranks are better matches.
+        return rank.asc(nulls_last=True)
+
+
 class SearchFilter(BaseFilterBackend):
     # The URL query parameter used for the search.
     search_param = api_settings.SEARCH_PARAM
@@ -72,6 +292,16 @@ class SearchFilter(BaseFilterBackend):
     search_title = _('Search')
     search_description = _('A search term.')
 
+    # Set to a `BaseSearchBackend` subclass to match search terms against
+    # search fields without a lookup, such as with full-text search.
+    search_backend = None
+
+    # The number of times that model metadata was traversed by this filter.
+    # Filters are instantiated for each request, so once the search plan has
+    # been cached this stays at zero. `filter_queryset()` also adds it to the
+    # view's `filter_meta_lookups`.
+    meta_lookups = 0
+
     def get_search_fields(self, view, request):
         """
         Search fields are obtained from the view, but the request is always
@@ -96,6 +326,7 @@ class SearchFilter(BaseFilterBackend):
             field_name = field_name[1:]
         else:
             # Use field_name if it includes a lookup.
+            self.meta_lookups += 1
             opts = queryset.model._meta
             lookup_fields = field_name.split(LOOKUP_SEP)
             # Go through the fields, following all relations.
@@ -122,6 +353,7 @@ class SearchFilter(BaseFilterBackend):
         """
         Return True if 'distinct()' should be used to query the given lookups.
         """
+        self.meta_lookups += 1
         for search_field in search_fields:
             opts = queryset.model._meta
             if search_field[0] in self.lookup_prefixes:
@@ -151,30 +383,88 @@ class SearchFilter(BaseFilterBackend):
         if not search_fields or not search_terms:
             return queryset
 
-        orm_lookups = [
-            self.construct_search(str(search_field), queryset)
-            for search_field in search_fields
-        ]
+        meta_lookups = self.meta_lookups
+        orm_lookups, backend_fields, distinct = self.get_search_plan(queryset, search_fields)
+        _record_meta_lookups(view, self.meta_lookups - meta_lookups)
+        if backend_fields:
+            backend = self.search_backend()
 
         base = queryset
+        if backend_fields:
+            queryset = backend.get_queryset(queryset, backend_fields, search_terms)
+
+        def get_condition(term):
+            conditions = [models.Q(**{orm_lookup: term}) for orm_lookup in orm_lookups]
+            if backend_fields:
+                conditions.append(backend.get_condition(queryset, backend_fields, term))
+            return reduce(operator.or_, conditions)
+
         # generator which for each term builds the corresponding search
-        conditions = (
-            reduce(
-                operator.or_,
-                (models.Q(**{orm_lookup: term}) for orm_lookup in orm_lookups)
-            ) for term in search_terms
-        )
+        conditions = (get_condition(term) for term in search_terms)
         queryset = queryset.filter(reduce(operator.and_, conditions))
 
         # Remove duplicates from results, if necessary
-        if self.must_call_distinct(queryset, search_fields):
+        if distinct:
             # inspired by django.contrib.admin
             # this is more accurate than .distinct form M2M relationship
             # also is cross-database
             queryset = queryset.filter(pk=models.OuterRef('pk'))
             queryset = base.filter(models.Exists(queryset))
+            if backend_fields:
+                # The search fields can't be ranked without duplicating
+                # the results.
+                return queryset
+
+        if backend_fields:
+            queryset = backend.order_queryset(queryset, backend_fields, search_terms)
         return queryset
 
+    def get_search_plan(self, queryset, search_fields):
+        """
+        Return a tuple of `(orm_lookups, backend_fields, distinct)` for the
+        search fields: the lookups used to match search terms, the fields
+        matched by the search backend, and whether the results need to be
+        deduplicated.
+
+        The plan is cached for the filter class, the model, the search fields
+        and the names of any annotations on the queryset.
+        """
+        search_fields = tuple(str(search_field) for search_field in search_fields)
+        plans = _search_plans.setdefault(self.__class__, {})
+        key = (
+            self.search_backend, queryset.model, search_fields,
+            frozenset(getattr(getattr(queryset, 'query', None), 'annotations', ())),
+        )
+        try:
+            return plans[key]
+        except KeyError:
+            pass
+
+        orm_lookups = []
+        backend_fields = []
+        for search_field in search_fields:
+            if self.search_backend is not None and self.uses_search_backend(search_field, queryset):
+                backend_fields.append(search_field.lstrip('@'))
+            else:
+                orm_lookups.append(self.construct_search(search_field, queryset))
+        distinct = self.must_call_distinct(queryset, search_fields)
+
+        plan = plans[key] = (tuple(orm_lookups), tuple(backend_fields), distinct)
+        return plan
+
+    def uses_search_backend(self, search_field, queryset):
+        """
+        Return `True` if the search field should be matched by the search
+        backend, because it has the `'@'` prefix, or neither a prefix nor a
+        lookup.
+        """
+        if search_field[0] == '@':
+            return True
+        if search_field[0] in self.lookup_prefixes:
+            return False
+        orm_lookup = self.construct_search(search_field, queryset)
+        return orm_lookup == LOOKUP_SEP.join([search_field, 'icontains'])
+
     def to_html(self, request, queryset, view):
         if not getattr(view, 'search_fields', None):
             return ''
@@ -225,6 +515,12 @@ class OrderingFilter(BaseFilterBackend):
     ordering_description = _('Which field to use when ordering the results.')
     template = 'rest_framework/filters/ordering.html'
 
+    # The number of times that serializer fields were inspected by this
+    # filter. Filters are instantiated for each request, so once the valid
+    # fields have been cached this stays at zero. `filter_queryset()` also
+    # adds it to the view's `filter_meta_lookups`.
+    meta_lookups = 0
+
     def get_ordering(self, request, queryset, view):
         """
         Ordering is set by a comma delimited ?ordering=... query parameter.
@@ -270,13 +566,20 @@ class OrderingFilter(BaseFilterBackend):
             )
             raise ImproperlyConfigured(msg % self.__class__.__name__)
 
+        # Field labels are translated when the serializer fields are built.
+        key = (self.__class__, queryset.model, get_language())
+        cacheable = _has_static_fields(serializer_class)
+        if cacheable and key in _ordering_fields.get(serializer_class, {}):
+            return list(_ordering_fields[serializer_class][key])
+
+        self.meta_lookups += 1
         model_class = queryset.model
         model_property_names = [
             # 'pk' is a property added in Django's Model class, however it is valid for ordering.
             attr for attr in dir(model_class) if isinstance(getattr(model_class, attr), property) and attr != 'pk'
         ]
 
-        return [
+        valid_fields = [
             (field.source.replace('.', '__') or field_name, field.label)
             for field_name, field in serializer_class(context=context).fields.items()
             if (
@@ -285,6 +588,9 @@ class OrderingFilter(BaseFilterBackend):
                 field.source not in model_property_names
             )
         ]
+        if cacheable:
+            _ordering_fields.setdefault(serializer_class, {})[key] = tuple(valid_fields)
+        return valid_fields
 
     def get_valid_fields(self, queryset, view, context={}):
         valid_fields = getattr(view, 'ordering_fields', self.ordering_fields)
@@ -321,7 +627,9 @@ class OrderingFilter(BaseFilterBackend):
         return [term for term in fields if term_valid(term)]
 
     def filter_queryset(self, request, queryset, view):
+        meta_lookups = self.meta_lookups
         ordering = self.get_ordering(request, queryset, view)
+        _record_meta_lookups(view, self.meta_lookups - meta_lookups)
 
         if ordering:
             return queryset.order_by(*ordering)
@@ -7,7 +7,9 @@ from django.http import Http404
 from django.shortcuts import get_object_or_404 as _get_object_or_404
 
 from rest_framework import mixins, views
+from rest_framework.response import StreamingResponse
 from rest_framework.settings import api_settings
+from rest_framework.utils.prefetch import optimize_queryset
 
 
 def get_object_or_404(queryset, *filter_args, **filter_kwargs):
@@ -45,6 +47,20 @@ class GenericAPIView(views.APIView):
     # The style to use for queryset pagination.
     pagination_class = api_settings.DEFAULT_PAGINATION_CLASS
 
+    # Set to `True` to derive `select_related()`, `prefetch_related()` and
+    # `only()` lookups from the serializer when listing objects.
+    auto_prefetch = False
+
+    # Set to `True` to also list objects using `values()` if the serializer
+    # only reads plain model columns, avoiding model instantiation.
+    project_columns = False
+
+    # Set to `True` to stream unpaginated lists, serializing the objects one
+    # at a time while the response is rendered.
+    stream_list = False
+    # The number of rows fetched from the database at a time when streaming.
+    stream_chunk_size = 2000
+
     # Allow generic typing checking for generic views.
     def __class_getitem__(cls, *args, **kwargs):
         return cls
@@ -154,6 +170,20 @@ class GenericAPIView(views.APIView):
             queryset = backend().filter_queryset(self.request, queryset, self)
         return queryset
 
+    def prefetch_queryset(self, queryset):
+        """
+        Given a queryset, apply the related object lookups required by the
+        serializer, if `auto_prefetch` or `project_columns` is enabled.
+
+        You may want to call this from a custom `get_queryset()`, or
+        override it to add lookups that can't be derived from the serializer.
+        """
+        if not (self.auto_prefetch or self.project_columns):
+            return queryset
+        return optimize_queryset(
+            queryset, self.get_serializer(), use_values=self.project_columns
+        )
+
     @property
     def paginator(self):
         """
@@ -181,6 +211,23 @@ class GenericAPIView(views.APIView):
         assert self.paginator is not None
         return self.paginator.get_paginated_response(data)
 
+    def get_streaming_response(self, queryset):
+        """
+        Return a `StreamingResponse` that serializes the objects in the
+        queryset one at a time, as the response content is iterated.
+        """
+        child = self.get_serializer(queryset, many=True).child
+
+        def iter_representation():
+            if isinstance(queryset, QuerySet):
+                objects = queryset.iterator(chunk_size=self.stream_chunk_size)
+            else:
+                objects = queryset
+            for instance in objects:
+                yield child.to_representation(instance)
+
+        return StreamingResponse(iter_representation())
+
 
 # Concrete view classes that provide method handlers
 # by composing the mixin classes with the base view.
@@ -36,12 +36,18 @@ class ListModelMixin:
     """
     def list(self, request, *args, **kwargs):
         queryset = self.filter_queryset(self.get_queryset())
+        prefetch_queryset = getattr(self, 'prefetch_queryset', None)
+        if prefetch_queryset is not None:
+            queryset = prefetch_queryset(queryset)
 
         page = self.paginate_queryset(queryset)
         if page is not None:
             serializer = self.get_serializer(page, many=True)
             return self.get_paginated_response(serializer.data)
 
+        if getattr(self, 'stream_list', False):
+            return self.get_streaming_response(queryset)
+
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
 
@@ -4,13 +4,23 @@ be used for paginated responses.
 """
 
 import contextlib
+import functools
+import hashlib
+import operator
 import warnings
+import weakref
 from base64 import b64decode, b64encode
 from collections import namedtuple
 from urllib import parse
 
+from django.core.cache import cache as default_cache
+from django.core.exceptions import EmptyResultSet, FieldDoesNotExist
 from django.core.paginator import InvalidPage
 from django.core.paginator import Paginator as DjangoPaginator
+from django.db import DatabaseError, connections
+from django.db.models import F, Q
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.query import ModelIterable, QuerySet
 from django.template import loader
 from django.utils.encoding import force_str
 from django.utils.translation import gettext_lazy as _
@@ -20,6 +30,7 @@ from rest_framework.compat import coreapi, coreschema
 from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 from rest_framework.settings import api_settings
+from rest_framework.utils import json
 from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
@@ -127,12 +138,357 @@ def _reverse_ordering(ordering_tuple):
     return tuple([invert(item) for item in ordering_tuple])
 
 
+def _counts_are_approximate(paginator):
+    counter_class = paginator.counter_class
+    return counter_class is not None and counter_class.approximate
+
+
+def _add_count_schema(paginator, schema):
+    """
+    Describe the `count_is_exact` flag of paginators whose counts may be
+    estimates or lower bounds.
+    """
+    if _counts_are_approximate(paginator):
+        properties = schema['properties']
+        properties['count']['description'] = (
+            'The number of results, which is an estimate or a lower bound '
+            'if `count_is_exact` is false.'
+        )
+        schema['properties'] = {
+            'count_is_exact': {
+                'type': 'boolean',
+                'example': True,
+            },
+            **properties
+        }
+    return schema
+
+
+def _select_fields(queryset, field_names):
+    """
+    Given a queryset that may restrict its columns using `values()`, `only()`
+    or `defer()`, return it with the given fields also selected, so that
+    reading them from the results doesn't need a query per object.
+    """
+    if not isinstance(queryset, QuerySet):
+        return queryset
+
+    fields = queryset._fields
+    if fields:
+        missing = [name for name in field_names if name not in fields]
+        if missing:
+            queryset = queryset.values(*fields, *missing)
+        return queryset
+
+    deferred_names, defer = queryset.query.deferred_loading
+    if not defer:
+        missing = [name for name in field_names if name not in deferred_names]
+        if missing:
+            queryset = queryset.only(*deferred_names, *missing)
+    elif deferred_names.intersection(field_names):
+        queryset = queryset.defer(None).defer(*deferred_names.difference(field_names))
+    return queryset
+
+
+def _get_keyset_field(model, order):
+    """
+    Given a model and an ordering such as `'-author__name'`, return a
+    `KeysetField` describing the column that keyset cursors compare.
+    """
+    descending = order.startswith('-')
+    name = order.lstrip('-')
+    parts = name.split(LOOKUP_SEP)
+    nullable = False
+    opts = model._meta
+    for index, part in enumerate(parts):
+        try:
+            field = opts.pk if part == 'pk' else opts.get_field(part)
+        except FieldDoesNotExist:
+            # Annotations are compared by name, and may be null.
+            return KeysetField(name, descending, True, False)
+
+        is_last = index == len(parts) - 1
+        if field.is_relation:
+            assert field.concrete and not field.many_to_many, (
+                'Keyset cursor pagination only supports orderings that follow '
+                'forward foreign keys and one-to-one relationships, but got '
+                '"{order}".'.format(order=order)
+            )
+            nullable = nullable or field.null
+            if is_last:
+                # Compare the foreign key column, rather than ordering by
+                # the related model's default ordering.
+                parts[index] = field.attname
+                break
+            opts = field.related_model._meta
+        elif not is_last:
+            return KeysetField(name, descending, True, False)
+        else:
+            nullable = nullable or field.null
+    unique = (
+        len(parts) == 1 and not nullable and
+        (field.primary_key or field.unique)
+    )
+    return KeysetField(LOOKUP_SEP.join(parts), descending, nullable, unique)
+
+
+# Whether each field that cursors are ordered by is unique, per model class.
+_unique_fields = weakref.WeakKeyDictionary()
+
+
+def _is_unique_field(model, order):
+    """
+    Return `True` if ordering by `order` gives every row of the model a
+    unique position. The result is cached for each model and field.
+    """
+    name = order.lstrip('-')
+    try:
+        fields = _unique_fields[model]
+    except KeyError:
+        fields = _unique_fields[model] = {}
+    if name not in fields:
+        fields[name] = _get_keyset_field(model, name).unique
+    return fields[name]
+
+
+def _get_keyset_order_by(keyset_fields, reverse):
+    """
+    Return the `order_by()` arguments for the keyset fields. Null values
+    always sort as if they were greater than any other value, so that
+    the ordering is the same on every database.
+    """
+    order_by = []
+    for keyset_field in keyset_fields:
+        descending = keyset_field.descending != reverse
+        if not keyset_field.nullable:
+            order_by.append('-' + keyset_field.name if descending else keyset_field.name)
+        elif descending:
+            order_by.append(F(keyset_field.name).desc(nulls_first=True))
+        else:
+            order_by.append(F(keyset_field.name).asc(nulls_last=True))
+    return order_by
+
+
+def _get_keyset_filter(keyset_fields, position, reverse):
+    """
+    Return a `Q` object that matches the rows following `position`, a tuple
+    with a value for each of the keyset fields, in the keyset ordering.
+
+    The rows are matched lexicographically: a row follows the position if
+    it has the same values for the first N fields, and a following value
+    for the next field. The first field is also compared by itself, so that
+    the database can seek to the position using an index.
+    """
+    conditions = []
+    equal = Q()
+    for keyset_field, value in zip(keyset_fields, position):
+        name = keyset_field.name
+        descending = keyset_field.descending != reverse
+        if value is None:
+            # Nulls sort as the greatest value.
+            following = Q(**{name + '__isnull': False}) if descending else None
+            same = Q(**{name + '__isnull': True})
+        else:
+            following = Q(**{name + ('__lt' if descending else '__gt'): value})
+            if keyset_field.nullable and not descending:
+                following |= Q(**{name + '__isnull': True})
+            same = Q(**{name: value})
+        if following is not None:
+            conditions.append(equal & following)
+        equal &= same
+
+    if not conditions:
+        # Nothing follows a position where every value is the greatest.
+        return Q(pk__in=[])
+    condition = functools.reduce(operator.or_, conditions)
+
+    first_field, first_value = keyset_fields[0], position[0]
+    if not first_field.nullable:
+        descending = first_field.descending != reverse
+        condition = Q(**{first_field.name + ('__lte' if descending else '__gte'): first_value}) & condition
+    return condition
+
+
+def _get_keyset_value(instance, name):
+    if isinstance(instance, dict):
+        return instance[name]
+    for attr in name.split(LOOKUP_SEP):
+        if instance is None:
+            return None
+        instance = getattr(instance, attr)
+    return instance
+
+
 Cursor = namedtuple('Cursor', ['offset', 'reverse', 'position'])
+KeysetField = namedtuple('KeysetField', ['name', 'descending', 'nullable', 'unique'])
 PageLink = namedtuple('PageLink', ['url', 'number', 'is_active', 'is_break'])
 
 PAGE_BREAK = PageLink(url=None, number=None, is_active=False, is_break=True)
 
 
+def _count_objects(queryset):
+    """
+    Determine an object count, supporting either querysets or regular lists.
+    """
+    try:
+        return queryset.count()
+    except (AttributeError, TypeError):
+        return len(queryset)
+
+
+def _is_unfiltered(queryset):
+    """
+    Returns `True` if the queryset includes every row of its model's table
+    exactly once, so that its count is the number of rows in the table.
+    """
+    query = queryset.query
+    return not (
+        query.where or query.distinct or query.group_by or
+        query.combinator or query.is_sliced or query.is_empty()
+    )
+
+
+class BaseCounter:
+    """
+    Counters determine the count of the objects being paginated, when used as
+    the `counter_class` of `PageNumberPagination` or `LimitOffsetPagination`.
+    """
+    # Set to `True` if counts may be estimates or lower bounds, in which case
+    # paginated responses include a `count_is_exact` flag.
+    approximate = False
+
+    def get_count(self, queryset, minimum=None):
+        """
+        Return a tuple of `(count, is_exact)` for the queryset.
+
+        A count that isn't exact should be at least `minimum`, unless there
+        are fewer objects, so that the requested page and the link to the
+        following page can still be determined.
+        """
+        raise NotImplementedError('.get_count() must be overridden.')
+
+
+class CachedCounter(BaseCounter):
+    """
+    Counts the objects exactly, and caches the count of each distinct query
+    for `timeout` seconds, so that counts may be out of date by that long.
+    """
+    cache = default_cache
+    cache_format = 'pagination_count_%(signature)s'
+    timeout = 60
+
+    def get_cache_key(self, queryset):
+        """
+        Returns a key that identifies the query being counted, or `None` if
+        the count shouldn't be cached.
+        """
+        if not isinstance(queryset, QuerySet):
+            return None
+        try:
+            # The ordering doesn't affect the count.
+            sql, params = queryset.order_by().query.sql_with_params()
+        except (EmptyResultSet, TypeError):
+            return None
+        signature = '%s\n%s\n%r' % (queryset.db, sql, params)
+        return self.cache_format % {
+            'signature': hashlib.sha256(signature.encode()).hexdigest()
+        }
+
+    def get_count(self, queryset, minimum=None):
+        key = self.get_cache_key(queryset)
+        if key is None:
+            return (_count_objects(queryset), True)
+
+        count = self.cache.get(key)
+        if count is None:
+            count = _count_objects(queryset)
+            self.cache.set(key, count, self.timeout)
+        return (count, True)
+
+
+class EstimatedCounter(BaseCounter):
+    """
+    Uses the number of rows that the database keeps in its table statistics
+    for querysets of every object of a model, on PostgreSQL, MySQL and SQLite.
+
+    Filtered querysets, other databases, and tables that are estimated to
+    have fewer than `threshold` rows are counted exactly.
+    """
+    approximate = True
+    threshold = 10000
+
+    def get_estimate(self, queryset):
+        """
+        Returns the estimated number of objects in the queryset, or `None`.
+        """
+        if not isinstance(queryset, QuerySet) or not _is_unfiltered(queryset):
+            return None
+
+        connection = connections[queryset.db]
+        table = queryset.model._meta.db_table
+        if connection.vendor == 'postgresql':
+            sql = 'SELECT reltuples FROM pg_class WHERE oid = to_regclass(%s)'
+            params = [connection.ops.quote_name(table)]
+        elif connection.vendor == 'mysql':
+            sql = (
+                'SELECT table_rows FROM information_schema.tables '
+                'WHERE table_schema = DATABASE() AND table_name = %s'
+            )
+            params = [table]
+        elif connection.vendor == 'sqlite':
+            # Only available once `ANALYZE` has been run.
+            sql = 'SELECT stat FROM sqlite_stat1 WHERE tbl = %s'
+            params = [table]
+        else:
+            return None
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(sql, params)
+                row = cursor.fetchone()
+        except DatabaseError:
+            return None
+        if row is None or row[0] is None:
+            return None
+        try:
+            estimate = int(str(row[0]).split()[0].split('.')[0])
+        except (IndexError, ValueError):
+            return None
+        # PostgreSQL reports -1 for tables that haven't been analyzed.
+        return estimate if estimate >= 0 else None
+
+    def get_count(self, queryset, minimum=None):
+        estimate = self.get_estimate(queryset)
+        if estimate is None or estimate < max(self.threshold, minimum or 0):
+            return (_count_objects(queryset), True)
+        return (estimate, False)
+
+
+class CappedCounter(BaseCounter):
+    """
+    Counts the objects, but stops counting once there are more than `cap` of
+    them, in which case the count is a lower bound, typically displayed as
+    "10000+".
+
+    The cap is raised for pages beyond it, so that the following pages can
+    still be requested.
+    """
+    approximate = True
+    cap = 10000
+
+    def get_count(self, queryset, minimum=None):
+        cap = max(self.cap, minimum or 0)
+        if not isinstance(queryset, QuerySet) or queryset.query.is_sliced:
+            count = _count_objects(queryset)
+        else:
+            if not queryset.query.distinct_fields:
+                queryset = queryset.order_by()
+            count = queryset[:cap + 1].count()
+        if count > cap:
+            return (cap, False)
+        return (count, True)
+
+
 class BasePagination:
     display_page_controls = False
 
@@ -190,6 +546,10 @@ class PageNumberPagination(BasePagination):
 
     last_page_strings = ('last',)
 
+    # Set to a `BaseCounter` subclass to control how the objects are counted.
+    # Defaults to `None`, meaning the Django paginator counts them.
+    counter_class = None
+
     template = 'rest_framework/pagination/numbers.html'
 
     invalid_page_message = _('Invalid page.')
@@ -205,6 +565,9 @@ class PageNumberPagination(BasePagination):
             return None
 
         paginator = self.django_paginator_class(queryset, page_size)
+        self.count_is_exact = True
+        if self.counter_class is not None:
+            paginator.count = self.get_count(queryset)
         page_number = self.get_page_number(request, paginator)
 
         try:
@@ -227,16 +590,33 @@ class PageNumberPagination(BasePagination):
             page_number = paginator.num_pages
         return page_number
 
+    def get_count(self, queryset):
+        """
+        Determine an object count using the `counter_class`. The count only
+        needs to be exact for the objects up to the start of the next page.
+        """
+        page_size = self.get_page_size(self.request)
+        try:
+            page_number = _positive_int(self.request.query_params[self.page_query_param], strict=True)
+        except (KeyError, ValueError):
+            page_number = 1
+        minimum = page_number * page_size + 1
+        count, self.count_is_exact = self.counter_class().get_count(queryset, minimum)
+        return count
+
     def get_paginated_response(self, data):
-        return Response({
+        response = {
             'count': self.page.paginator.count,
             'next': self.get_next_link(),
             'previous': self.get_previous_link(),
             'results': data,
-        })
+        }
+        if _counts_are_approximate(self):
+            response = {'count_is_exact': self.count_is_exact, **response}
+        return Response(response)
 
     def get_paginated_response_schema(self, schema):
-        return {
+        return _add_count_schema(self, {
             'type': 'object',
             'required': ['count', 'results'],
             'properties': {
@@ -260,7 +640,7 @@ class PageNumberPagination(BasePagination):
                 },
                 'results': schema,
             },
-        }
+        })
 
     def get_page_size(self, request):
         if self.page_size_query_param:
@@ -383,6 +763,8 @@ class LimitOffsetPagination(BasePagination):
     offset_query_param = 'offset'
     offset_query_description = _('The initial index from which to return the results.')
     max_limit = None
+    # Set to a `BaseCounter` subclass to control how the objects are counted.
+    counter_class = None
     template = 'rest_framework/pagination/numbers.html'
 
     def paginate_queryset(self, queryset, request, view=None):
@@ -391,8 +773,9 @@ class LimitOffsetPagination(BasePagination):
         if self.limit is None:
             return None
 
-        self.count = self.get_count(queryset)
         self.offset = self.get_offset(request)
+        self.count_is_exact = True
+        self.count = self.get_count(queryset)
         if self.count > self.limit and self.template is not None:
             self.display_page_controls = True
 
@@ -401,15 +784,18 @@ class LimitOffsetPagination(BasePagination):
         return list(queryset[self.offset:self.offset + self.limit])
 
     def get_paginated_response(self, data):
-        return Response({
+        response = {
             'count': self.count,
             'next': self.get_next_link(),
             'previous': self.get_previous_link(),
             'results': data
-        })
+        }
+        if _counts_are_approximate(self):
+            response = {'count_is_exact': self.count_is_exact, **response}
+        return Response(response)
 
     def get_paginated_response_schema(self, schema):
-        return {
+        return _add_count_schema(self, {
             'type': 'object',
             'required': ['count', 'results'],
             'properties': {
@@ -433,7 +819,7 @@ class LimitOffsetPagination(BasePagination):
                 },
                 'results': schema,
             },
-        }
+        })
 
     def get_limit(self, request):
         if self.limit_query_param:
@@ -524,11 +910,15 @@ class LimitOffsetPagination(BasePagination):
     def get_count(self, queryset):
         """
         Determine an object count, supporting either querysets or regular lists.
+
+        If a `counter_class` is set, the count only needs to be exact for the
+        objects up to the start of the next page.
         """
-        try:
-            return queryset.count()
-        except (AttributeError, TypeError):
-            return len(queryset)
+        if self.counter_class is None:
+            return _count_objects(queryset)
+        minimum = self.offset + self.limit + 1
+        count, self.count_is_exact = self.counter_class().get_count(queryset, minimum)
+        return count
 
     def get_schema_fields(self, view):
         assert coreapi is not None, 'coreapi must be installed to use `get_schema_fields()`'
@@ -608,6 +998,19 @@ class CursorPagination(BasePagination):
     # queries, by having a hard cap on the maximum possible size of the offset.
     offset_cutoff = 1000
 
+    # Set to `True` to encode the values of every ordering field in cursors,
+    # rather than a position and an offset. The primary key is added to the
+    # ordering if needed, so that every position is unique.
+    keyset = False
+
+    # Set to `True` if the first ordering field is unique, such as "pk". Cursors
+    # then never include an offset, each page fetches exactly `page_size + 1`
+    # rows, and whether there is a previous page is checked with an `EXISTS`
+    # query.
+    unique_ordering = False
+    unique_positions = False
+    _unique_ordering_checked = False
+
     def paginate_queryset(self, queryset, request, view=None):
         self.request = request
         self.page_size = self.get_page_size(request)
@@ -615,8 +1018,23 @@ class CursorPagination(BasePagination):
             return None
 
         self.base_url = request.build_absolute_uri()
+        if self.unique_ordering and not self.keyset and not self._unique_ordering_checked:
+            # Only the declared ordering is checked, before it is replaced
+            # by the ordering for the first request.
+            self.check_unique_ordering(queryset.model)
+            self._unique_ordering_checked = True
         self.ordering = self.get_ordering(request, queryset, view)
 
+        if self.keyset:
+            return self.paginate_keyset_queryset(queryset)
+
+        # An ordering chosen by the client, such as with `OrderingFilter`,
+        # may not start with a unique field. Those requests use offsets.
+        self.unique_positions = (
+            self.unique_ordering and
+            _is_unique_field(queryset.model, self.ordering[0])
+        )
+
         self.cursor = self.decode_cursor(request)
         if self.cursor is None:
             (offset, reverse, current_position) = (0, False, None)
@@ -629,7 +1047,12 @@ class CursorPagination(BasePagination):
         else:
             queryset = queryset.order_by(*self.ordering)
 
+        # Positions are read from the results, so querysets that restrict
+        # their columns need to include the ordering fields.
+        queryset = _select_fields(queryset, [order.lstrip('-') for order in self.ordering])
+
         # If we have a cursor with a fixed position then filter by that.
+        has_preceding_position = False
         if current_position is not None:
             order = self.ordering[0]
             is_reversed = order.startswith('-')
@@ -638,8 +1061,16 @@ class CursorPagination(BasePagination):
             # Test for: (cursor reversed) XOR (queryset reversed)
             if self.cursor.reverse != is_reversed:
                 kwargs = {order_attr + '__lt': current_position}
+                preceding_kwargs = {order_attr + '__gte': current_position}
             else:
                 kwargs = {order_attr + '__gt': current_position}
+                preceding_kwargs = {order_attr + '__lte': current_position}
+
+            if self.unique_positions:
+                has_preceding_position = queryset.filter(**preceding_kwargs).exists()
+            else:
+                # Assume that the rows up to the position still exist.
+                has_preceding_position = True
 
             queryset = queryset.filter(**kwargs)
 
@@ -663,7 +1094,7 @@ class CursorPagination(BasePagination):
             self.page = list(reversed(self.page))
 
             # Determine next and previous positions for reverse cursors.
-            self.has_next = (current_position is not None) or (offset > 0)
+            self.has_next = has_preceding_position or (offset > 0)
             self.has_previous = has_following_position
             if self.has_next:
                 self.next_position = current_position
@@ -672,12 +1103,21 @@ class CursorPagination(BasePagination):
         else:
             # Determine next and previous positions for forward cursors.
             self.has_next = has_following_position
-            self.has_previous = (current_position is not None) or (offset > 0)
+            self.has_previous = has_preceding_position or (offset > 0)
             if self.has_next:
                 self.next_position = following_position
             if self.has_previous:
                 self.previous_position = current_position
 
+        if self.unique_positions:
+            # Every position is unique, so links continue from the items at
+            # either end of the page, or from the current position.
+            if self.page:
+                self.previous_position = self._get_position_from_instance(self.page[0], self.ordering)
+                self.next_position = self._get_position_from_instance(self.page[-1], self.ordering)
+            else:
+                self.previous_position = self.next_position = current_position
+
         # Display page controls in the browsable API if there is more
         # than one page.
         if (self.has_previous or self.has_next) and self.template is not None:
@@ -685,6 +1125,102 @@ class CursorPagination(BasePagination):
 
         return self.page
 
+    def check_unique_ordering(self, model):
+        """
+        Check that the `ordering` declared on the pagination class starts with
+        a unique field, as required by `unique_ordering = True`. Whether the
+        field is unique is only looked up once for each model.
+        """
+        ordering = self.ordering
+        if isinstance(ordering, (list, tuple)):
+            ordering = ordering[0] if ordering else None
+        if ordering is None:
+            return
+        assert _is_unique_field(model, ordering), (
+            'Using cursor pagination with `unique_ordering = True`, but '
+            'the first ordering field "{order}" is not a unique, '
+            'non-nullable field on the model.'.format(order=ordering)
+        )
+
+    def get_keyset_fields(self, queryset):
+        """
+        Return a list of `KeysetField` instances for the ordering, including
+        the primary key if no other field in the ordering is unique.
+        """
+        keyset_fields = [_get_keyset_field(queryset.model, order) for order in self.ordering]
+        if not any(keyset_field.unique for keyset_field in keyset_fields):
+            descending = keyset_fields[-1].descending if keyset_fields else False
+            keyset_fields.append(_get_keyset_field(queryset.model, '-pk' if descending else 'pk'))
+        return keyset_fields
+
+    def paginate_keyset_queryset(self, queryset):
+        """
+        Paginate the queryset by filtering it to the rows following the
+        position in the cursor, which holds a value for every keyset field.
+        """
+        self.keyset_fields = self.get_keyset_fields(queryset)
+        self.cursor = self.decode_cursor(self.request)
+        if self.cursor is None:
+            (reverse, current_position) = (False, None)
+        else:
+            (reverse, current_position) = (self.cursor.reverse, self.cursor.position)
+
+        queryset = queryset.order_by(*_get_keyset_order_by(self.keyset_fields, reverse))
+
+        # Positions are read from the results, so querysets that restrict
+        # their columns need to include the keyset fields, and related
+        # objects need to be loaded along with the model instances.
+        queryset = _select_fields(
+            queryset, [keyset_field.name for keyset_field in self.keyset_fields]
+        )
+        if queryset._iterable_class is ModelIterable:
+            related = [
+                keyset_field.name.rsplit(LOOKUP_SEP, 1)[0]
+                for keyset_field in self.keyset_fields
+                if LOOKUP_SEP in keyset_field.name
+            ]
+            if related:
+                queryset = queryset.select_related(*related)
+
+        if current_position is not None:
+            queryset = queryset.filter(
+                _get_keyset_filter(self.keyset_fields, current_position, reverse)
+            )
+
+        # We always fetch an extra item in order to determine if there is a
+        # page following on from this one.
+        results = list(queryset[:self.page_size + 1])
+        self.page = list(results[:self.page_size])
+        has_following_position = len(results) > len(self.page)
+
+        if reverse:
+            # The query ordering was in reverse, so we need to reverse the
+            # items again before returning them to the user.
+            self.page = list(reversed(self.page))
+            self.has_next = current_position is not None
+            self.has_previous = has_following_position
+        else:
+            self.has_next = has_following_position
+            self.has_previous = current_position is not None
+
+        # Links from an empty page continue from the current position.
+        if self.page:
+            self.previous_position = self._get_keyset_position(self.page[0])
+            self.next_position = self._get_keyset_position(self.page[-1])
+        else:
+            self.previous_position = self.next_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
+
+    def _get_keyset_position(self, instance):
+        return tuple(
+            _get_keyset_value(instance, keyset_field.name)
+            for keyset_field in self.keyset_fields
+        )
+
     def get_page_size(self, request):
         if self.page_size_query_param:
             with contextlib.suppress(KeyError, ValueError):
@@ -699,6 +1235,10 @@ class CursorPagination(BasePagination):
         if not self.has_next:
             return None
 
+        if self.keyset or self.unique_positions:
+            cursor = Cursor(offset=0, reverse=False, position=self.next_position)
+            return self.encode_cursor(cursor)
+
         if self.page and self.cursor and self.cursor.reverse and self.cursor.offset != 0:
             # If we're reversing direction and we have an offset cursor
             # then we cannot use the first position we find as a marker.
@@ -752,6 +1292,10 @@ class CursorPagination(BasePagination):
         if not self.has_previous:
             return None
 
+        if self.keyset or self.unique_positions:
+            cursor = Cursor(offset=0, reverse=True, position=self.previous_position)
+            return self.encode_cursor(cursor)
+
         if self.page and self.cursor and not self.cursor.reverse and self.cursor.offset != 0:
             # If we're reversing direction and we have an offset cursor
             # then we cannot use the first position we find as a marker.
@@ -827,10 +1371,11 @@ class CursorPagination(BasePagination):
             'Using cursor pagination, but no ordering attribute was declared '
             'on the pagination class.'
         )
-        assert '__' not in ordering, (
+        assert self.keyset or '__' not in ordering, (
             'Cursor pagination does not support double underscore lookups '
-            'for orderings. Orderings should be an unchanging, unique or '
-            'nearly-unique field on the model, such as "-created" or "pk".'
+            'for orderings, unless `keyset = True` is set. Orderings should '
+            'be an unchanging, unique or nearly-unique field on the model, '
+            'such as "-created" or "pk".'
         )
 
         assert isinstance(ordering, (str, list, tuple)), (
@@ -858,11 +1403,15 @@ class CursorPagination(BasePagination):
 
             offset = tokens.get('o', ['0'])[0]
             offset = _positive_int(offset, cutoff=self.offset_cutoff)
+            if offset and (self.keyset or self.unique_positions):
+                raise ValueError('Offsets are not used with unique positions.')
 
             reverse = tokens.get('r', ['0'])[0]
             reverse = bool(int(reverse))
 
             position = tokens.get('p', [None])[0]
+            if self.keyset:
+                position = self.decode_keyset_position(position)
         except (TypeError, ValueError):
             raise NotFound(self.invalid_cursor_message)
 
@@ -878,12 +1427,32 @@ class CursorPagination(BasePagination):
         if cursor.reverse:
             tokens['r'] = '1'
         if cursor.position is not None:
-            tokens['p'] = cursor.position
+            if self.keyset:
+                tokens['p'] = self.encode_keyset_position(cursor.position)
+            else:
+                tokens['p'] = cursor.position
 
         querystring = parse.urlencode(tokens, doseq=True)
         encoded = b64encode(querystring.encode('ascii')).decode('ascii')
         return replace_query_param(self.base_url, self.cursor_query_param, encoded)
 
+    def encode_keyset_position(self, position):
+        """
+        Encode a keyset position as a JSON list of strings and nulls.
+        """
+        values = [None if value is None else str(value) for value in position]
+        return json.dumps(values, separators=(',', ':'))
+
+    def decode_keyset_position(self, encoded):
+        if encoded is None:
+            return None
+        values = json.loads(encoded)
+        if not isinstance(values, list) or len(values) != len(self.keyset_fields):
+            raise ValueError('Invalid keyset position.')
+        if not all(value is None or isinstance(value, str) for value in values):
+            raise ValueError('Invalid keyset position.')
+        return tuple(values)
+
     def _get_position_from_instance(self, instance, ordering):
         field_name = ordering[0].lstrip('-')
         if isinstance(instance, dict):
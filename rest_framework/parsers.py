@@ -5,8 +5,9 @@ They give us a generic way of being able to handle various media types
 on the request, such as form content or json encoded data.
 """
 
-import codecs
 import contextlib
+import re
+from itertools import islice
 
 from django.conf import settings
 from django.core.files.uploadhandler import StopFutureHandlers
@@ -20,7 +21,7 @@ from django.utils.http import parse_header_parameters
 from rest_framework import renderers
 from rest_framework.exceptions import ParseError
 from rest_framework.settings import api_settings
-from rest_framework.utils import json
+from rest_framework.utils import json, msgpack
 
 
 class DataAndFiles:
@@ -52,6 +53,7 @@ class JSONParser(BaseParser):
     media_type = 'application/json'
     renderer_class = renderers.JSONRenderer
     strict = api_settings.STRICT_JSON
+    json_backend = api_settings.JSON_BACKEND
 
     def parse(self, stream, media_type=None, parser_context=None):
         """
@@ -61,13 +63,327 @@ class JSONParser(BaseParser):
         encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
 
         try:
-            decoded_stream = codecs.getreader(encoding)(stream)
             parse_constant = json.strict_constant if self.strict else None
-            return json.load(decoded_stream, parse_constant=parse_constant)
+            return self.json_backend().loads(
+                stream.read(), encoding=encoding, parse_constant=parse_constant
+            )
         except ValueError as exc:
             raise ParseError('JSON parse error - %s' % str(exc))
 
 
+# A complete string, and the text between strings in arrays and objects.
+_JSON_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+_JSON_TEXT = rb'[^\[\]{}"]*'
+# An array or object, that contains arrays or objects nested at most once.
+_JSON_FLAT = rb'[\[{]%s(?:%s%s)*[\]}]' % (_JSON_TEXT, _JSON_STRING, _JSON_TEXT)
+_JSON_NESTED = rb'[\[{]%s(?:(?:%s|%s)%s)*[\]}]' % (_JSON_TEXT, _JSON_STRING, _JSON_FLAT, _JSON_TEXT)
+# A whole item, followed by the comma or bracket after it.
+_JSON_ITEM = rb'(?:%s|%s|[^\[\]{}",\s]*)[ \t\n\r]*([,\]])' % (_JSON_STRING, _JSON_NESTED)
+# A string, array or object as above, or otherwise a single bracket, brace,
+# comma or quote. A single quote starts a string that continues past the
+# end of the buffer.
+_JSON_TOKEN = rb'%s|%s|[\[\]{},"]' % (_JSON_STRING, _JSON_NESTED)
+
+
+class BaseItemStream:
+    """
+    Base class for the iterators that parsers return for request content
+    that is decoded one item at a time, as it is consumed.
+    """
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        raise NotImplementedError('.__next__() must be overridden.')
+
+    def chunks(self, size):
+        """
+        Yield lists of up to `size` items, for example to validate and save
+        with a `ListSerializer`.
+        """
+        while True:
+            chunk = list(islice(self, size))
+            if not chunk:
+                return
+            yield chunk
+
+
+class JSONArrayStream(BaseItemStream):
+    """
+    Iterates over the items of a JSON array read from a stream, decoding
+    each item as it is reached, so that only one item is held in memory.
+
+    Items are found by matching the bytes of the stream against patterns
+    for strings, arrays and objects, so the encoding must be ASCII
+    compatible, such as UTF-8. Items longer than `max_item_size` bytes are
+    rejected.
+    """
+    chunk_size = 64 * 1024
+    item_re = re.compile(_JSON_ITEM, re.DOTALL)
+    token_re = re.compile(_JSON_TOKEN, re.DOTALL)
+    non_whitespace_re = re.compile(rb'[^ \t\n\r]')
+
+    def __init__(self, stream, loads, max_item_size=None):
+        self.stream = stream
+        self.loads = loads
+        self.max_item_size = max_item_size
+        self.buffer = b''
+        self.start = 0
+        self.index = 0
+        self.finished = False
+
+        if self.skip_whitespace() != b'[':
+            raise ParseError('JSON parse error - Expected a JSON array.')
+        self.start += 1
+
+    def __next__(self):
+        if self.finished:
+            raise StopIteration
+        item, delimiter = self.read_item()
+        if delimiter == b']':
+            self.finished = True
+            if self.skip_whitespace():
+                raise ParseError('JSON parse error - Extra data after the array.')
+            if self.index == 0 and not item.strip():
+                raise StopIteration
+
+        try:
+            value = self.loads(item)
+        except ValueError as exc:
+            raise ParseError('JSON parse error in item %d - %s' % (self.index, exc))
+        self.index += 1
+        return value
+
+    def fill(self):
+        """
+        Discard the consumed bytes, and read the next chunk into the buffer.
+        Returns the number of bytes discarded, or `None` at the end of the
+        stream.
+        """
+        data = self.stream.read(self.chunk_size)
+        if not data:
+            return None
+        discarded = self.start
+        self.buffer = self.buffer[discarded:] + data
+        self.start = 0
+        return discarded
+
+    def skip_whitespace(self):
+        """
+        Advance to the next non-whitespace byte, and return it, or `b''` at
+        the end of the stream.
+        """
+        while True:
+            match = self.non_whitespace_re.search(self.buffer, self.start)
+            if match is not None:
+                self.start = match.start()
+                return match.group()
+            self.start = len(self.buffer)
+            if self.fill() is None:
+                return b''
+
+    def read_item(self):
+        """
+        Return a tuple of `(item, delimiter)`, with the bytes of the next
+        item, and the comma or bracket that follows it.
+        """
+        self.skip_whitespace()
+        match = self.item_re.match(self.buffer, self.start)
+        if match is not None:
+            item = self.buffer[self.start:match.start(1)]
+            self.check_size(len(item))
+            self.start = match.end()
+            return (item, match.group(1))
+
+        # Otherwise the item is nested more deeply, or continues past the
+        # end of the buffer, so scan it one token at a time.
+        pos = self.start
+        depth = 0
+        while True:
+            match = self.token_re.search(self.buffer, pos)
+            token = match and match.group()
+            if token is None or token == b'"':
+                # Read more, and search again from the start of any string.
+                pos = match.start() if match else len(self.buffer)
+            else:
+                pos = match.end()
+                if len(token) > 1:
+                    pass
+                elif token in b'[{':
+                    depth += 1
+                elif depth:
+                    if token != b',':
+                        depth -= 1
+                elif token == b'}':
+                    raise ParseError('JSON parse error in item %d - Unexpected "}".' % self.index)
+                else:
+                    item = self.buffer[self.start:pos - 1]
+                    self.check_size(len(item))
+                    self.start = pos
+                    return (item, token)
+                continue
+
+            self.check_size(pos - self.start)
+            discarded = self.fill()
+            if discarded is None:
+                raise ParseError('JSON parse error - Unexpected end of data.')
+            pos -= discarded
+
+    def check_size(self, size):
+        if self.max_item_size is not None and size > self.max_item_size:
+            raise ParseError(
+                'JSON parse error in item %d - Item exceeds the maximum size of %d bytes.'
+                % (self.index, self.max_item_size)
+            )
+
+
+class StreamingJSONParser(JSONParser):
+    """
+    Parses a JSON array incrementally, returning a `JSONArrayStream` that
+    decodes the items as they are iterated over.
+
+    Items are limited to `max_item_size` bytes, which defaults to the
+    `DATA_UPLOAD_MAX_MEMORY_SIZE` setting.
+    """
+    max_item_size = None
+
+    def get_max_item_size(self):
+        if self.max_item_size is not None:
+            return self.max_item_size
+        return settings.DATA_UPLOAD_MAX_MEMORY_SIZE
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Returns an iterator over the items of the JSON array in the stream.
+        """
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        parse_constant = json.strict_constant if self.strict else None
+        backend = self.json_backend()
+
+        def loads(data):
+            return backend.loads(data, encoding=encoding, parse_constant=parse_constant)
+
+        return JSONArrayStream(stream, loads, self.get_max_item_size())
+
+
+class NDJSONStream(BaseItemStream):
+    """
+    Iterates over the records of newline delimited JSON read from a stream,
+    decoding each line as it is reached. Every line must contain a record,
+    so record `n` is on line `n + 1`. Lines longer than `max_line_size`
+    bytes are rejected.
+    """
+
+    def __init__(self, stream, loads, max_line_size=None):
+        self.stream = stream
+        self.loads = loads
+        self.max_line_size = max_line_size
+        self.line_number = 0
+
+    def __next__(self):
+        if self.max_line_size is None:
+            line = self.stream.readline()
+        else:
+            line = self.stream.readline(self.max_line_size + 1)
+        if not line:
+            raise StopIteration
+        self.line_number += 1
+
+        if self.max_line_size is not None and len(line.rstrip(b'\r\n')) > self.max_line_size:
+            raise ParseError(
+                'NDJSON parse error on line %d - Line exceeds the maximum size of %d bytes.'
+                % (self.line_number, self.max_line_size)
+            )
+        try:
+            return self.loads(line)
+        except json.JSONDecodeError as exc:
+            raise ParseError('NDJSON parse error on line %d, column %d - %s' % (
+                self.line_number, exc.colno, exc.msg
+            ))
+        except ValueError as exc:
+            raise ParseError('NDJSON parse error on line %d - %s' % (self.line_number, exc))
+
+
+class NDJSONParser(JSONParser):
+    """
+    Parses newline delimited JSON, returning an `NDJSONStream` that decodes
+    the records as they are iterated over.
+
+    Lines are limited to `max_line_size` bytes, which defaults to the
+    `DATA_UPLOAD_MAX_MEMORY_SIZE` setting.
+    """
+    media_type = 'application/x-ndjson'
+    renderer_class = renderers.NDJSONRenderer
+    max_line_size = None
+
+    def get_max_line_size(self):
+        if self.max_line_size is not None:
+            return self.max_line_size
+        return settings.DATA_UPLOAD_MAX_MEMORY_SIZE
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Returns an iterator over the records in the stream.
+        """
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        parse_constant = json.strict_constant if self.strict else None
+        backend = self.json_backend()
+
+        def loads(data):
+            return backend.loads(data, encoding=encoding, parse_constant=parse_constant)
+
+        return NDJSONStream(stream, loads, self.get_max_line_size())
+
+
+class MessagePackParser(BaseParser):
+    """
+    Parses MessagePack-serialized data.
+
+    If the media type includes `columnar=1`, the data must be a map of
+    `fields` and `columns`, as rendered by `MessagePackRenderer`, and is
+    converted to a list of objects.
+    """
+    media_type = 'application/msgpack'
+    renderer_class = renderers.MessagePackRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Parses the incoming bytestream as MessagePack and returns the
+        resulting data.
+        """
+        try:
+            data = msgpack.unpackb(stream.read())
+        except ValueError as exc:
+            raise ParseError('MessagePack parse error - %s' % str(exc))
+
+        if media_type:
+            base_media_type, params = parse_header_parameters(media_type)
+            if params.get('columnar', '').lower() in ('1', 'true'):
+                return self.get_rows(data)
+        return data
+
+    def get_rows(self, data):
+        """
+        Convert columnar data into a list of objects.
+        """
+        fields = data.get('fields') if isinstance(data, dict) else None
+        columns = data.get('columns') if isinstance(data, dict) else None
+        if not (
+            isinstance(fields, list) and isinstance(columns, list) and
+            len(fields) == len(columns) and
+            all(isinstance(column, list) for column in columns) and
+            len({len(column) for column in columns}) <= 1
+        ):
+            raise ParseError(
+                'MessagePack parse error - Columnar data must be a map of '
+                '"fields" and "columns" of the same length.'
+            )
+        return [dict(zip(fields, values)) for values in zip(*columns)]
+
+
 class FormParser(BaseParser):
     """
     Parser for form data.
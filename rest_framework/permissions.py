@@ -4,6 +4,7 @@ Provides a set of pluggable permission policies.
 from django.http import Http404
 
 from rest_framework import exceptions
+from rest_framework.utils.async_hooks import call_async
 
 SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
 
@@ -75,6 +76,18 @@ class AND:
             self.op2.has_object_permission(request, view, obj)
         )
 
+    async def ahas_permission(self, request, view):
+        return (
+            await call_async(self.op1, 'has_permission', request, view) and
+            await call_async(self.op2, 'has_permission', request, view)
+        )
+
+    async def ahas_object_permission(self, request, view, obj):
+        return (
+            await call_async(self.op1, 'has_object_permission', request, view, obj) and
+            await call_async(self.op2, 'has_object_permission', request, view, obj)
+        )
+
 
 class OR:
     def __init__(self, op1, op2):
@@ -96,6 +109,21 @@ class OR:
             and self.op2.has_object_permission(request, view, obj)
         )
 
+    async def ahas_permission(self, request, view):
+        return (
+            await call_async(self.op1, 'has_permission', request, view) or
+            await call_async(self.op2, 'has_permission', request, view)
+        )
+
+    async def ahas_object_permission(self, request, view, obj):
+        return (
+            await call_async(self.op1, 'has_permission', request, view)
+            and await call_async(self.op1, 'has_object_permission', request, view, obj)
+        ) or (
+            await call_async(self.op2, 'has_permission', request, view)
+            and await call_async(self.op2, 'has_object_permission', request, view, obj)
+        )
+
 
 class NOT:
     def __init__(self, op1):
@@ -107,6 +135,12 @@ class NOT:
     def has_object_permission(self, request, view, obj):
         return not self.op1.has_object_permission(request, view, obj)
 
+    async def ahas_permission(self, request, view):
+        return not await call_async(self.op1, 'has_permission', request, view)
+
+    async def ahas_object_permission(self, request, view, obj):
+        return not await call_async(self.op1, 'has_object_permission', request, view, obj)
+
 
 class BasePermissionMetaclass(OperationHolderMixin, type):
     pass
@@ -115,6 +149,10 @@ class BasePermissionMetaclass(OperationHolderMixin, type):
 class BasePermission(metaclass=BasePermissionMetaclass):
     """
     A base class from which all permission classes should inherit.
+
+    Permissions may also implement `.ahas_permission()` and
+    `.ahas_object_permission()`, which are awaited instead of running the
+    sync methods in a thread when the view is async.
     """
 
     def has_permission(self, request, view):
@@ -129,6 +167,12 @@ class BasePermission(metaclass=BasePermissionMetaclass):
         """
         return True
 
+    async def ahas_permission(self, request, view):
+        return True
+
+    async def ahas_object_permission(self, request, view, obj):
+        return True
+
 
 class AllowAny(BasePermission):
     """
@@ -141,6 +185,9 @@ class AllowAny(BasePermission):
     def has_permission(self, request, view):
         return True
 
+    async def ahas_permission(self, request, view):
+        return True
+
 
 class IsAuthenticated(BasePermission):
     """
@@ -150,6 +197,10 @@ class IsAuthenticated(BasePermission):
     def has_permission(self, request, view):
         return bool(request.user and request.user.is_authenticated)
 
+    async def ahas_permission(self, request, view):
+        user = await request.auser()
+        return bool(user and user.is_authenticated)
+
 
 class IsAdminUser(BasePermission):
     """
@@ -159,6 +210,10 @@ class IsAdminUser(BasePermission):
     def has_permission(self, request, view):
         return bool(request.user and request.user.is_staff)
 
+    async def ahas_permission(self, request, view):
+        user = await request.auser()
+        return bool(user and user.is_staff)
+
 
 class IsAuthenticatedOrReadOnly(BasePermission):
     """
@@ -172,6 +227,12 @@ class IsAuthenticatedOrReadOnly(BasePermission):
             request.user.is_authenticated
         )
 
+    async def ahas_permission(self, request, view):
+        if request.method in SAFE_METHODS:
+            return True
+        user = await request.auser()
+        return bool(user and user.is_authenticated)
+
 
 class DjangoModelPermissions(BasePermission):
     """
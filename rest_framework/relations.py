@@ -3,17 +3,22 @@ import sys
 from operator import attrgetter
 from urllib import parse
 
-from django.core.exceptions import ImproperlyConfigured, ObjectDoesNotExist
+from django.core.exceptions import (
+    FieldDoesNotExist, ImproperlyConfigured, ObjectDoesNotExist
+)
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import connections
 from django.db.models import Manager
 from django.db.models.query import QuerySet
 from django.urls import NoReverseMatch, Resolver404, get_script_prefix, resolve
 from django.utils.encoding import smart_str, uri_to_iri
 from django.utils.translation import gettext_lazy as _
 
+from rest_framework.exceptions import ValidationError
 from rest_framework.fields import (
     Field, SkipField, empty, get_attribute, is_simple_callable, iter_options
 )
-from rest_framework.reverse import reverse
+from rest_framework.reverse import reverse, reverse_lookup
 from rest_framework.settings import api_settings
 from rest_framework.utils import html
 
@@ -79,6 +84,51 @@ class PKOnlyObject:
         return "%s" % self.pk
 
 
+def get_batch_key(data):
+    """
+    Returns the key of the input `data` of a related field in the objects
+    fetched by `RelatedField.batch_lookups()`, or `None` if it's unhashable.
+
+    The type is included so that `1`, `1.0` and `True` are not conflated.
+    """
+    try:
+        hash(data)
+    except TypeError:
+        return None
+    return (type(data), data)
+
+
+def get_lookup_model_field(model, field_name):
+    """
+    Returns the model field that a `queryset.get(**{field_name: value})`
+    lookup compares against, or `None` if it isn't a concrete column.
+    """
+    if field_name == 'pk':
+        return model._meta.pk
+    try:
+        model_field = model._meta.get_field(field_name)
+    except FieldDoesNotExist:
+        return None
+    if not model_field.concrete or model_field.many_to_many:
+        return None
+    return model_field
+
+
+def uses_batched_lookups(field):
+    """
+    Returns `True` if `.to_internal_value()` of the field is implemented by
+    a class that also implements `.get_lookup()`, and so reads the objects
+    fetched by `.batch_lookups()`.
+    """
+    for klass in type(field).__mro__:
+        attrs = vars(klass)
+        if 'get_lookup' in attrs:
+            return True
+        if 'to_internal_value' in attrs:
+            return False
+    return False
+
+
 # We assume that 'validators' are intended for the child serializer,
 # rather than the parent serializer.
 MANY_RELATION_KWARGS = (
@@ -93,6 +143,9 @@ class RelatedField(Field):
     html_cutoff = None
     html_cutoff_text = None
 
+    # The objects fetched by `.batch_lookups()`, keyed by `get_batch_key()`.
+    _batched_objects = None
+
     def __init__(self, **kwargs):
         self.queryset = kwargs.pop('queryset', self.queryset)
 
@@ -169,6 +222,98 @@ class RelatedField(Field):
     def use_pk_only_optimization(self):
         return False
 
+    def get_lookup(self, data):
+        """
+        Returns the `(field_name, value)` lookup that `.to_internal_value()`
+        uses to fetch the object for `data`, or `None` if it can't be fetched
+        together with the objects of other items.
+        """
+        return None
+
+    def get_batched_objects(self, data_list):
+        """
+        Fetch the objects for the items of `data_list`, using one query per
+        lookup field, and return a dictionary keyed by `get_batch_key()`.
+
+        Items that can't be looked up, or that match no object or more than
+        one object, are left out, so that `.to_internal_value()` fetches them
+        individually and reports the same errors as usual.
+        """
+        lookups = {}
+        for data in data_list:
+            key = get_batch_key(data)
+            if key is not None and key not in lookups:
+                lookups[key] = self.get_lookup(data)
+
+        queryset = self.get_queryset()
+        if (
+            not isinstance(queryset, QuerySet) or
+            queryset.query.is_sliced or queryset.query.combinator
+        ):
+            return {}
+
+        grouped = {}
+        for key, lookup in lookups.items():
+            if lookup is not None:
+                field_name, value = lookup
+                grouped.setdefault(field_name, []).append((key, value))
+
+        objects = {}
+        for field_name, items in grouped.items():
+            model_field = get_lookup_model_field(queryset.model, field_name)
+            if model_field is None:
+                continue
+
+            # Compare values in the same way as the database lookup would.
+            keys_by_value = {}
+            for key, value in items:
+                try:
+                    value = model_field.to_python(value)
+                    keys_by_value.setdefault(value, []).append(key)
+                except (TypeError, ValueError, DjangoValidationError):
+                    continue
+
+            values = list(keys_by_value)
+            batch_size = connections[queryset.db].features.max_query_params or len(values)
+            found = {}
+            for start in range(0, len(values), batch_size):
+                lookup = {field_name + '__in': values[start:start + batch_size]}
+                for obj in queryset.filter(**lookup):
+                    value = getattr(obj, model_field.attname)
+                    # `None` marks values that match multiple objects.
+                    found[value] = obj if value not in found else None
+
+            for value, keys in keys_by_value.items():
+                obj = found.get(value)
+                if obj is not None:
+                    for key in keys:
+                        objects[key] = obj
+        return objects
+
+    @contextlib.contextmanager
+    def batch_lookups(self, data_list):
+        """
+        Within this context, `.to_internal_value()` returns the objects
+        fetched by `.get_batched_objects()` for the items of `data_list`.
+        """
+        if self._batched_objects is not None or not uses_batched_lookups(self):
+            yield
+            return
+
+        self._batched_objects = self.get_batched_objects(data_list)
+        try:
+            yield
+        finally:
+            del self._batched_objects
+
+    def get_batched_object(self, data):
+        """
+        Returns the object fetched by `.batch_lookups()` for `data`, if any.
+        """
+        if not self._batched_objects:
+            return None
+        return self._batched_objects.get(get_batch_key(data))
+
     def get_attribute(self, instance):
         if self.use_pk_only_optimization() and self.source_attrs:
             # Optimized case, return a mock object only containing the pk attribute.
@@ -249,7 +394,20 @@ class PrimaryKeyRelatedField(RelatedField):
     def use_pk_only_optimization(self):
         return True
 
+    def get_lookup(self, data):
+        if isinstance(data, bool):
+            return None
+        if self.pk_field is not None:
+            try:
+                data = self.pk_field.to_internal_value(data)
+            except ValidationError:
+                return None
+        return ('pk', data)
+
     def to_internal_value(self, data):
+        obj = self.get_batched_object(data)
+        if obj is not None:
+            return obj
         if self.pk_field is not None:
             data = self.pk_field.to_internal_value(data)
         queryset = self.get_queryset()
@@ -330,10 +488,28 @@ class HyperlinkedRelatedField(RelatedField):
             return None
 
         lookup_value = getattr(obj, self.lookup_field)
+        if self.reverse is reverse:
+            # URLs are built from a template that is reversed once per request.
+            return reverse_lookup(view_name, self.lookup_url_kwarg, lookup_value, request, format)
         kwargs = {self.lookup_url_kwarg: lookup_value}
         return self.reverse(view_name, kwargs=kwargs, request=request, format=format)
 
-    def to_internal_value(self, data):
+    def get_lookup(self, data):
+        if method_overridden('get_object', HyperlinkedRelatedField, self):
+            return None
+        try:
+            match = self.resolve_url(data)
+        except ValidationError:
+            return None
+        if self.lookup_url_kwarg not in match.kwargs:
+            return None
+        return (self.lookup_field, match.kwargs[self.lookup_url_kwarg])
+
+    def resolve_url(self, data):
+        """
+        Resolve the URL given as the input `data`, returning the match if it
+        refers to the field's view, and failing validation otherwise.
+        """
         request = self.context.get('request')
         try:
             http_prefix = data.startswith(('http:', 'https:'))
@@ -363,7 +539,14 @@ class HyperlinkedRelatedField(RelatedField):
 
         if match.view_name != expected_viewname:
             self.fail('incorrect_match')
+        return match
+
+    def to_internal_value(self, data):
+        obj = self.get_batched_object(data)
+        if obj is not None:
+            return obj
 
+        match = self.resolve_url(data)
         try:
             return self.get_object(match.view_name, match.args, match.kwargs)
         except (ObjectDoesNotExist, ObjectValueError, ObjectTypeError):
@@ -451,7 +634,13 @@ class SlugRelatedField(RelatedField):
         self.slug_field = slug_field
         super().__init__(**kwargs)
 
+    def get_lookup(self, data):
+        return (self.slug_field, data)
+
     def to_internal_value(self, data):
+        obj = self.get_batched_object(data)
+        if obj is not None:
+            return obj
         queryset = self.get_queryset()
         try:
             return queryset.get(**{self.slug_field: data})
@@ -524,10 +713,16 @@ class ManyRelatedField(Field):
         if not self.allow_empty and len(data) == 0:
             self.fail('empty')
 
-        return [
-            self.child_relation.to_internal_value(item)
-            for item in data
-        ]
+        # Fetch the objects for all of the items together.
+        if isinstance(data, (list, tuple)) and len(data) > 1:
+            batch = self.child_relation.batch_lookups(data)
+        else:
+            batch = contextlib.nullcontext()
+        with batch:
+            return [
+                self.child_relation.to_internal_value(item)
+                for item in data
+            ]
 
     def get_attribute(self, instance):
         # Can't have any relationships if not created
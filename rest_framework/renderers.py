@@ -30,7 +30,7 @@ from rest_framework.compat import (
 from rest_framework.exceptions import ParseError
 from rest_framework.request import is_form_media_type, override_method
 from rest_framework.settings import api_settings
-from rest_framework.utils import encoders, json
+from rest_framework.utils import encoders, json, msgpack
 from rest_framework.utils.breadcrumbs import get_breadcrumbs
 from rest_framework.utils.field_mapping import ClassLookupDict
 
@@ -63,6 +63,9 @@ class JSONRenderer(BaseRenderer):
     ensure_ascii = not api_settings.UNICODE_JSON
     compact = api_settings.COMPACT_JSON
     strict = api_settings.STRICT_JSON
+    json_backend = api_settings.JSON_BACKEND
+    # Approximate size of the chunks yielded by `.render_stream()`.
+    stream_buffer_size = 64 * 1024
 
     # We don't set a charset because JSON is a binary encoding,
     # that can be encoded as utf-8, utf-16 or utf-32.
@@ -82,6 +85,11 @@ class JSONRenderer(BaseRenderer):
         # E.g. If we're being called by the BrowsableAPIRenderer.
         return renderer_context.get('indent', None)
 
+    def get_separators(self, indent):
+        if indent is None:
+            return SHORT_SEPARATORS if self.compact else LONG_SEPARATORS
+        return INDENT_SEPARATORS
+
     def render(self, data, accepted_media_type=None, renderer_context=None):
         """
         Render `data` into JSON, returning a bytestring.
@@ -92,22 +100,179 @@ class JSONRenderer(BaseRenderer):
         renderer_context = renderer_context or {}
         indent = self.get_indent(accepted_media_type, renderer_context)
 
-        if indent is None:
-            separators = SHORT_SEPARATORS if self.compact else LONG_SEPARATORS
-        else:
-            separators = INDENT_SEPARATORS
-
-        ret = json.dumps(
+        return self.json_backend().dumps(
             data, cls=self.encoder_class,
             indent=indent, ensure_ascii=self.ensure_ascii,
-            allow_nan=not self.strict, separators=separators
+            allow_nan=not self.strict, separators=self.get_separators(indent)
         )
 
-        # We always fully escape \u2028 and \u2029 to ensure we output JSON
-        # that is a strict javascript subset.
-        # See: https://gist.github.com/damncabbage/623b879af56f850a6ddc
-        ret = ret.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029')
-        return ret.encode()
+    def render_stream(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render an iterable of items into a JSON array, yielding bytestrings.
+
+        Items are encoded one at a time, and the output is buffered into
+        chunks of roughly `stream_buffer_size` bytes. The joined chunks are
+        identical to the output of `.render(list(data))`.
+        """
+        renderer_context = renderer_context or {}
+        indent = self.get_indent(accepted_media_type, renderer_context)
+        separators = self.get_separators(indent)
+        backend = self.json_backend()
+
+        if indent is None:
+            newline = None
+        else:
+            newline = ('\n' + (indent if isinstance(indent, str) else ' ' * indent)).encode()
+
+        buffer = []
+        size = 0
+        separator = b'['
+        for item in data:
+            ret = backend.dumps(
+                item, cls=self.encoder_class,
+                indent=indent, ensure_ascii=self.ensure_ascii,
+                allow_nan=not self.strict, separators=separators
+            )
+            if newline is not None:
+                ret = newline + ret.replace(b'\n', newline)
+            buffer.append(separator)
+            buffer.append(ret)
+            separator = separators[0].encode()
+            size += len(ret)
+            if size >= self.stream_buffer_size:
+                yield b''.join(buffer)
+                buffer = []
+                size = 0
+
+        if separator == b'[':
+            buffer.append(b'[]')
+        elif newline is not None:
+            buffer.append(b'\n]')
+        else:
+            buffer.append(b']')
+        yield b''.join(buffer)
+
+
+class NDJSONRenderer(JSONRenderer):
+    """
+    Renderer which serializes to newline delimited JSON, with one item of
+    a list on each line.
+    """
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+
+    def get_items(self, data, renderer_context):
+        """
+        Return the items to render. Lists are rendered one item per line,
+        and paginated responses render their results, with the links to the
+        next and previous pages in the `Link` header. Other data is
+        rendered on a single line.
+        """
+        if isinstance(data, dict) and isinstance(data.get('results'), list):
+            response = renderer_context.get('response')
+            links = [
+                '<%s>; rel="%s"' % (data[rel], rel)
+                for rel in ('next', 'previous') if data.get(rel)
+            ]
+            if response is not None and links and not response.has_header('Link'):
+                response['Link'] = ', '.join(links)
+            return data['results']
+        if isinstance(data, (list, tuple)):
+            return data
+        return [data]
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into newline delimited JSON, returning a bytestring.
+        """
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        items = self.get_items(data, renderer_context)
+        return b''.join(self.render_stream(items, accepted_media_type, renderer_context))
+
+    def render_stream(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render an iterable of items into newline delimited JSON, yielding
+        bytestrings of roughly `stream_buffer_size` bytes.
+        """
+        separators = self.get_separators(None)
+        backend = self.json_backend()
+
+        buffer = []
+        size = 0
+        for item in data:
+            # Indenting would split items across lines, so it isn't supported.
+            ret = backend.dumps(
+                item, cls=self.encoder_class, ensure_ascii=self.ensure_ascii,
+                allow_nan=not self.strict, separators=separators
+            ) + b'\n'
+            buffer.append(ret)
+            size += len(ret)
+            if size >= self.stream_buffer_size:
+                yield b''.join(buffer)
+                buffer = []
+                size = 0
+
+        if buffer:
+            yield b''.join(buffer)
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Renderer which serializes to MessagePack, converting values in the same
+    way as `JSONRenderer`.
+
+    If `columnar` is set, or the accepted media type includes `columnar=1`,
+    lists of objects, including empty lists, are rendered as a map of the
+    list of keys, under `fields`, and a list of values for each key, under
+    `columns`. Keys that are missing from some objects have `None` values.
+    Paginated lists are rendered in the same way.
+    """
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+    encoder_class = encoders.JSONEncoder
+    columnar = False
+
+    def get_columnar(self, accepted_media_type, renderer_context):
+        if accepted_media_type:
+            base_media_type, params = parse_header_parameters(accepted_media_type)
+            if 'columnar' in params:
+                return params['columnar'].lower() in ('1', 'true')
+        return renderer_context.get('columnar', self.columnar)
+
+    def get_columns(self, items):
+        """
+        Return the items as a map of keys and columns, or unchanged if they
+        aren't a list of objects.
+        """
+        if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+            return items
+        # Every key of any object, in the order they are first seen.
+        fields = list(dict.fromkeys(field for item in items for field in item))
+        return {
+            'fields': fields,
+            'columns': [[item.get(field) for item in items] for field in fields],
+        }
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into MessagePack, returning a bytestring.
+        """
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if self.get_columnar(accepted_media_type, renderer_context):
+            if isinstance(data, dict) and isinstance(data.get('results'), list):
+                data = dict(data, results=self.get_columns(data['results']))
+            else:
+                data = self.get_columns(data)
+
+        return msgpack.packb(data, default=self.encoder_class().default)
 
 
 class TemplateHTMLRenderer(BaseRenderer):
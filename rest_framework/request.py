@@ -20,6 +20,7 @@ from django.utils.http import parse_header_parameters
 
 from rest_framework import exceptions
 from rest_framework.settings import api_settings
+from rest_framework.utils.async_hooks import call_async
 
 
 def is_form_media_type(media_type):
@@ -232,6 +233,17 @@ class Request:
                 self._authenticate()
         return self._user
 
+    async def auser(self):
+        """
+        The async variant of `.user`, which authenticates the request using
+        the `.aauthenticate()` method of the authentication classes that
+        implement it, and runs `.authenticate()` in a thread for the others.
+        """
+        if not hasattr(self, '_user'):
+            with wrap_attributeerrors():
+                await self._aauthenticate()
+        return self._user
+
     @user.setter
     def user(self, value):
         """
@@ -394,6 +406,24 @@ class Request:
 
         self._not_authenticated()
 
+    async def _aauthenticate(self):
+        """
+        The async variant of `._authenticate()`.
+        """
+        for authenticator in self.authenticators:
+            try:
+                user_auth_tuple = await call_async(authenticator, 'authenticate', self)
+            except exceptions.APIException:
+                self._not_authenticated()
+                raise
+
+            if user_auth_tuple is not None:
+                self._authenticator = authenticator
+                self.user, self.auth = user_auth_tuple
+                return
+
+        self._not_authenticated()
+
     def _not_authenticated(self):
         """
         Set authenticator, user & authtoken representing an unauthenticated request.
@@ -6,6 +6,7 @@ The appropriate renderer is called during Django's template response rendering.
 """
 from http.client import responses
 
+from django.http import StreamingHttpResponse
 from django.template.response import SimpleTemplateResponse
 
 from rest_framework.serializers import Serializer
@@ -105,3 +106,84 @@ class Response(SimpleTemplateResponse):
                 del state[key]
         state['_closable_objects'] = []
         return state
+
+
+class StreamingResponse(StreamingHttpResponse):
+    """
+    A StreamingHttpResponse that renders an iterable of items, such as
+    serialized rows, into arbitrary media types while it is being iterated,
+    instead of holding the complete rendered content in memory.
+
+    Renderers that implement `.render_stream()` are used to stream the
+    content. Other renderers are passed the items as a list.
+    """
+
+    def __init__(self, data=None, status=None, headers=None, content_type=None):
+        super().__init__(status=status)
+
+        self.data = data
+        self.exception = False
+        self.content_type = content_type
+        self._is_rendered = False
+
+        if headers:
+            for name, value in headers.items():
+                self[name] = value
+
+    @property
+    def is_rendered(self):
+        return self._is_rendered
+
+    def render(self):
+        """
+        Set the streaming content, in the same way that Django's template
+        responses are rendered by the request handler.
+        """
+        if not self._is_rendered:
+            self.streaming_content = self.rendered_content
+            self._is_rendered = True
+        return self
+
+    @property
+    def rendered_content(self):
+        renderer = getattr(self, 'accepted_renderer', None)
+        accepted_media_type = getattr(self, 'accepted_media_type', None)
+        context = getattr(self, 'renderer_context', None)
+
+        assert renderer, ".accepted_renderer not set on StreamingResponse"
+        assert accepted_media_type, ".accepted_media_type not set on StreamingResponse"
+        assert context is not None, ".renderer_context not set on StreamingResponse"
+        context['response'] = self
+
+        media_type = renderer.media_type
+        charset = renderer.charset
+        content_type = self.content_type
+
+        if content_type is None and charset is not None:
+            content_type = f"{media_type}; charset={charset}"
+        elif content_type is None:
+            content_type = media_type
+        self['Content-Type'] = content_type
+
+        if hasattr(renderer, 'render_stream'):
+            return renderer.render_stream(self.data, accepted_media_type, context)
+
+        # Renderers that can't stream, such as the browsable API,
+        # render the complete list.
+        self.data = list(self.data)
+        ret = renderer.render(self.data, accepted_media_type, context)
+        if isinstance(ret, str):
+            assert charset, (
+                'renderer returned unicode, and did not specify '
+                'a charset value.'
+            )
+            ret = ret.encode(charset)
+        return [ret]
+
+    @property
+    def status_text(self):
+        """
+        Returns reason text corresponding to our HTTP response status code.
+        Provided for convenience.
+        """
+        return responses.get(self.status_code, '')
@@ -1,9 +1,17 @@
 """
 Provide urlresolver functions that return fully qualified URLs or view names
 """
-from django.urls import NoReverseMatch
+from urllib.parse import quote, unquote, urlsplit
+
+from django.urls import (
+    NoReverseMatch, URLResolver, get_resolver, get_script_prefix, get_urlconf
+)
 from django.urls import reverse as django_reverse
+from django.urls.converters import (
+    IntConverter, PathConverter, SlugConverter, StringConverter, UUIDConverter
+)
 from django.utils.functional import lazy
+from django.utils.http import RFC3986_SUBDELIMS
 
 from rest_framework.settings import api_settings
 from rest_framework.utils.urls import replace_query_param
@@ -64,3 +72,142 @@ def _reverse(viewname, args=None, kwargs=None, request=None, format=None, **extr
 
 
 reverse_lazy = lazy(reverse, str)
+
+# Lookup values used to reverse URL templates. They are tried in turn, so
+# that URL patterns that only match digits or UUIDs can also be templated.
+LOOKUP_SENTINELS = (
+    'drflookupsentinel',
+    '7357735773577357',
+    '73577357-7357-4357-8357-735773577357',
+)
+
+# Converters whose `.to_url()` is a plain string conversion.
+BUILTIN_CONVERTERS = (
+    IntConverter, PathConverter, SlugConverter, StringConverter, UUIDConverter
+)
+
+
+class URLTemplate:
+    """
+    The URL of a view reversed with a sentinel lookup value, which builds the
+    URLs for other lookup values using string substitution.
+
+    Lookup values are checked against the URL pattern that captures them,
+    in the same way as `django.urls.reverse()` does.
+    """
+
+    def __init__(self, url, path, pattern, converter, sentinel):
+        self.url_head, self.url_tail = url.split(sentinel)
+        self.path_head, self.path_tail = path.split(sentinel)
+        self.pattern = pattern
+        self.converter = converter
+
+    def expand(self, lookup_value):
+        """
+        Returns the URL for `lookup_value`, or `None` if the URL pattern
+        doesn't match it, in which case it must be reversed as usual.
+        """
+        if self.converter is None:
+            text = str(lookup_value)
+        else:
+            try:
+                text = str(self.converter.to_url(lookup_value))
+            except ValueError:
+                return None
+
+        # Values that change the path segments are left to `reverse()`.
+        if '/' in text or text in ('.', '..'):
+            return None
+        if self.pattern.match(self.path_head + text + self.path_tail) is None:
+            return None
+        # The same characters are quoted as by `django.urls.reverse()`.
+        return self.url_head + quote(text, safe=RFC3986_SUBDELIMS + '/~:@') + self.url_tail
+
+
+def _resolve_patterns(resolver, path):
+    """
+    Resolve `path` in the same way as `URLResolver.resolve()`, returning a
+    list of `(pattern, path)` pairs for each URL pattern that matched, and
+    the path it was matched against. Returns `None` if `path` is not matched.
+    """
+    match = resolver.pattern.match(path)
+    if match is None:
+        return None
+    new_path = match[0]
+    for pattern in resolver.url_patterns:
+        if isinstance(pattern, URLResolver):
+            matched = _resolve_patterns(pattern, new_path)
+        elif pattern.pattern.match(new_path):
+            matched = [(pattern, new_path)]
+        else:
+            matched = None
+        if matched is not None:
+            return [(resolver, path)] + matched
+    return None
+
+
+def get_url_template(viewname, lookup_url_kwarg, request, format=None):
+    """
+    Returns a `URLTemplate` for the URLs returned by `reverse()` for the
+    given view name and lookup keyword argument, or `None` if they can't be
+    built by string substitution.
+    """
+    if not isinstance(viewname, str):
+        return None
+
+    for sentinel in LOOKUP_SENTINELS:
+        try:
+            url = reverse(viewname, kwargs={lookup_url_kwarg: sentinel}, request=request, format=format)
+        except NoReverseMatch:
+            continue
+        break
+    else:
+        return None
+
+    prefix = get_script_prefix()
+    path = unquote(urlsplit(url).path)
+    if url.count(sentinel) != 1 or path.count(sentinel) != 1 or not path.startswith(prefix):
+        return None
+
+    # Find the URL pattern that captures the lookup value, and make sure
+    # that it is the one named by the view name.
+    matched = _resolve_patterns(get_resolver(get_urlconf()), '/' + path[len(prefix):])
+    if matched is None or matched[-1][0].name != viewname.split(':')[-1]:
+        return None
+    captured = [
+        (item.pattern, item_path) for item, item_path in matched
+        if lookup_url_kwarg in item.pattern.match(item_path)[2]
+    ]
+    if len(captured) != 1:
+        return None
+    pattern, pattern_path = captured[0]
+    if str(pattern.match(pattern_path)[2][lookup_url_kwarg]) != sentinel:
+        return None
+
+    converter = pattern.converters.get(lookup_url_kwarg)
+    if converter is not None and type(converter) not in BUILTIN_CONVERTERS:
+        return None
+    return URLTemplate(url, pattern_path, pattern, converter, sentinel)
+
+
+def reverse_lookup(viewname, lookup_url_kwarg, lookup_value, request=None, format=None):
+    """
+    Same as `reverse(viewname, kwargs={lookup_url_kwarg: lookup_value}, ...)`,
+    but the URL is built from a `URLTemplate` that is cached on the request,
+    so that hyperlinking many objects only reverses each view name once.
+    """
+    if request is None:
+        return reverse(viewname, kwargs={lookup_url_kwarg: lookup_value}, format=format)
+
+    # The host, script prefix, URL conf and version are fixed for a request.
+    templates = request.__dict__.setdefault('_url_templates', {})
+    key = (viewname, lookup_url_kwarg, format)
+    try:
+        template = templates[key]
+    except KeyError:
+        template = templates[key] = get_url_template(viewname, lookup_url_kwarg, request, format)
+
+    url = None if template is None else template.expand(lookup_value)
+    if url is None:
+        return reverse(viewname, kwargs={lookup_url_kwarg: lookup_value}, request=request, format=format)
+    return url
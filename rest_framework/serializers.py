@@ -13,29 +13,32 @@ response content is handled by parsers and renderers.
 
 import contextlib
 import copy
+import functools
 import inspect
+import operator
 import traceback
+import weakref
 from collections import defaultdict
 from collections.abc import Mapping
 
 from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
 from django.core.exceptions import ValidationError as DjangoValidationError
-from django.db import models
+from django.core.signals import setting_changed
+from django.db import models, router, transaction
 from django.db.models.fields import Field as DjangoModelField
 from django.utils import timezone
 from django.utils.functional import cached_property
+from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 
-from rest_framework.compat import (
-    get_referenced_base_fields_from_q, postgres_fields
-)
+from rest_framework.compat import postgres_fields
 from rest_framework.exceptions import ErrorDetail, ValidationError
 from rest_framework.fields import get_error_detail
 from rest_framework.settings import api_settings
 from rest_framework.utils import html, model_meta, representation
 from rest_framework.utils.field_mapping import (
     ClassLookupDict, get_field_kwargs, get_nested_relation_kwargs,
-    get_relation_kwargs, get_url_kwargs
+    get_relation_kwargs, get_url_kwargs, has_dynamic_limit_choices_to
 )
 from rest_framework.utils.serializer_helpers import (
     BindingDict, BoundField, JSONBoundField, NestedBoundField, ReturnDict,
@@ -43,7 +46,7 @@ from rest_framework.utils.serializer_helpers import (
 )
 from rest_framework.validators import (
     UniqueForDateValidator, UniqueForMonthValidator, UniqueForYearValidator,
-    UniqueTogetherValidator
+    UniqueTogetherValidator, UniqueValidator
 )
 
 # Note: We do the following so that users of the framework can use this style:
@@ -76,12 +79,144 @@ LIST_SERIALIZER_KWARGS = (
     'read_only', 'write_only', 'required', 'default', 'initial', 'source',
     'label', 'help_text', 'style', 'error_messages', 'allow_empty',
     'instance', 'data', 'partial', 'context', 'allow_null',
-    'max_length', 'min_length'
+    'max_length', 'min_length', 'bulk', 'batch_size'
 )
-LIST_SERIALIZER_KWARGS_REMOVE = ('allow_empty', 'min_length', 'max_length')
+LIST_SERIALIZER_KWARGS_REMOVE = ('allow_empty', 'min_length', 'max_length', 'bulk', 'batch_size')
 
 ALL_FIELDS = '__all__'
 
+# Methods that `ModelSerializer.build_fields()` uses to generate its fields.
+FIELD_CONSTRUCTION_METHODS = (
+    'build_fields', 'get_field_names', 'get_default_field_names',
+    'get_extra_kwargs', 'get_uniqueness_extra_kwargs', 'include_extra_kwargs',
+    'build_field', 'build_standard_field', 'build_relational_field',
+    'build_nested_field', 'build_property_field', 'build_url_field',
+    'build_unknown_field',
+)
+
+
+def _compile_attribute_getter(field):
+    """
+    Return a callable that performs `field.get_attribute(instance)`.
+
+    For fields using the default `Field.get_attribute`, plain attribute
+    sources are resolved with `operator.attrgetter`. Anything the fast
+    path cannot handle identically (mappings, callables, missing
+    attributes) defers to `field.get_attribute`.
+    """
+    get_attribute = field.get_attribute
+    if type(field).get_attribute is not Field.get_attribute:
+        return get_attribute
+
+    if not field.source_attrs:
+        return lambda instance: instance
+
+    fetch = operator.attrgetter('.'.join(field.source_attrs))
+
+    def getter(instance):
+        if isinstance(instance, Mapping):
+            return get_attribute(instance)
+        try:
+            value = fetch(instance)
+        except Exception:
+            return get_attribute(instance)
+        if callable(value):
+            return get_attribute(instance)
+        return value
+
+    return getter
+
+
+# Field templates
+# ---------------
+
+# {serializer class: {Meta fingerprint: {field name: template field}}}
+_field_templates = weakref.WeakKeyDictionary()
+
+
+def clear_field_templates():
+    """
+    Discard every cached `ModelSerializer` field template.
+    """
+    _field_templates.clear()
+
+
+def _clear_field_templates_on_setting_changed(*, setting, **kwargs):
+    if setting in ('REST_FRAMEWORK', 'INSTALLED_APPS'):
+        clear_field_templates()
+
+
+setting_changed.connect(_clear_field_templates_on_setting_changed)
+
+
+def _freeze(value):
+    """
+    Return a hashable equivalent of a `Meta` option value.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, Mapping):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return id(value)
+    return value
+
+
+def _meta_fingerprint(meta):
+    return tuple(
+        (name, _freeze(getattr(meta, name)))
+        for name in dir(meta) if not name.startswith('__')
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _is_shallow_cloneable(field_class):
+    """
+    Fields whose state is fully set up by one of REST framework's own
+    `__init__` methods, and which do not hold child fields, can be cloned
+    by copying their `__dict__` rather than being re-instantiated.
+    """
+    if field_class.__deepcopy__ is not Field.__deepcopy__:
+        return False
+    if issubclass(field_class, (BaseSerializer, ListField, DictField, ManyRelatedField)):
+        return False
+    init_owner = next(
+        klass for klass in field_class.__mro__ if '__init__' in klass.__dict__
+    )
+    return init_owner.__module__ in ('rest_framework.fields', 'rest_framework.relations')
+
+
+def _clone_field(field):
+    """
+    Return an unbound copy of a template field, equivalent to
+    `copy.deepcopy(field)` but without re-running `__init__`.
+    """
+    if not _is_shallow_cloneable(type(field)):
+        return copy.deepcopy(field)
+
+    clone = object.__new__(type(field))
+    state = clone.__dict__
+    state.update(field.__dict__)
+    state['error_messages'] = dict(field.error_messages)
+    state['style'] = dict(field.style)
+    state['default'] = copy.deepcopy(field.default)
+    state['initial'] = copy.deepcopy(field.initial)
+    if '_validators' in state:
+        state['_validators'] = list(state['_validators'])
+    return clone
+
+
+def clone_fields(fields):
+    """
+    Return a dictionary of {field_name: field_instance} cloned from the
+    given template fields.
+    """
+    return {field_name: _clone_field(field) for field_name, field in fields.items()}
+
 
 # BaseSerializer
 # --------------
@@ -394,7 +529,7 @@ class Serializer(BaseSerializer, metaclass=SerializerMetaclass):
         # Every new serializer is created with a clone of the field instances.
         # This allows users to dynamically modify the fields on a serializer
         # instance without affecting every other serializer instance.
-        return copy.deepcopy(self._declared_fields)
+        return clone_fields(self._declared_fields)
 
     def get_validators(self):
         """
@@ -515,10 +650,53 @@ class Serializer(BaseSerializer, metaclass=SerializerMetaclass):
 
         return ret
 
+    @property
+    def _representation_plan(self):
+        """
+        A list of `(field_name, getter, to_representation, resolve_pk)`
+        tuples, built once per serializer instance and reused for every
+        object passed to `to_representation` when `COMPILED_REPRESENTATION`
+        is enabled. The plan is discarded whenever `.fields` is modified.
+        """
+        plan = self.__dict__.get('_compiled_plan')
+        if plan is None:
+            plan = [
+                (
+                    field.field_name,
+                    _compile_attribute_getter(field),
+                    field.to_representation,
+                    # Only fields with a custom `get_attribute` may return
+                    # a `PKOnlyObject` that needs resolving to its pk.
+                    type(field).get_attribute is not Field.get_attribute
+                )
+                for field in self._readable_fields
+            ]
+            self.__dict__['_compiled_plan'] = plan
+        return plan
+
+    def _compiled_to_representation(self, instance):
+        ret = {}
+        for field_name, getter, to_representation, resolve_pk in self._representation_plan:
+            try:
+                attribute = getter(instance)
+            except SkipField:
+                continue
+
+            check_for_none = attribute.pk if resolve_pk and isinstance(attribute, PKOnlyObject) else attribute
+            if check_for_none is None:
+                ret[field_name] = None
+            else:
+                ret[field_name] = to_representation(attribute)
+
+        return ret
+
     def to_representation(self, instance):
         """
         Object instance -> Dict of primitive datatypes.
         """
+        if api_settings.COMPILED_REPRESENTATION:
+            return self._compiled_to_representation(instance)
+
         ret = {}
         fields = self._readable_fields
 
@@ -590,12 +768,17 @@ class Serializer(BaseSerializer, metaclass=SerializerMetaclass):
 class ListSerializer(BaseSerializer):
     child = None
     many = True
+    # Set `bulk = True` to save the items of a `ModelSerializer` child using
+    # `bulk_create()` and `bulk_update()`, `batch_size` objects at a time.
+    bulk = False
+    batch_size = None
 
     default_error_messages = {
         'not_a_list': _('Expected a list of items but got type "{input_type}".'),
         'empty': _('This list may not be empty.'),
         'max_length': _('Ensure this field has no more than {max_length} elements.'),
-        'min_length': _('Ensure this field has at least {min_length} elements.')
+        'min_length': _('Ensure this field has at least {min_length} elements.'),
+        'does_not_exist': _('Invalid pk "{pk_value}" - object does not exist.')
     }
 
     def __init__(self, *args, **kwargs):
@@ -603,6 +786,8 @@ class ListSerializer(BaseSerializer):
         self.allow_empty = kwargs.pop('allow_empty', True)
         self.max_length = kwargs.pop('max_length', None)
         self.min_length = kwargs.pop('min_length', None)
+        self.bulk = kwargs.pop('bulk', self.bulk)
+        self.batch_size = kwargs.pop('batch_size', self.batch_size)
         assert self.child is not None, '`child` is a required argument.'
         assert not inspect.isclass(self.child), '`child` has not been instantiated.'
         super().__init__(*args, **kwargs)
@@ -651,9 +836,138 @@ class ListSerializer(BaseSerializer):
         self.child.instance = self.instance.get(pk=data['id'])
         self.child.initial_data = data
         return super().run_child_validation(data)
+
+        Bulk updates validate each item against the instance with its pk.
         """
+        if self.bulk and self.instance is not None:
+            self.child.instance = self.get_child_instance(data)
         return self.child.run_validation(data)
 
+    def get_pk_field(self):
+        """
+        Returns the writable field of the child serializer that holds the
+        primary key of each item, which bulk updates use to match the items
+        to the instances being updated.
+        """
+        pk_name = self.child.Meta.model._meta.pk.name
+        for field in self.child._writable_fields:
+            if field.source in (pk_name, 'pk'):
+                return field
+        raise AssertionError(
+            'Bulk updates require a writable field with `source=\'{pk_name}\'` '
+            'on serializer `{module}.{class_name}`, which identifies the '
+            'instance that each item updates.'.format(
+                pk_name=pk_name,
+                module=self.child.__class__.__module__,
+                class_name=self.child.__class__.__name__
+            )
+        )
+
+    def get_instance_map(self):
+        if not hasattr(self, '_instance_map'):
+            self._instance_map = {obj.pk: obj for obj in self.instance}
+        return self._instance_map
+
+    def get_child_instance(self, data):
+        """
+        Returns the instance that the item `data` updates, for bulk updates.
+        """
+        field = self.get_pk_field()
+        if not isinstance(data, Mapping):
+            # Let the child serializer report the invalid data.
+            return None
+        primitive_value = field.get_value(data)
+        if primitive_value is empty:
+            message = field.error_messages['required']
+            raise ValidationError({field.field_name: [message]}, code='required')
+        try:
+            pk_value = field.to_internal_value(primitive_value)
+        except ValidationError as exc:
+            raise ValidationError({field.field_name: exc.detail})
+        try:
+            return self.get_instance_map()[pk_value]
+        except (KeyError, TypeError):
+            message = self.error_messages['does_not_exist'].format(pk_value=pk_value)
+            raise ValidationError({field.field_name: [message]}, code='does_not_exist')
+
+    def get_batch_value(self, field, data):
+        """
+        Returns the internal value of `field` for the item `data`, without
+        running its validators, or `empty` if it can't be determined.
+        """
+        if isinstance(field, BaseSerializer):
+            return empty
+        try:
+            if field.read_only:
+                return field.get_default()
+            (is_empty_value, value) = field.validate_empty_values(field.get_value(data))
+            if is_empty_value:
+                return value
+            return field.to_internal_value(value)
+        except (SkipField, ValidationError, DjangoValidationError):
+            return empty
+
+    def batch_lookups(self, data):
+        """
+        Returns a context manager within which the writable related fields of
+        the child serializer fetch the objects referenced by all of the items
+        in `data` together, rather than running a query for every item.
+
+        Uniqueness validators of the child serializer and its fields likewise
+        check the values of all of the items using a single query.
+        """
+        stack = contextlib.ExitStack()
+        if not isinstance(self.child, Serializer):
+            return stack
+
+        items = [item for item in data if isinstance(item, Mapping)]
+        for field in self.child._writable_fields:
+            if isinstance(field, ManyRelatedField):
+                relation = field.child_relation
+                values = []
+                for item in items:
+                    value = field.get_value(item)
+                    if isinstance(value, (list, tuple)):
+                        values.extend(value)
+            elif isinstance(field, RelatedField):
+                relation = field
+                values = [field.get_value(item) for item in items]
+                values = [value for value in values if value not in (empty, None, '')]
+            else:
+                continue
+            if len(values) > 1:
+                stack.enter_context(relation.batch_lookups(values))
+
+        if len(items) < 2:
+            return stack
+
+        columns = {}
+
+        def get_column(field):
+            if field.field_name not in columns:
+                columns[field.field_name] = [self.get_batch_value(field, item) for item in items]
+            return columns[field.field_name]
+
+        for field in self.child._writable_fields:
+            for validator in field.validators:
+                if isinstance(validator, UniqueValidator):
+                    values = [value for value in get_column(field) if value is not empty]
+                    stack.enter_context(validator.batch_lookups(values, field))
+
+        for validator in self.child.validators:
+            if not isinstance(validator, UniqueTogetherValidator):
+                continue
+            if not all(field_name in self.child.fields for field_name in validator.fields):
+                continue
+            fields = [self.child.fields[field_name] for field_name in validator.fields]
+            attrs_list = [{} for item in items]
+            for field in fields:
+                for attrs, value in zip(attrs_list, get_column(field)):
+                    if value is not empty:
+                        attrs[field.source] = value
+            stack.enter_context(validator.batch_lookups(attrs_list, self.child))
+        return stack
+
     def to_internal_value(self, data):
         """
         List of dicts of native values <- List of dicts of primitive datatypes.
@@ -690,14 +1004,15 @@ class ListSerializer(BaseSerializer):
         ret = []
         errors = []
 
-        for item in data:
-            try:
-                validated = self.run_child_validation(item)
-            except ValidationError as exc:
-                errors.append(exc.detail)
-            else:
-                ret.append(validated)
-                errors.append({})
+        with self.batch_lookups(data):
+            for item in data:
+                try:
+                    validated = self.run_child_validation(item)
+                except ValidationError as exc:
+                    errors.append(exc.detail)
+                else:
+                    ret.append(validated)
+                    errors.append({})
 
         if any(errors):
             raise ValidationError(errors)
@@ -720,19 +1035,140 @@ class ListSerializer(BaseSerializer):
         return attrs
 
     def update(self, instance, validated_data):
+        if self.bulk:
+            return self.bulk_update(instance, validated_data)
         raise NotImplementedError(
             "Serializers with many=True do not support multiple update by "
             "default, only multiple create. For updates it is unclear how to "
             "deal with insertions and deletions. If you need to support "
             "multiple update, use a `ListSerializer` class and override "
-            "`.update()` so you can specify the behavior exactly."
+            "`.update()` so you can specify the behavior exactly, or set "
+            "`bulk=True` to update the instances matching the pk of each item."
         )
 
     def create(self, validated_data):
+        if self.bulk:
+            return self.bulk_create(validated_data)
         return [
             self.child.create(attrs) for attrs in validated_data
         ]
 
+    def assert_bulk_save(self, method_name):
+        assert isinstance(self.child, ModelSerializer), (
+            'Bulk saves are only supported for `ModelSerializer` children.'
+        )
+        assert getattr(type(self.child), method_name) is getattr(ModelSerializer, method_name), (
+            'Bulk saves do not call `.{method_name}()` of the child serializer.\n'
+            'Remove the `.{method_name}()` method of serializer `{module}.{class_name}`, '
+            'or set `bulk=False`.'.format(
+                method_name=method_name,
+                module=self.child.__class__.__module__,
+                class_name=self.child.__class__.__name__
+            )
+        )
+
+    def bulk_create(self, validated_data):
+        """
+        Create the instances using `bulk_create()`, and then set their
+        many-to-many relationships, inserting the rows of each through model
+        together.
+
+        Note that `bulk_create()` doesn't call `.save()` on the instances or
+        send the `pre_save` and `post_save` signals, and that the rows of the
+        through models are inserted without sending `m2m_changed`.
+        """
+        self.assert_bulk_save('create')
+        ModelClass = self.child.Meta.model
+        info = model_meta.get_field_info(ModelClass)
+
+        instances = []
+        many_to_many = []
+        for attrs in validated_data:
+            raise_errors_on_nested_writes('create', self.child, attrs)
+            attrs = dict(attrs)
+            many_to_many.append({
+                field_name: attrs.pop(field_name)
+                for field_name, relation_info in info.relations.items()
+                if relation_info.to_many and field_name in attrs
+            })
+            try:
+                instances.append(ModelClass(**attrs))
+            except TypeError:
+                tb = traceback.format_exc()
+                msg = (
+                    'Got a `TypeError` when instantiating `%s`. '
+                    'This may be because you have a writable field on the '
+                    'serializer class that is not a valid argument to '
+                    '`%s()`. You may need to make the field read-only, or '
+                    'set `bulk=False` and override the %s.create() method to '
+                    'handle this correctly.\nOriginal exception was:\n %s' %
+                    (
+                        ModelClass.__name__,
+                        ModelClass.__name__,
+                        self.child.__class__.__name__,
+                        tb
+                    )
+                )
+                raise TypeError(msg)
+
+        using = router.db_for_write(ModelClass)
+        with transaction.atomic(using=using):
+            if any(many_to_many) and not transaction.get_connection(using).features.can_return_rows_from_bulk_insert:
+                # The primary keys of the new rows are needed in order to
+                # set their many-to-many relationships.
+                for instance in instances:
+                    instance.save(force_insert=True, using=using)
+            else:
+                ModelClass._default_manager.bulk_create(instances, batch_size=self.batch_size)
+            bulk_set_many_to_many(instances, many_to_many, batch_size=self.batch_size, created=True)
+        return instances
+
+    def bulk_update(self, instance, validated_data):
+        """
+        Update the instances that match the pk of each item using
+        `bulk_update()`, and then set their many-to-many relationships,
+        inserting and deleting the rows of each through model together.
+
+        Only the fields that are present in the validated data are updated.
+        Instances that don't match any item are left unchanged.
+
+        Note that `bulk_update()` doesn't call `.save()` on the instances or
+        send the `pre_save` and `post_save` signals, and that the rows of the
+        through models are changed without sending `m2m_changed`.
+        """
+        self.assert_bulk_save('update')
+        ModelClass = self.child.Meta.model
+        info = model_meta.get_field_info(ModelClass)
+        pk_source = self.get_pk_field().source
+        instance_map = self.get_instance_map()
+
+        instances = []
+        many_to_many = []
+        update_fields = {}
+        for attrs in validated_data:
+            raise_errors_on_nested_writes('update', self.child, attrs)
+            obj = instance_map[attrs[pk_source]]
+            m2m_fields = {}
+            for attr, value in attrs.items():
+                if attr == pk_source:
+                    continue
+                if attr in info.relations and info.relations[attr].to_many:
+                    m2m_fields[attr] = value
+                else:
+                    setattr(obj, attr, value)
+                    update_fields[attr] = None
+            instances.append(obj)
+            many_to_many.append(m2m_fields)
+
+        using = router.db_for_write(ModelClass)
+        with transaction.atomic(using=using):
+            if update_fields:
+                ModelClass._default_manager.bulk_update(
+                    instances, list(update_fields), batch_size=self.batch_size
+                )
+            bulk_set_many_to_many(instances, many_to_many, batch_size=self.batch_size)
+        return instances
+
     def save(self, **kwargs):
         """
         Save and return a list of object instances.
@@ -888,6 +1324,65 @@ def raise_errors_on_nested_writes(method_name, serializer, validated_data):
     )
 
 
+def bulk_set_many_to_many(instances, many_to_many, batch_size=None, created=False):
+    """
+    Given a list of saved instances, and a list of dictionaries mapping
+    many-to-many field names to the related objects of each instance, set the
+    relationships of all of the instances using a few queries per field.
+
+    Relationships with an auto-created through model are set by inserting and
+    deleting its rows directly. Other relationships, such as reverse
+    relationships, are set using `.set()` on each instance. If `created` is
+    set, the instances are new, and so don't have existing relationships.
+    """
+    values_by_field = {}
+    for instance, m2m_fields in zip(instances, many_to_many):
+        for field_name, value in m2m_fields.items():
+            values_by_field.setdefault(field_name, []).append((instance, value))
+
+    for field_name, items in values_by_field.items():
+        model_field = items[0][0]._meta.get_field(field_name)
+        through = getattr(model_field.remote_field, 'through', None)
+        if (
+            not model_field.many_to_many or model_field.auto_created or
+            not through._meta.auto_created
+        ):
+            for instance, value in items:
+                getattr(instance, field_name).set(value)
+            continue
+
+        source_field = through._meta.get_field(model_field.m2m_field_name())
+        target_field = through._meta.get_field(model_field.m2m_reverse_field_name())
+
+        targets = {}
+        for instance, value in items:
+            source_value = getattr(instance, source_field.target_field.attname)
+            targets[source_value] = {
+                getattr(obj, target_field.target_field.attname)
+                if isinstance(obj, models.Model) else target_field.target_field.to_python(obj)
+                for obj in value
+            }
+
+        remove = []
+        if not created:
+            existing = through._default_manager.filter(**{
+                source_field.attname + '__in': list(targets)
+            }).values_list('pk', source_field.attname, target_field.attname)
+            for pk, source_value, target_value in existing:
+                if target_value in targets[source_value]:
+                    targets[source_value].discard(target_value)
+                else:
+                    remove.append(pk)
+
+        if remove:
+            through._default_manager.filter(pk__in=remove).delete()
+        through._default_manager.bulk_create([
+            through(**{source_field.attname: source_value, target_field.attname: target_value})
+            for source_value, target_values in targets.items()
+            for target_value in target_values
+        ], batch_size=batch_size)
+
+
 class ModelSerializer(Serializer):
     """
     A `ModelSerializer` is just a regular `Serializer`, except that:
@@ -1068,7 +1563,50 @@ class ModelSerializer(Serializer):
                 'Cannot use ModelSerializer with Abstract Models.'
             )
 
-        declared_fields = copy.deepcopy(self._declared_fields)
+        if not self._can_use_field_templates():
+            return self.build_fields()
+
+        # Field construction only depends on the serializer class and its
+        # `Meta` options, so the resulting fields are built once and used as
+        # templates that every new serializer instance is cloned from.
+        templates = _field_templates.setdefault(self.__class__, {})
+        # Generated error messages are translated when the fields are built.
+        fingerprint = (get_language(), self.url_field_name, _meta_fingerprint(self.Meta))
+        fields = templates.get(fingerprint)
+        if fields is None:
+            fields = templates[fingerprint] = self.build_fields()
+        return clone_fields(fields)
+
+    def _can_use_field_templates(self):
+        """
+        Returns `True` if the fields returned by `build_fields()` only depend
+        on the serializer class and its `Meta` options.
+
+        That is not the case if any of the methods used to build the fields
+        have been overridden, since those may depend on instance state such as
+        `self.context`, or if the model limits a relation's choices with a
+        callable, since that must be evaluated each time.
+        """
+        for klass in self.__class__.__mro__:
+            if klass is ModelSerializer:
+                break
+            if klass is HyperlinkedModelSerializer:
+                continue
+            if any(name in klass.__dict__ for name in FIELD_CONSTRUCTION_METHODS):
+                return False
+
+        info = model_meta.get_field_info(self.Meta.model)
+        return not any(
+            has_dynamic_limit_choices_to(relation_info.model_field)
+            for relation_info in info.forward_relations.values()
+        )
+
+    def build_fields(self):
+        """
+        Build the dict of field names -> field instances from the serializer's
+        declared fields and its `Meta` options.
+        """
+        declared_fields = clone_fields(self._declared_fields)
         model = getattr(self.Meta, 'model')
         depth = getattr(self.Meta, 'depth', 0)
 
@@ -1431,16 +1969,7 @@ class ModelSerializer(Serializer):
         each entry describes an unique together constraint on `fields` in `queryset`
         with respect of constraint's `condition`.
         """
-        for parent_class in [model] + list(model._meta.parents):
-            for unique_together in parent_class._meta.unique_together:
-                yield unique_together, model._default_manager, [], None
-            for constraint in parent_class._meta.constraints:
-                if isinstance(constraint, models.UniqueConstraint) and len(constraint.fields) > 1:
-                    if constraint.condition is None:
-                        condition_fields = []
-                    else:
-                        condition_fields = list(get_referenced_base_fields_from_q(constraint.condition))
-                    yield (constraint.fields, model._default_manager, condition_fields, constraint.condition)
+        yield from model_meta.get_unique_together_constraints(model)
 
     def get_uniqueness_extra_kwargs(self, field_names, declared_fields, extra_kwargs):
         """
@@ -115,9 +115,13 @@ DEFAULTS = {
     'UNICODE_JSON': True,
     'COMPACT_JSON': True,
     'STRICT_JSON': True,
+    'JSON_BACKEND': 'rest_framework.utils.json_backends.StandardJSONBackend',
     'COERCE_DECIMAL_TO_STRING': True,
     'UPLOADED_FILES_USE_URL': True,
 
+    # Serialization
+    'COMPILED_REPRESENTATION': False,
+
     # Browsable API
     'HTML_SELECT_CUTOFF': 1000,
     'HTML_SELECT_CUTOFF_TEXT': "More than {count} items...",
@@ -148,6 +152,7 @@ IMPORT_STRINGS = [
     'TEST_REQUEST_RENDERER_CLASSES',
     'UNAUTHENTICATED_USER',
     'UNAUTHENTICATED_TOKEN',
+    'JSON_BACKEND',
     'VIEW_NAME_FUNCTION',
     'VIEW_DESCRIPTION_FUNCTION'
 ]
@@ -1,17 +1,25 @@
 """
 Provides various throttling policies.
 """
+import contextlib
+import math
 import time
 
+from asgiref.sync import sync_to_async
 from django.core.cache import cache as default_cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
 from django.core.exceptions import ImproperlyConfigured
 
 from rest_framework.settings import api_settings
+from rest_framework.utils.async_hooks import call_async
 
 
 class BaseThrottle:
     """
     Rate throttling of requests.
+
+    Throttles may also implement `.aallow_request()`, which is awaited
+    instead of running `.allow_request()` in a thread when the view is async.
     """
 
     def allow_request(self, request, view):
@@ -113,14 +121,27 @@ class SimpleRateThrottle(BaseThrottle):
         On success calls `throttle_success`.
         On failure calls `throttle_failure`.
         """
-        if self.rate is None:
+        if self.prepare_request(request, view) is None:
             return True
+        return self.check_history(self.cache.get(self.key, []))
+
+    def prepare_request(self, request, view):
+        """
+        Determine the cache key of the request's history, returning `None`
+        if the request should not be throttled.
+        """
+        if self.rate is None:
+            return None
 
         self.key = self.get_cache_key(request, view)
-        if self.key is None:
-            return True
+        return self.key
 
-        self.history = self.cache.get(self.key, [])
+    def check_history(self, history):
+        """
+        Given the history of the request's cache key, check if the
+        request should be throttled.
+        """
+        self.history = history
         self.now = self.timer()
 
         # Drop any requests from the history which have now passed the
@@ -216,13 +237,13 @@ class ScopedRateThrottle(SimpleRateThrottle):
         # the rate until called by the view.
         pass
 
-    def allow_request(self, request, view):
+    def prepare_request(self, request, view):
         # We can only determine the scope once we're called by the view.
         self.scope = getattr(view, self.scope_attr, None)
 
         # If a view does not have a `throttle_scope` always allow the request
         if not self.scope:
-            return True
+            return None
 
         # Determine the allowed request rate as we normally would during
         # the `__init__` call.
@@ -230,7 +251,7 @@ class ScopedRateThrottle(SimpleRateThrottle):
         self.num_requests, self.duration = self.parse_rate(self.rate)
 
         # We can now proceed as normal.
-        return super().allow_request(request, view)
+        return super().prepare_request(request, view)
 
     def get_cache_key(self, request, view):
         """
@@ -248,3 +269,249 @@ class ScopedRateThrottle(SimpleRateThrottle):
             'scope': self.scope,
             'ident': ident
         }
+
+
+class BatchedCache:
+    """
+    Wraps a cache while the histories of several throttles are checked,
+    serving values fetched with `get_many()` and collecting the values
+    that are set, so that they can be written with `set_many()`.
+    """
+
+    def __init__(self, cache, keys):
+        self.cache = cache
+        self.values = cache.get_many(keys)
+        self.pending = {}
+
+    def get(self, key, default=None):
+        if key in self.pending:
+            return self.pending[key][0]
+        return self.values.get(key, default)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT):
+        self.pending[key] = (value, timeout)
+
+    def __getattr__(self, attr):
+        return getattr(self.cache, attr)
+
+    def flush(self):
+        """
+        Write the collected values, using one `set_many()` for each timeout.
+        """
+        batches = {}
+        for key, (value, timeout) in self.pending.items():
+            batches.setdefault(timeout, {})[key] = value
+        for timeout, values in batches.items():
+            self.cache.set_many(values, timeout)
+        self.pending = {}
+
+
+def can_batch(throttle):
+    """
+    Returns `True` if the throttle stores its history using the
+    `SimpleRateThrottle` implementation of `.allow_request()`.
+    """
+    return (
+        isinstance(throttle, SimpleRateThrottle) and
+        type(throttle).allow_request is SimpleRateThrottle.allow_request
+    )
+
+
+def evaluate_throttles(throttles, request, view):
+    """
+    Given a list of throttles, return a list of whether each of them allows
+    the request.
+
+    The histories of throttles that can be batched are read using one
+    `cache.get_many()` call per cache, and written using `cache.set_many()`.
+    Other throttles are evaluated by calling `.allow_request()`.
+    """
+    results = [None] * len(throttles)
+    batches = {}
+    for index, throttle in enumerate(throttles):
+        if not can_batch(throttle):
+            results[index] = throttle.allow_request(request, view)
+        elif throttle.prepare_request(request, view) is None:
+            results[index] = True
+        else:
+            cache = throttle.cache
+            batches.setdefault(id(cache), (cache, []))[1].append(index)
+
+    for cache, indexes in batches.values():
+        batched_cache = BatchedCache(cache, [throttles[index].key for index in indexes])
+        for index in indexes:
+            throttle = throttles[index]
+            instance_cache = throttle.__dict__.get('cache')
+            throttle.cache = batched_cache
+            try:
+                results[index] = throttle.check_history(batched_cache.get(throttle.key, []))
+            finally:
+                if instance_cache is None:
+                    del throttle.cache
+                else:
+                    throttle.cache = instance_cache
+        batched_cache.flush()
+
+    return results
+
+
+async def aevaluate_throttles(throttles, request, view):
+    """
+    The async variant of `evaluate_throttles()`.
+
+    Throttles that can be batched are evaluated together in a single thread.
+    Other throttles are evaluated by awaiting `.aallow_request()` if they
+    implement it, or by running `.allow_request()` in a thread.
+    """
+    batched = [index for index, throttle in enumerate(throttles) if can_batch(throttle)]
+    results = [None] * len(throttles)
+    if batched:
+        batched_results = await sync_to_async(evaluate_throttles)(
+            [throttles[index] for index in batched], request, view
+        )
+        for index, result in zip(batched, batched_results):
+            results[index] = result
+
+    for index, throttle in enumerate(throttles):
+        if not can_batch(throttle):
+            results[index] = await call_async(throttle, 'allow_request', request, view)
+    return results
+
+
+class SlidingWindowRateThrottle(SimpleRateThrottle):
+    """
+    A cache implementation of a sliding window counter, configured in the
+    same way as `SimpleRateThrottle`.
+
+    Instead of the timestamp of every request, only the number of requests
+    in the current and the previous fixed window are stored. The number of
+    requests in the sliding window is estimated by weighting the count of
+    the previous window by the fraction of it that the sliding window still
+    overlaps.
+
+    The counters are updated using `cache.incr()` and `cache.add()`, which
+    are atomic on cache backends such as memcached, redis and the local
+    memory cache, so concurrent requests can't exceed the rate.
+    """
+    window_key_format = '%(key)s_%(window)d'
+
+    def get_window_key(self, window):
+        return self.window_key_format % {'key': self.key, 'window': window}
+
+    def allow_request(self, request, view):
+        """
+        Implement the check to see if the request should be throttled.
+
+        On success calls `throttle_success`.
+        On failure calls `throttle_failure`.
+        """
+        if self.prepare_request(request, view) is None:
+            return True
+
+        self.now = self.timer()
+        window = int(self.now // self.duration)
+        self.elapsed = self.now - window * self.duration
+        self.window_key = self.get_window_key(window)
+
+        self.previous_count = self.cache.get(self.get_window_key(window - 1), 0)
+        self.current_count = self.increment() - 1
+        if self.get_request_count() + 1 > self.num_requests:
+            return self.throttle_failure()
+        return self.throttle_success()
+
+    def increment(self):
+        """
+        Count the current request, returning the number of requests in the
+        current window.
+        """
+        # The counter is kept until the end of the next window.
+        timeout = math.ceil(2 * self.duration - self.elapsed)
+        if not self.has_atomic_incr():
+            count = self.cache.get(self.window_key, 0) + 1
+            self.cache.set(self.window_key, count, timeout)
+            return count
+
+        try:
+            return self.cache.incr(self.window_key)
+        except ValueError:
+            if self.cache.add(self.window_key, 1, timeout):
+                return 1
+            return self.cache.incr(self.window_key)
+
+    def has_atomic_incr(self):
+        """
+        The default `cache.incr()` isn't atomic, and resets the timeout
+        of the key, so it is only used if the backend overrides it.
+        """
+        return self.cache.incr.__func__ is not BaseCache.incr
+
+    def get_request_count(self):
+        """
+        Return the estimated number of requests made in the sliding window
+        before the current request.
+        """
+        weight = 1 - self.elapsed / self.duration
+        return self.previous_count * weight + self.current_count
+
+    def throttle_success(self):
+        """
+        The current request has already been counted by `increment()`.
+        """
+        return True
+
+    def throttle_failure(self):
+        """
+        Called when a request to the API has failed due to throttling.
+
+        Throttled requests aren't counted, so they don't extend the
+        period the client has to wait.
+        """
+        if self.has_atomic_incr():
+            with contextlib.suppress(ValueError):
+                self.cache.decr(self.window_key)
+        else:
+            timeout = math.ceil(2 * self.duration - self.elapsed)
+            self.cache.set(self.window_key, self.current_count, timeout)
+        return False
+
+    def wait(self):
+        """
+        Returns the number of seconds until the estimated number of requests
+        in the sliding window leaves room for another request.
+        """
+        if self.num_requests == 0:
+            return None
+
+        available = self.num_requests - 1 - self.current_count
+        if available >= 0:
+            # Wait for the weight of the previous window to decrease.
+            until = 0
+            if self.previous_count:
+                until = self.duration - self.duration * available / self.previous_count
+            return max(until - self.elapsed, 0)
+
+        # Wait for the next window, where the count of the current window
+        # is weighted instead.
+        until = self.duration - self.duration * (self.num_requests - 1) / self.current_count
+        return self.duration - self.elapsed + until
+
+
+class AnonSlidingWindowRateThrottle(AnonRateThrottle, SlidingWindowRateThrottle):
+    """
+    Limits the rate of API calls that may be made by anonymous users, using
+    a sliding window counter.
+    """
+
+
+class UserSlidingWindowRateThrottle(UserRateThrottle, SlidingWindowRateThrottle):
+    """
+    Limits the rate of API calls that may be made by a given user, using a
+    sliding window counter.
+    """
+
+
+class ScopedSlidingWindowRateThrottle(ScopedRateThrottle, SlidingWindowRateThrottle):
+    """
+    Limits the rate of API calls by different amounts for various parts of
+    the API, using a sliding window counter.
+    """
@@ -0,0 +1,42 @@
+"""
+Helpers for calling the optional async variants of the hooks implemented by
+views, authentication, permission and throttle classes.
+
+The async variant of a hook has the same name with an `a` prefix, such as
+`.ahas_permission()` for `.has_permission()`, and takes the same arguments.
+Hooks without an async variant are run in a thread using `sync_to_async`.
+"""
+import functools
+
+from asgiref.sync import sync_to_async
+
+
+@functools.lru_cache(maxsize=None)
+def has_async_variant(cls, name):
+    """
+    Returns `True` if `cls` implements the async variant of the `name` hook,
+    and the sync hook is not overridden by a more derived class.
+
+    This ensures that a subclass which only overrides the sync hook keeps
+    its behavior, rather than using an async variant it has inherited.
+    """
+    async_name = 'a' + name
+    for klass in cls.__mro__:
+        attrs = vars(klass)
+        if async_name in attrs:
+            return True
+        if name in attrs:
+            return False
+    return False
+
+
+async def call_async(obj, name, /, *args, **kwargs):
+    """
+    Call the `name` hook of `obj`, awaiting its async variant if it has one,
+    and otherwise running the sync hook in a thread.
+    """
+    attrs = getattr(obj, '__dict__', {})
+    async_name = 'a' + name
+    if async_name in attrs or (name not in attrs and has_async_variant(type(obj), name)):
+        return await getattr(obj, async_name)(*args, **kwargs)
+    return await sync_to_async(getattr(obj, name))(*args, **kwargs)
@@ -2,11 +2,14 @@
 Helper functions for mapping model fields to a dictionary of default
 keyword arguments that should be used for their equivalent serializer fields.
 """
+import functools
 import inspect
 
 from django.core import validators
+from django.core.signals import setting_changed
 from django.db import models
 from django.utils.text import capfirst
+from django.utils.translation import get_language
 
 from rest_framework.compat import postgres_fields
 from rest_framework.validators import UniqueValidator
@@ -16,6 +19,59 @@ NUMERIC_FIELD_TYPES = (
 )
 
 
+_kwargs_cache = {}
+
+
+def clear_cache():
+    """
+    Discard the cached keyword arguments for all model fields.
+    """
+    _kwargs_cache.clear()
+
+
+def _clear_cache_on_setting_changed(*, setting, **kwargs):
+    if setting == 'INSTALLED_APPS':
+        clear_cache()
+
+
+setting_changed.connect(_clear_cache_on_setting_changed)
+
+
+def _copy_kwargs(kwargs):
+    kwargs = dict(kwargs)
+    if 'validators' in kwargs:
+        kwargs['validators'] = list(kwargs['validators'])
+    if 'style' in kwargs:
+        kwargs['style'] = dict(kwargs['style'])
+    return kwargs
+
+
+def _cached_kwargs(func):
+    """
+    Memoize a `(field_name, model_field_or_relation_info) -> kwargs` function
+    per active language, returning a fresh copy of the keyword arguments to
+    every caller.
+    """
+    @functools.wraps(func)
+    def wrapper(field_name, info):
+        key = (func.__name__, field_name, info, get_language())
+        try:
+            kwargs = _kwargs_cache[key]
+        except KeyError:
+            kwargs = _kwargs_cache[key] = func(field_name, info)
+        return _copy_kwargs(kwargs)
+    return wrapper
+
+
+def has_dynamic_limit_choices_to(model_field):
+    """
+    Returns `True` if the relational model field restricts its choices with
+    a callable, which must be re-evaluated each time a field is built.
+    """
+    remote_field = model_field and model_field.remote_field
+    return remote_field is not None and callable(getattr(remote_field, 'limit_choices_to', None))
+
+
 class ClassLookupDict:
     """
     Takes a dictionary with classes as keys.
@@ -85,6 +141,7 @@ def get_unique_validators(field_name, model_field):
         )
 
 
+@_cached_kwargs
 def get_field_kwargs(field_name, model_field):
     """
     Creates a default instance of a basic non-relational field.
@@ -251,6 +308,12 @@ def get_relation_kwargs(field_name, relation_info):
     """
     Creates a default instance of a flat relational field.
     """
+    if has_dynamic_limit_choices_to(relation_info.model_field):
+        return _get_relation_kwargs(field_name, relation_info)
+    return _get_cached_relation_kwargs(field_name, relation_info)
+
+
+def _get_relation_kwargs(field_name, relation_info):
     model_field, related_model, to_many, to_field, has_through_model, reverse = relation_info
     kwargs = {
         'queryset': related_model._default_manager,
@@ -304,6 +367,9 @@ def get_relation_kwargs(field_name, relation_info):
     return kwargs
 
 
+_get_cached_relation_kwargs = _cached_kwargs(_get_relation_kwargs)
+
+
 def get_nested_relation_kwargs(relation_info):
     kwargs = {'read_only': True}
     if relation_info.to_many:
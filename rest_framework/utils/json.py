@@ -8,6 +8,8 @@ handled by users at the renderer and parser layer.
 import functools
 import json  # noqa
 
+JSONDecodeError = json.JSONDecodeError
+
 
 def strict_constant(o):
     raise ValueError('Out of range float values are not JSON compliant: ' + repr(o))
@@ -0,0 +1,186 @@
+"""
+JSON backends are used by `JSONRenderer` and `JSONParser` to encode and
+decode JSON, and are selected using the `JSON_BACKEND` setting.
+
+`StandardJSONBackend` uses the builtin json module. `OrjsonBackend` uses
+`orjson` if it is installed, and falls back to the builtin json module for
+any data that `orjson` wouldn't handle in exactly the same way.
+"""
+import codecs
+
+from rest_framework.compat import orjson
+from rest_framework.utils import encoders, json
+
+SCALAR_TYPES = frozenset([str, int, bool, type(None)])
+
+# Translates digits to `0` and every other byte to a space.
+DIGITS_TABLE = bytes(0x30 if byte in b'0123456789' else 0x20 for byte in range(256))
+
+
+def escape_line_separators(ret):
+    # We always fully escape \u2028 and \u2029 to ensure we output JSON
+    # that is a strict javascript subset.
+    # See: https://gist.github.com/damncabbage/623b879af56f850a6ddc
+    return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+
+def contains_long_number(data):
+    """
+    Returns `True` if the bytestring `data` contains a run of 19 or more
+    digits, which may be an integer that doesn't fit in 64 bits.
+    """
+    return b'0' * 19 in data.translate(DIGITS_TABLE)
+
+
+def contains_non_finite_float(value):
+    """
+    Returns `True` if `value`, or the lists, tuples and dicts it contains,
+    include a `NaN` or infinite float.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        items = value.values()
+    elif value_type is list or value_type is tuple:
+        items = value
+    elif isinstance(value, float):
+        # `NaN` and infinite floats are the only ones where this is `NaN`.
+        return value - value != 0.0
+    elif isinstance(value, dict):
+        items = value.values()
+    elif isinstance(value, (list, tuple)):
+        items = value
+    else:
+        return False
+
+    for item in items:
+        if type(item) in SCALAR_TYPES:
+            continue
+        if contains_non_finite_float(item):
+            return True
+    return False
+
+
+class BaseJSONBackend:
+    """
+    All JSON backends should extend this class, and override the `.dumps()`
+    and `.loads()` methods.
+    """
+
+    def dumps(self, data, cls, indent=None, ensure_ascii=True,
+              allow_nan=False, separators=None):
+        """
+        Encode `data` as JSON, returning a bytestring. The arguments have
+        the same meaning as those of `json.dumps()`.
+        """
+        raise NotImplementedError('.dumps() must be overridden.')
+
+    def loads(self, data, encoding='utf-8', parse_constant=None):
+        """
+        Decode the bytestring `data`, which is encoded using `encoding`.
+        """
+        raise NotImplementedError('.loads() must be overridden.')
+
+
+class StandardJSONBackend(BaseJSONBackend):
+    """
+    Encodes and decodes JSON using the builtin json module.
+    """
+
+    def dumps(self, data, cls, indent=None, ensure_ascii=True,
+              allow_nan=False, separators=None):
+        encoder = cls(
+            indent=indent, ensure_ascii=ensure_ascii,
+            allow_nan=allow_nan, separators=separators
+        )
+        return escape_line_separators(encoder.encode(data).encode())
+
+    def loads(self, data, encoding='utf-8', parse_constant=None):
+        return json.loads(data.decode(encoding), parse_constant=parse_constant)
+
+
+class OrjsonBackend(StandardJSONBackend):
+    """
+    Encodes and decodes JSON using `orjson`, if it is installed.
+
+    `orjson` only produces UTF-8 output, in the compact style or indented
+    by two spaces, so other styles are encoded using the builtin json module.
+    Data that `orjson` can't encode in the same way as the encoder class, such
+    as `NaN`, integers that don't fit in 64 bits, or dictionaries with keys
+    that aren't strings, is also encoded using the builtin json module.
+
+    Values that aren't natively supported are converted using the `.default()`
+    method of the encoder class. Note that floats in exponent notation are
+    formatted as `1e16` rather than `1e+16`.
+    """
+
+    def get_dumps_option(self, cls, indent, ensure_ascii, separators):
+        """
+        Returns the `orjson` option flags that match the given arguments,
+        or `None` if the builtin json module must be used.
+        """
+        if orjson is None or ensure_ascii:
+            return None
+        if cls.encode is not encoders.JSONEncoder.encode or cls.iterencode is not encoders.JSONEncoder.iterencode:
+            return None
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if indent is None and separators == (',', ':'):
+            return option
+        if indent == 2 and separators == (',', ': '):
+            return option | orjson.OPT_INDENT_2
+        return None
+
+    def dumps(self, data, cls, indent=None, ensure_ascii=True,
+              allow_nan=False, separators=None):
+        option = self.get_dumps_option(cls, indent, ensure_ascii, separators)
+        if option is None:
+            return super().dumps(
+                data, cls, indent=indent, ensure_ascii=ensure_ascii,
+                allow_nan=allow_nan, separators=separators
+            )
+
+        encoder = cls(
+            indent=indent, ensure_ascii=ensure_ascii,
+            allow_nan=allow_nan, separators=separators
+        )
+        # Values returned by `.default()` are kept, so that iterators that
+        # have already been consumed are not lost if we fall back.
+        converted = {}
+
+        def default(obj):
+            value = encoder.default(obj)
+            converted[id(obj)] = (obj, value)
+            if contains_non_finite_float(value):
+                raise ValueError('Out of range float values are not handled by orjson.')
+            return value
+
+        try:
+            ret = orjson.dumps(data, default=default, option=option)
+        except orjson.JSONEncodeError:
+            ret = None
+        else:
+            # `orjson` encodes `NaN` and infinite floats as `null`.
+            if b'null' in ret and contains_non_finite_float(data):
+                ret = None
+
+        if ret is None:
+            def fallback_default(obj):
+                if id(obj) in converted:
+                    return converted[id(obj)][1]
+                return cls.default(encoder, obj)
+
+            encoder.default = fallback_default
+            return escape_line_separators(encoder.encode(data).encode())
+        return escape_line_separators(ret)
+
+    def loads(self, data, encoding='utf-8', parse_constant=None):
+        if (
+            orjson is None or codecs.lookup(encoding).name != 'utf-8' or
+            contains_long_number(data)
+        ):
+            return super().loads(data, encoding=encoding, parse_constant=parse_constant)
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Let the builtin json module either accept the input, such as
+            # `NaN` or lone surrogates, or raise the same error as usual.
+            return super().loads(data, encoding=encoding, parse_constant=parse_constant)
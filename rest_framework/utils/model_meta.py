@@ -4,9 +4,17 @@ with a model class. This includes returning all the forward and reverse
 relationships and their associated metadata.
 
 Usage: `get_field_info(model)` returns a `FieldInfo` instance.
+
+Model metadata does not change once the app registry is ready, so results
+are cached per concrete model class. Use `clear_cache()` to discard them.
 """
 from collections import namedtuple
 
+from django.core.signals import setting_changed
+from django.db import models
+
+from rest_framework.compat import get_referenced_base_fields_from_q
+
 FieldInfo = namedtuple('FieldInfo', [
     'pk',  # Model field instance
     'fields',  # Dict of field name -> model field instance
@@ -26,13 +34,39 @@ RelationInfo = namedtuple('RelationInfo', [
 ])
 
 
+_field_info_cache = {}
+_unique_together_cache = {}
+
+
+def clear_cache():
+    """
+    Discard the cached metadata for all model classes.
+    """
+    _field_info_cache.clear()
+    _unique_together_cache.clear()
+
+
+def _clear_cache_on_setting_changed(*, setting, **kwargs):
+    if setting == 'INSTALLED_APPS':
+        clear_cache()
+
+
+setting_changed.connect(_clear_cache_on_setting_changed)
+
+
 def get_field_info(model):
     """
     Given a model class, returns a `FieldInfo` instance, which is a
     `namedtuple`, containing metadata about the various field types on the model
     including information about their relationships.
+
+    The returned instance is shared, and must not be modified.
     """
     opts = model._meta.concrete_model._meta
+    try:
+        return _field_info_cache[opts.model]
+    except KeyError:
+        pass
 
     pk = _get_pk(opts)
     fields = _get_fields(opts)
@@ -41,8 +75,40 @@ def get_field_info(model):
     fields_and_pk = _merge_fields_and_pk(pk, fields)
     relationships = _merge_relationships(forward_relations, reverse_relations)
 
-    return FieldInfo(pk, fields, forward_relations, reverse_relations,
+    info = FieldInfo(pk, fields, forward_relations, reverse_relations,
                      fields_and_pk, relationships)
+    _field_info_cache[opts.model] = info
+    return info
+
+
+def get_unique_together_constraints(model):
+    """
+    Given a model class, returns a list of
+    (fields, queryset, condition_fields, condition) tuples, each describing
+    a unique together constraint on `fields` in `queryset` with respect of
+    the constraint's `condition`. Constraints on parent models are included.
+
+    The returned list is shared, and must not be modified.
+    """
+    try:
+        return _unique_together_cache[model]
+    except KeyError:
+        pass
+
+    constraints = []
+    for parent_class in [model] + list(model._meta.parents):
+        for unique_together in parent_class._meta.unique_together:
+            constraints.append((unique_together, model._default_manager, [], None))
+        for constraint in parent_class._meta.constraints:
+            if isinstance(constraint, models.UniqueConstraint) and len(constraint.fields) > 1:
+                if constraint.condition is None:
+                    condition_fields = []
+                else:
+                    condition_fields = list(get_referenced_base_fields_from_q(constraint.condition))
+                constraints.append((constraint.fields, model._default_manager, condition_fields, constraint.condition))
+
+    _unique_together_cache[model] = constraints
+    return constraints
 
 
 def _get_pk(opts):
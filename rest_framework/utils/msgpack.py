@@ -0,0 +1,245 @@
+"""
+Encodes and decodes MessagePack, using the `msgpack` package if it is
+installed, or otherwise a pure Python implementation of the same subset of
+the format.
+
+Both implementations encode strings as `str` and bytestrings as `bin`, and
+decode arrays as lists. Extension types are not supported.
+"""
+import struct
+
+from rest_framework.compat import msgpack
+
+_FIXINTS = [bytes([value]) for value in range(128)]
+_FIXMAP_MARKERS = [bytes([0x80 | length]) for length in range(16)]
+_FIXSTR_MARKERS = [bytes([0xa0 | length]) for length in range(32)]
+_FLOAT = struct.Struct('>d').pack
+_NEGATIVE_FIXINTS = [bytes([value & 0xff]) for value in range(-32, 0)]
+
+
+def _pack_length(parts, length, fix_marker, fix_size, markers):
+    """
+    Append the header of a string, bytestring, array or map of `length`
+    items, using the fixed size form if there is one and it fits.
+    """
+    if length < fix_size:
+        parts.append(bytes([fix_marker | length]))
+        return
+    for marker, fmt, limit in markers:
+        if length < limit:
+            parts.append(marker + struct.pack(fmt, length))
+            return
+    raise ValueError('MessagePack can only encode up to 2**32 - 1 items.')
+
+
+_STR_MARKERS = ((b'\xd9', '>B', 1 << 8), (b'\xda', '>H', 1 << 16), (b'\xdb', '>I', 1 << 32))
+_BIN_MARKERS = ((b'\xc4', '>B', 1 << 8), (b'\xc5', '>H', 1 << 16), (b'\xc6', '>I', 1 << 32))
+_ARRAY_MARKERS = ((b'\xdc', '>H', 1 << 16), (b'\xdd', '>I', 1 << 32))
+_MAP_MARKERS = ((b'\xde', '>H', 1 << 16), (b'\xdf', '>I', 1 << 32))
+
+
+def _pack_int(parts, value):
+    if 0 <= value < 128:
+        parts.append(_FIXINTS[value])
+    elif -32 <= value < 0:
+        parts.append(_NEGATIVE_FIXINTS[value + 32])
+    elif value >= 0:
+        if value < 1 << 8:
+            parts.append(b'\xcc' + struct.pack('>B', value))
+        elif value < 1 << 16:
+            parts.append(b'\xcd' + struct.pack('>H', value))
+        elif value < 1 << 32:
+            parts.append(b'\xce' + struct.pack('>I', value))
+        elif value < 1 << 64:
+            parts.append(b'\xcf' + struct.pack('>Q', value))
+        else:
+            raise OverflowError('Integer value out of range.')
+    elif value >= -(1 << 7):
+        parts.append(b'\xd0' + struct.pack('>b', value))
+    elif value >= -(1 << 15):
+        parts.append(b'\xd1' + struct.pack('>h', value))
+    elif value >= -(1 << 31):
+        parts.append(b'\xd2' + struct.pack('>i', value))
+    elif value >= -(1 << 63):
+        parts.append(b'\xd3' + struct.pack('>q', value))
+    else:
+        raise OverflowError('Integer value out of range.')
+
+
+def _pack(parts, obj, default):
+    # Fast paths for the exact builtin types of most values.
+    obj_type = type(obj)
+    if obj_type is str:
+        data = obj.encode('utf-8', 'surrogatepass')
+        if len(data) < 32:
+            parts.append(_FIXSTR_MARKERS[len(data)])
+        else:
+            _pack_length(parts, len(data), 0xa0, 32, _STR_MARKERS)
+        parts.append(data)
+        return
+    elif obj_type is int:
+        if 0 <= obj < 128:
+            parts.append(_FIXINTS[obj])
+            return
+    elif obj_type is float:
+        parts.append(b'\xcb' + _FLOAT(obj))
+        return
+    elif obj_type is dict:
+        if len(obj) < 16:
+            parts.append(_FIXMAP_MARKERS[len(obj)])
+            for key, value in obj.items():
+                _pack(parts, key, default)
+                _pack(parts, value, default)
+            return
+
+    if obj is None:
+        parts.append(b'\xc0')
+    elif obj is True:
+        parts.append(b'\xc3')
+    elif obj is False:
+        parts.append(b'\xc2')
+    elif isinstance(obj, str):
+        data = obj.encode('utf-8', 'surrogatepass')
+        _pack_length(parts, len(data), 0xa0, 32, _STR_MARKERS)
+        parts.append(data)
+    elif isinstance(obj, int):
+        _pack_int(parts, int(obj))
+    elif isinstance(obj, float):
+        parts.append(b'\xcb' + _FLOAT(obj))
+    elif isinstance(obj, dict):
+        _pack_length(parts, len(obj), 0x80, 16, _MAP_MARKERS)
+        for key, value in obj.items():
+            _pack(parts, key, default)
+            _pack(parts, value, default)
+    elif isinstance(obj, (list, tuple)):
+        _pack_length(parts, len(obj), 0x90, 16, _ARRAY_MARKERS)
+        for item in obj:
+            _pack(parts, item, default)
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        data = bytes(obj)
+        _pack_length(parts, len(data), 0, 0, _BIN_MARKERS)
+        parts.append(data)
+    elif default is not None:
+        _pack(parts, default(obj), default)
+    else:
+        raise TypeError('Object of type %s is not MessagePack serializable.' % type(obj).__name__)
+
+
+class _Unpacker:
+    """
+    Decodes a single MessagePack object from a bytestring.
+    """
+    # The struct format, and size, of the fixed size values, by marker.
+    values = {
+        0xca: ('>f', 4), 0xcb: ('>d', 8),
+        0xcc: ('>B', 1), 0xcd: ('>H', 2), 0xce: ('>I', 4), 0xcf: ('>Q', 8),
+        0xd0: ('>b', 1), 0xd1: ('>h', 2), 0xd2: ('>i', 4), 0xd3: ('>q', 8),
+    }
+    # The struct format, and size, of the lengths of variable size values.
+    lengths = {
+        0xc4: ('>B', 1, bytes), 0xc5: ('>H', 2, bytes), 0xc6: ('>I', 4, bytes),
+        0xd9: ('>B', 1, str), 0xda: ('>H', 2, str), 0xdb: ('>I', 4, str),
+        0xdc: ('>H', 2, list), 0xdd: ('>I', 4, list),
+        0xde: ('>H', 2, dict), 0xdf: ('>I', 4, dict),
+    }
+
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def read(self, size):
+        start = self.pos
+        self.pos += size
+        if self.pos > len(self.data):
+            raise ValueError('Unexpected end of data.')
+        return self.data[start:self.pos]
+
+    def read_struct(self, fmt, size):
+        return struct.unpack(fmt, self.read(size))[0]
+
+    def unpack(self):
+        marker = self.read(1)[0]
+        if marker < 0x80:
+            return marker
+        elif marker >= 0xe0:
+            return marker - 0x100
+        elif marker < 0x90:
+            return self.unpack_map(marker & 0x0f)
+        elif marker < 0xa0:
+            return self.unpack_array(marker & 0x0f)
+        elif marker < 0xc0:
+            return self.unpack_str(marker & 0x1f)
+        elif marker == 0xc0:
+            return None
+        elif marker == 0xc2:
+            return False
+        elif marker == 0xc3:
+            return True
+        elif marker in self.values:
+            return self.read_struct(*self.values[marker])
+        elif marker in self.lengths:
+            fmt, size, value_type = self.lengths[marker]
+            length = self.read_struct(fmt, size)
+            if value_type is bytes:
+                return bytes(self.read(length))
+            elif value_type is str:
+                return self.unpack_str(length)
+            elif value_type is list:
+                return self.unpack_array(length)
+            return self.unpack_map(length)
+        raise ValueError('Unsupported MessagePack type 0x%02x.' % marker)
+
+    def unpack_str(self, length):
+        return str(self.read(length), 'utf-8', 'surrogatepass')
+
+    def unpack_array(self, length):
+        return [self.unpack() for index in range(length)]
+
+    def unpack_map(self, length):
+        ret = {}
+        for index in range(length):
+            key = self.unpack()
+            try:
+                ret[key] = self.unpack()
+            except TypeError:
+                raise ValueError('Map keys must be hashable.')
+        return ret
+
+
+def packb(data, default=None):
+    """
+    Encode `data` as MessagePack, returning a bytestring. Values that aren't
+    supported are converted by `default`, as with `json.dumps()`.
+    """
+    if msgpack is not None:
+        return msgpack.packb(data, default=default, use_bin_type=True)
+    parts = []
+    _pack(parts, data, default)
+    return b''.join(parts)
+
+
+def _reject_ext_type(code, data):
+    raise ValueError('Unsupported MessagePack extension type %d.' % code)
+
+
+def unpackb(data):
+    """
+    Decode the MessagePack bytestring `data`. Raises `ValueError` if the data
+    is invalid, or contains more than one object.
+    """
+    if msgpack is not None:
+        try:
+            return msgpack.unpackb(
+                data, raw=False, strict_map_key=False, ext_hook=_reject_ext_type
+            )
+        except (msgpack.UnpackException, TypeError) as exc:
+            raise ValueError(str(exc))
+
+    unpacker = _Unpacker(memoryview(data))
+    try:
+        ret = unpacker.unpack()
+    except RecursionError:
+        raise ValueError('Data is nested too deeply.')
+    if unpacker.pos != len(data):
+        raise ValueError('Extra data after the MessagePack object.')
+    return ret
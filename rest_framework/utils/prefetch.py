@@ -0,0 +1,215 @@
+"""
+Helper functions for deriving the `select_related()`, `prefetch_related()`
+and `only()` lookups that a serializer needs, so that serializing a list of
+model instances does not run additional queries for every instance.
+
+Serializers that only read plain columns of the model can instead be given
+the dictionaries returned by `values()`, avoiding model instantiation.
+
+Usage: `get_related_lookups(serializer, model)` returns a `RelatedLookups`
+instance, and `optimize_queryset(queryset, serializer)` applies it.
+"""
+from collections import namedtuple
+
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.query import QuerySet
+from django.db.models.query_utils import DeferredAttribute
+
+from rest_framework.fields import Field
+from rest_framework.relations import (
+    HyperlinkedIdentityField, ManyRelatedField, RelatedField
+)
+from rest_framework.serializers import (
+    BaseSerializer, ListSerializer, Serializer
+)
+from rest_framework.utils import model_meta
+
+RelatedLookups = namedtuple('RelatedLookups', [
+    'select_related',  # List of lookups for `select_related()`
+    'prefetch_related',  # List of lookups for `prefetch_related()`
+    'only',  # List of lookups for `only()`, or `None` if they can't be determined
+    'values'  # List of fields for `values()`, or `None` if instances are required
+])
+
+
+class _LookupCollector:
+    """
+    Walks the readable fields of a serializer, following each field's
+    `source` through the model's relationships.
+
+    Forward and reverse one-to-one relationships are joined using
+    `select_related()`, and anything reached through a to-many relationship
+    is loaded using `prefetch_related()`. The concrete columns read from
+    the model and its joined relations are collected for `only()`, unless a
+    field reads something that isn't a model field, such as a property or
+    a `SerializerMethodField`.
+
+    If every field of the top level serializer reads a plain column of the
+    model, those columns are also collected for `values()`.
+    """
+    def __init__(self):
+        self.select_related = {}
+        self.prefetch_related = {}
+        self.only = {}
+        self.values = {}
+        # Joined relations that must be loaded with all of their columns.
+        self.complete_relations = set()
+        self.can_restrict_columns = True
+        self.can_use_values = True
+
+    def add_column(self, lookup, prefetching):
+        if not prefetching:
+            self.only[lookup] = None
+
+    def visit_serializer(self, serializer, model, prefix, prefetching):
+        if prefix or type(serializer).to_representation is not Serializer.to_representation:
+            self.can_use_values = False
+        for field in serializer._readable_fields:
+            self.visit_field(field, model, prefix, prefetching)
+
+    def visit_field(self, field, model, prefix, prefetching):
+        if isinstance(field, BaseSerializer) or type(field).get_attribute is not Field.get_attribute:
+            self.can_use_values = False
+
+        if isinstance(field, HyperlinkedIdentityField):
+            # The object's own URL is built from its `lookup_field`.
+            self.visit_path(field, field.lookup_field.split(LOOKUP_SEP), model, prefix, prefetching)
+            return
+
+        if not field.source_attrs:
+            # `source='*'` passes the complete object to the field.
+            self.can_use_values = False
+            if isinstance(field, BaseSerializer):
+                self.visit_serializer(field, model, prefix, prefetching)
+            else:
+                self.can_restrict_columns = False
+            return
+
+        self.visit_path(field, field.source_attrs, model, prefix, prefetching)
+
+    def visit_path(self, field, attrs, model, prefix, prefetching):
+        target = field.child if isinstance(field, ListSerializer) else field
+        if isinstance(target, ManyRelatedField):
+            target = target.child_relation
+
+        for index, attr in enumerate(attrs):
+            info = model_meta.get_field_info(model)
+            is_last = index == len(attrs) - 1
+
+            if attr in info.relations:
+                self.can_use_values = False
+                relation_info = info.relations[attr]
+                lookup = prefix + attr
+                if is_last and self.reads_foreign_key(target, relation_info):
+                    # The related pk is read from the foreign key column.
+                    self.add_column(lookup, prefetching)
+                    return
+                if relation_info.to_many or prefetching:
+                    prefetching = True
+                    self.prefetch_related[lookup] = None
+                else:
+                    self.select_related[lookup] = None
+                    if relation_info.reverse:
+                        self.can_restrict_columns = False
+                    self.add_column(lookup, prefetching)
+                model = relation_info.related_model
+                prefix = lookup + LOOKUP_SEP
+            elif attr in info.fields_and_pk and is_last:
+                model_field = info.fields_and_pk[attr]
+                # The primary key is always loaded.
+                if model_field is not info.pk:
+                    self.add_column(prefix + attr, prefetching)
+                # Fields with their own descriptor, such as `FileField`,
+                # wrap the column value on model instances.
+                if type(model_field).descriptor_class is DeferredAttribute:
+                    self.values[attr] = None
+                else:
+                    self.can_use_values = False
+                return
+            else:
+                # Properties, methods or attributes of a column's value.
+                self.can_restrict_columns = False
+                self.can_use_values = False
+                return
+
+        # The source refers to a related object.
+        if isinstance(target, BaseSerializer):
+            self.visit_serializer(target, model, prefix, prefetching)
+        elif not prefetching:
+            self.complete_relations.add(prefix[:-len(LOOKUP_SEP)])
+
+    def reads_foreign_key(self, field, relation_info):
+        return (
+            isinstance(field, RelatedField) and
+            field.use_pk_only_optimization() and
+            not relation_info.to_many and
+            not relation_info.reverse
+        )
+
+    def get_only(self):
+        if not self.can_restrict_columns:
+            return None
+        return [
+            lookup for lookup in self.only
+            if not any(
+                lookup.startswith(relation + LOOKUP_SEP)
+                for relation in self.complete_relations
+            )
+        ]
+
+    def get_values(self):
+        if not self.can_use_values:
+            return None
+        return list(self.values)
+
+
+def get_related_lookups(serializer, model):
+    """
+    Given a serializer instance and the model class of the objects it will
+    serialize, returns a `RelatedLookups` instance, which is a `namedtuple`
+    containing the lookups that avoid per-object queries.
+    """
+    if isinstance(serializer, ListSerializer):
+        serializer = serializer.child
+
+    collector = _LookupCollector()
+    collector.visit_serializer(serializer, model, prefix='', prefetching=False)
+    return RelatedLookups(
+        list(collector.select_related),
+        list(collector.prefetch_related),
+        collector.get_only(),
+        collector.get_values()
+    )
+
+
+def optimize_queryset(queryset, serializer, use_values=False):
+    """
+    Apply the lookups returned by `get_related_lookups()` to a queryset.
+
+    If `use_values` is set and the serializer only reads plain model columns,
+    the queryset is returned as a `values()` queryset of those columns, so
+    that it yields dictionaries instead of model instances.
+
+    Querysets that already restrict their columns using `only()`, `defer()`
+    or `values()` are left with the columns they select.
+    """
+    if not isinstance(queryset, QuerySet) or queryset._fields is not None:
+        return queryset
+
+    lookups = get_related_lookups(serializer, queryset.model)
+    deferred_names, defer = queryset.query.deferred_loading
+    can_use_values = (
+        lookups.values is not None and
+        defer and not deferred_names and
+        not queryset._prefetch_related_lookups
+    )
+    if use_values and can_use_values:
+        return queryset.values(*lookups.values)
+
+    if lookups.select_related:
+        queryset = queryset.select_related(*lookups.select_related)
+    if lookups.prefetch_related:
+        queryset = queryset.prefetch_related(*lookups.prefetch_related)
+    if lookups.only is not None and defer and not deferred_names:
+        queryset = queryset.only(*lookups.only)
+    return queryset
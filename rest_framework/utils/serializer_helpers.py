@@ -163,12 +163,19 @@ class BindingDict(MutableMapping):
     def __setitem__(self, key, field):
         self.fields[key] = field
         field.bind(field_name=key, parent=self.serializer)
+        self._discard_plan()
 
     def __getitem__(self, key):
         return self.fields[key]
 
     def __delitem__(self, key):
         del self.fields[key]
+        self._discard_plan()
+
+    def _discard_plan(self):
+        # Any compiled representation plan on the serializer is stale
+        # once the set of fields changes.
+        self.serializer.__dict__.pop('_compiled_plan', None)
 
     def __iter__(self):
         return iter(self.fields)
@@ -6,9 +6,14 @@ This gives us better separation of concerns, allows us to use single-step
 object creation, and makes it possible to switch between using the implicit
 `ModelSerializer` class and an equivalent explicit `Serializer` class.
 """
-from django.core.exceptions import FieldError
-from django.db import DataError
-from django.db.models import Exists
+import contextlib
+import functools
+import operator
+
+from django.core.exceptions import FieldDoesNotExist, FieldError
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import DataError, connections
+from django.db.models import Exists, Model, Q
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework.exceptions import ValidationError
@@ -43,6 +48,128 @@ def qs_filter(queryset, **kwargs):
         return queryset.none()
 
 
+class UniqueBatch:
+    """
+    Checks the values of a list of items against a queryset using a single
+    query, for validators that are run while a `ListSerializer` validates
+    its items.
+
+    The values that are looked up map to the primary keys of the existing
+    objects that match them. A value that was already checked for an earlier
+    item is also reported as a conflict, since saving both items would
+    break the uniqueness constraint.
+    """
+    def __init__(self, queryset, sources, values_list):
+        self.model_fields = [self.get_model_field(queryset.model, source) for source in sources]
+        self.existing = self.fetch(queryset, sources, values_list)
+        self.seen = set()
+
+    def get_model_field(self, model, source):
+        try:
+            model_field = model._meta.get_field(source)
+        except FieldDoesNotExist:
+            return None
+        if not model_field.concrete or model_field.many_to_many:
+            return None
+        return model_field.target_field if model_field.is_relation else model_field
+
+    def get_key(self, values):
+        """
+        Returns the values normalized in the same way as the database
+        compares them, or `None` if they can't be checked as part of the batch.
+        """
+        key = []
+        for model_field, value in zip(self.model_fields, values):
+            if model_field is None or value is None:
+                return None
+            if isinstance(value, Model):
+                value = value.pk
+            try:
+                key.append(model_field.to_python(value))
+            except (TypeError, ValueError, DjangoValidationError):
+                return None
+        key = tuple(key)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def fetch(self, queryset, sources, values_list):
+        keys = {}
+        for values in values_list:
+            key = self.get_key(values)
+            if key is not None:
+                keys[key] = None
+        keys = list(keys)
+        if not keys:
+            return {}
+
+        existing = {key: set() for key in keys}
+        max_query_params = connections[queryset.db].features.max_query_params
+        batch_size = max_query_params // len(sources) if max_query_params else len(keys)
+        try:
+            for start in range(0, len(keys), batch_size):
+                chunk = keys[start:start + batch_size]
+                if len(sources) == 1:
+                    condition = Q(**{sources[0] + '__in': [key[0] for key in chunk]})
+                else:
+                    condition = functools.reduce(operator.or_, (
+                        Q(**dict(zip(sources, key))) for key in chunk
+                    ))
+                for row in queryset.filter(condition).values_list(*sources, 'pk'):
+                    key = tuple(row[:-1])
+                    if key not in existing:
+                        # The database compares the values differently,
+                        # for example using a case-insensitive collation.
+                        return {}
+                    existing[key].add(row[-1])
+        except (TypeError, ValueError, DataError, FieldError):
+            return {}
+        return existing
+
+    def check(self, values, instance):
+        """
+        Returns `True` if the values conflict with an existing object, other
+        than `instance`, or with an earlier item. Returns `None` if the values
+        weren't looked up, and must be checked individually.
+        """
+        key = self.get_key(values)
+        if key is None or key not in self.existing:
+            return None
+        if key in self.seen:
+            return True
+        self.seen.add(key)
+        pks = self.existing[key]
+        if instance is not None:
+            pks = pks - {instance.pk}
+        return bool(pks)
+
+
+def get_unique_batch(owner, validator):
+    """
+    Returns the `UniqueBatch` that `validator` uses for `owner`, which is the
+    serializer field or serializer that it validates, if any.
+    """
+    return getattr(owner, '_unique_batches', {}).get(id(validator))
+
+
+@contextlib.contextmanager
+def use_unique_batch(owner, validator, batch):
+    # Validators may be shared between serializer instances, so the batch
+    # is stored on the serializer field or serializer being validated.
+    batches = owner.__dict__.setdefault('_unique_batches', {})
+    if id(validator) in batches:
+        yield
+        return
+
+    batches[id(validator)] = batch
+    try:
+        yield
+    finally:
+        del batches[id(validator)]
+
+
 class UniqueValidator:
     """
     Validator that corresponds to `unique=True` on a model field.
@@ -80,12 +207,33 @@ class UniqueValidator:
         # Determine the existing instance, if this is an update operation.
         instance = getattr(serializer_field.parent, 'instance', None)
 
-        queryset = self.queryset
-        queryset = self.filter_queryset(value, queryset, field_name)
-        queryset = self.exclude_current_instance(queryset, instance)
-        if qs_exists(queryset):
+        batch = get_unique_batch(serializer_field, self)
+        conflict = None if batch is None else batch.check((value,), instance)
+        if conflict is None:
+            queryset = self.queryset
+            queryset = self.filter_queryset(value, queryset, field_name)
+            queryset = self.exclude_current_instance(queryset, instance)
+            conflict = qs_exists(queryset)
+        if conflict:
             raise ValidationError(self.message, code='unique')
 
+    def batch_lookups(self, values, serializer_field):
+        """
+        Returns a context manager within which the internal values of a list
+        of items, `values`, are checked using a single query, and values that
+        are repeated within the list are rejected.
+        """
+        if (
+            self.lookup != 'exact' or
+            type(self).filter_queryset is not UniqueValidator.filter_queryset or
+            type(self).exclude_current_instance is not UniqueValidator.exclude_current_instance
+        ):
+            return contextlib.nullcontext()
+
+        field_name = serializer_field.source_attrs[-1]
+        batch = UniqueBatch(self.queryset, [field_name], [(value,) for value in values])
+        return use_unique_batch(serializer_field, self, batch)
+
     def __repr__(self):
         return '<%s(queryset=%s)>' % (
             self.__class__.__name__,
@@ -195,11 +343,45 @@ class UniqueTogetherValidator:
             else getattr(serializer.instance, source)
             for source in condition_sources
         }
-        if checked_values and None not in checked_values and qs_exists_with_condition(queryset, self.condition, condition_kwargs):
+        if not checked_values or None in checked_values:
+            return
+
+        batch = get_unique_batch(serializer, self)
+        conflict = None
+        if batch is not None:
+            values = [attrs[source] for source in checked_names]
+            conflict = batch.check(values, serializer.instance)
+        if conflict is None:
+            conflict = qs_exists_with_condition(queryset, self.condition, condition_kwargs)
+        if conflict:
             field_names = ', '.join(self.fields)
             message = self.message.format(field_names=field_names)
             raise ValidationError(message, code='unique')
 
+    def batch_lookups(self, attrs_list, serializer):
+        """
+        Returns a context manager within which the internal values of a list
+        of items, `attrs_list`, are checked using a single query, and sets of
+        values that are repeated within the list are rejected.
+
+        Validators with a `condition` check each item individually.
+        """
+        if (
+            self.condition is not None or
+            type(self).filter_queryset is not UniqueTogetherValidator.filter_queryset or
+            type(self).exclude_current_instance is not UniqueTogetherValidator.exclude_current_instance
+        ):
+            return contextlib.nullcontext()
+
+        sources = [serializer.fields[field_name].source for field_name in self.fields]
+        values_list = [
+            [attrs[source] for source in sources]
+            for attrs in attrs_list
+            if all(source in attrs for source in sources)
+        ]
+        batch = UniqueBatch(self.queryset, sources, values_list)
+        return use_unique_batch(serializer, self, batch)
+
     def __repr__(self):
         return '<{}({})>'.format(
             self.__class__.__name__,
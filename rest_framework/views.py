@@ -1,6 +1,9 @@
 """
 Provides an APIView class that is the base of all views in REST framework.
 """
+from inspect import isawaitable
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django import VERSION as DJANGO_VERSION
 from django.conf import settings
 from django.core.exceptions import PermissionDenied
@@ -12,12 +15,13 @@ from django.utils.encoding import smart_str
 from django.views.decorators.csrf import csrf_exempt
 from django.views.generic import View
 
-from rest_framework import exceptions, status
+from rest_framework import exceptions, status, throttling
 from rest_framework.request import Request
-from rest_framework.response import Response
+from rest_framework.response import Response, StreamingResponse
 from rest_framework.schemas import DefaultSchema
 from rest_framework.settings import api_settings
 from rest_framework.utils import formatting
+from rest_framework.utils.async_hooks import call_async
 
 
 def get_view_name(view):
@@ -147,7 +151,11 @@ class APIView(View):
 
         # Note: session based authentication is explicitly CSRF validated,
         # all other authentication is CSRF exempt.
-        return csrf_exempt(view)
+        view = csrf_exempt(view)
+        if cls.view_is_async and not iscoroutinefunction(view):
+            # `csrf_exempt` doesn't preserve coroutine views before Django 5.0.
+            markcoroutinefunction(view)
+        return view
 
     @property
     def allowed_methods(self):
@@ -361,8 +369,9 @@ class APIView(View):
         Raises an appropriate exception if the request is throttled.
         """
         throttle_durations = []
-        for throttle in self.get_throttles():
-            if not throttle.allow_request(request, self):
+        throttles = self.get_throttles()
+        for throttle, allowed in zip(throttles, self.evaluate_throttles(request, throttles)):
+            if not allowed:
                 throttle_durations.append(throttle.wait())
 
         if throttle_durations:
@@ -376,6 +385,77 @@ class APIView(View):
             duration = max(durations, default=None)
             self.throttled(request, duration)
 
+    def evaluate_throttles(self, request, throttles):
+        """
+        Given the view's throttles, return a list of whether each of them
+        allows the request.
+
+        Throttles that use the `SimpleRateThrottle` storage are evaluated
+        together, using one `get_many()` and `set_many()` call per cache.
+        """
+        return throttling.evaluate_throttles(throttles, request, self)
+
+    async def aperform_authentication(self, request):
+        """
+        The async variant of `.perform_authentication()`.
+        """
+        await request.auser()
+
+    async def acheck_permissions(self, request):
+        """
+        The async variant of `.check_permissions()`.
+        """
+        for permission in self.get_permissions():
+            if not await call_async(permission, 'has_permission', request, self):
+                self.permission_denied(
+                    request,
+                    message=getattr(permission, 'message', None),
+                    code=getattr(permission, 'code', None)
+                )
+
+    async def acheck_object_permissions(self, request, obj):
+        """
+        The async variant of `.check_object_permissions()`, which async
+        handlers should await once they have retrieved an object.
+        """
+        for permission in self.get_permissions():
+            if not await call_async(permission, 'has_object_permission', request, self, obj):
+                self.permission_denied(
+                    request,
+                    message=getattr(permission, 'message', None),
+                    code=getattr(permission, 'code', None)
+                )
+
+    async def acheck_throttles(self, request):
+        """
+        The async variant of `.check_throttles()`.
+        """
+        throttle_durations = []
+        throttles = self.get_throttles()
+        results = await call_async(self, 'evaluate_throttles', request, throttles)
+        for throttle, allowed in zip(throttles, results):
+            if not allowed:
+                throttle_durations.append(await call_async(throttle, 'wait'))
+
+        if throttle_durations:
+            durations = [
+                duration for duration in throttle_durations
+                if duration is not None
+            ]
+
+            duration = max(durations, default=None)
+            self.throttled(request, duration)
+
+    async def aevaluate_throttles(self, request, throttles):
+        """
+        The async variant of `.evaluate_throttles()`.
+
+        Throttles that can be batched are evaluated together in a single
+        thread, and the others using their `.aallow_request()` method if
+        they implement one.
+        """
+        return await throttling.aevaluate_throttles(throttles, request, self)
+
     def determine_version(self, request, *args, **kwargs):
         """
         If versioning is being used, then determine any API version for the
@@ -421,6 +501,28 @@ class APIView(View):
         self.check_permissions(request)
         self.check_throttles(request)
 
+    async def ainitial(self, request, *args, **kwargs):
+        """
+        The async variant of `.initial()`.
+
+        Authentication, permission and throttle checks are awaited, so that
+        their async variants are used where they are implemented.
+        """
+        self.format_kwarg = self.get_format_suffix(**kwargs)
+
+        # Perform content negotiation and store the accepted info on the request
+        neg = self.perform_content_negotiation(request)
+        request.accepted_renderer, request.accepted_media_type = neg
+
+        # Determine the API version, if versioning is in use.
+        version, scheme = self.determine_version(request, *args, **kwargs)
+        request.version, request.versioning_scheme = version, scheme
+
+        # Ensure that the incoming request is permitted
+        await call_async(self, 'perform_authentication', request)
+        await call_async(self, 'check_permissions', request)
+        await call_async(self, 'check_throttles', request)
+
     def finalize_response(self, request, response, *args, **kwargs):
         """
         Returns the final response object.
@@ -432,7 +534,7 @@ class APIView(View):
             % type(response)
         )
 
-        if isinstance(response, Response):
+        if isinstance(response, (Response, StreamingResponse)):
             if not getattr(request, 'accepted_renderer', None):
                 neg = self.perform_content_negotiation(request, force=True)
                 request.accepted_renderer, request.accepted_media_type = neg
@@ -492,7 +594,12 @@ class APIView(View):
         """
         `.dispatch()` is pretty much the same as Django's regular dispatch,
         but with extra hooks for startup, finalize, and exception handling.
+
+        Views with `async def` handlers are dispatched using `.adispatch()`.
         """
+        if self.view_is_async:
+            return self.adispatch(request, *args, **kwargs)
+
         self.args = args
         self.kwargs = kwargs
         request = self.initialize_request(request, *args, **kwargs)
@@ -517,6 +624,38 @@ class APIView(View):
         self.response = self.finalize_response(request, response, *args, **kwargs)
         return self.response
 
+    async def adispatch(self, request, *args, **kwargs):
+        """
+        The async variant of `.dispatch()`, used if the view's handlers are
+        coroutine functions.
+        """
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers  # deprecate?
+
+        try:
+            await call_async(self, 'initial', request, *args, **kwargs)
+
+            # Get the appropriate handler method
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(),
+                                  self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            # Handlers such as `.options()` may still be sync.
+            response = handler(request, *args, **kwargs)
+            if isawaitable(response):
+                response = await response
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
     def options(self, request, *args, **kwargs):
         """
         Handler method for HTTP 'OPTIONS' request.
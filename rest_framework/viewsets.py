@@ -19,7 +19,9 @@ automatically.
 from functools import update_wrapper
 from inspect import getmembers
 
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django import VERSION as DJANGO_VERSION
+from django.core.exceptions import ImproperlyConfigured
 from django.urls import NoReverseMatch
 from django.utils.decorators import classonlymethod
 from django.views.decorators.csrf import csrf_exempt
@@ -100,6 +102,16 @@ class ViewSetMixin:
             raise TypeError("%s() received both `name` and `suffix`, which are "
                             "mutually exclusive arguments." % (cls.__name__))
 
+        # The view is async if the actions it is bound to are coroutines.
+        handlers = [getattr(cls, action, None) for action in actions.values()]
+        is_async = [iscoroutinefunction(handler) for handler in handlers if handler is not None]
+        if any(is_async) and not all(is_async):
+            raise ImproperlyConfigured(
+                "%s actions %s must either be all sync or all async."
+                % (cls.__qualname__, ', '.join(sorted(set(actions.values()))))
+            )
+        view_is_async = bool(is_async) and all(is_async)
+
         def view(request, *args, **kwargs):
             self = cls(**initkwargs)
 
@@ -110,6 +122,7 @@ class ViewSetMixin:
             # so that we can later set the action attribute.
             # eg. `self.action = 'list'` on an incoming GET request.
             self.action_map = actions
+            self.view_is_async = view_is_async
 
             # Bind methods to actions
             # This is the bit that's different to a standard view
@@ -143,7 +156,13 @@ class ViewSetMixin:
         if DJANGO_VERSION >= (5, 1):
             view.login_required = False
 
-        return csrf_exempt(view)
+        if view_is_async:
+            markcoroutinefunction(view)
+        view = csrf_exempt(view)
+        if view_is_async and not iscoroutinefunction(view):
+            # `csrf_exempt` doesn't preserve coroutine views before Django 5.0.
+            markcoroutinefunction(view)
+        return view
 
     def initialize_request(self, request, *args, **kwargs):
         """
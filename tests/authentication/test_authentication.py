@@ -1,21 +1,27 @@
 import base64
+import datetime
 
 import pytest
 from django.conf import settings
-from django.contrib.auth.models import User
+from django.contrib.auth.models import User, update_last_login
+from django.core.cache import cache
 from django.http import HttpResponse
 from django.test import TestCase, override_settings
 from django.urls import include, path
+from django.utils import timezone
 
 from rest_framework import (
     HTTP_HEADER_ENCODING, exceptions, permissions, renderers, status
 )
 from rest_framework.authentication import (
-    BaseAuthentication, BasicAuthentication, RemoteUserAuthentication,
-    SessionAuthentication, TokenAuthentication
+    BaseAuthentication, BasicAuthentication, CachedTokenAuthentication,
+    HashedTokenAuthentication, RemoteUserAuthentication, SessionAuthentication,
+    TokenAuthentication
+)
+from rest_framework.authtoken.models import HashedToken, Token
+from rest_framework.authtoken.views import (
+    obtain_auth_token, obtain_hashed_token
 )
-from rest_framework.authtoken.models import Token
-from rest_framework.authtoken.views import obtain_auth_token
 from rest_framework.response import Response
 from rest_framework.test import APIClient, APIRequestFactory
 from rest_framework.views import APIView
@@ -63,6 +69,14 @@ urlpatterns = [
         'token/',
         MockView.as_view(authentication_classes=[TokenAuthentication])
     ),
+    path(
+        'cachedtoken/',
+        MockView.as_view(authentication_classes=[CachedTokenAuthentication])
+    ),
+    path(
+        'hashedtoken/',
+        MockView.as_view(authentication_classes=[HashedTokenAuthentication])
+    ),
     path(
         'customtoken/',
         MockView.as_view(authentication_classes=[CustomTokenAuthentication])
@@ -74,6 +88,7 @@ urlpatterns = [
         )
     ),
     path('auth-token/', obtain_auth_token),
+    path('auth-hashed-token/', obtain_hashed_token),
     path('auth/', include('rest_framework.urls', namespace='rest_framework')),
 ]
 
@@ -497,6 +512,169 @@ class TokenAuthTests(BaseTokenAuthTests, TestCase):
         assert response.data['token'] == self.key
 
 
+@override_settings(ROOT_URLCONF=__name__)
+class CachedTokenAuthTests(BaseTokenAuthTests, TestCase):
+    model = Token
+    path = '/cachedtoken/'
+
+    def setUp(self):
+        cache.clear()
+        CachedTokenAuthentication.get_local_cache().clear()
+        super().setUp()
+
+    def post(self, key):
+        return self.csrf_client.post(
+            self.path, {'example': 'example'}, format='json',
+            HTTP_AUTHORIZATION=self.header_prefix + key
+        )
+
+    def test_token_is_cached(self):
+        assert self.post(self.key).status_code == status.HTTP_200_OK
+        with self.assertNumQueries(0):
+            assert self.post(self.key).status_code == status.HTTP_200_OK
+
+        # The shared cache is used when the local cache has no entry.
+        CachedTokenAuthentication.get_local_cache().clear()
+        with self.assertNumQueries(0):
+            assert self.post(self.key).status_code == status.HTTP_200_OK
+
+    def test_unknown_key_is_cached(self):
+        assert self.post('unknown').status_code == status.HTTP_401_UNAUTHORIZED
+        with self.assertNumQueries(0):
+            assert self.post('unknown').status_code == status.HTTP_401_UNAUTHORIZED
+
+        # Creating a token with the key makes it valid immediately.
+        self.token.delete()
+        self.model.objects.create(key='unknown', user=self.user)
+        assert self.post('unknown').status_code == status.HTTP_200_OK
+
+    def test_revoked_token_fails_immediately(self):
+        assert self.post(self.key).status_code == status.HTTP_200_OK
+        self.token.delete()
+        assert self.post(self.key).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_revoked_token_fails_in_other_processes(self):
+        assert self.post(self.key).status_code == status.HTTP_200_OK
+        # Another process has no local entries, but shares the cache.
+        Token.objects.filter(key=self.key).delete()
+        CachedTokenAuthentication.get_local_cache().clear()
+        assert self.post(self.key).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_deactivated_user_fails_immediately(self):
+        assert self.post(self.key).status_code == status.HTTP_200_OK
+        self.user.is_active = False
+        self.user.save()
+        assert self.post(self.key).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_login_does_not_invalidate_tokens(self):
+        assert self.post(self.key).status_code == status.HTTP_200_OK
+        with self.assertNumQueries(1):
+            update_last_login(None, self.user)
+        with self.assertNumQueries(0):
+            assert self.post(self.key).status_code == status.HTTP_200_OK
+
+    def test_cache_keys_do_not_contain_token(self):
+        assert self.key not in CachedTokenAuthentication.get_cache_key(self.key)
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class HashedTokenAuthTests(TestCase):
+    path = '/hashedtoken/'
+
+    def setUp(self):
+        self.csrf_client = APIClient(enforce_csrf_checks=True)
+        self.user = User.objects.create_user('john', 'lennon@thebeatles.com', 'password')
+        self.token, self.key = HashedToken.objects.create_token(self.user)
+
+    def post(self, key):
+        return self.csrf_client.post(
+            self.path, {'example': 'example'}, format='json',
+            HTTP_AUTHORIZATION='Token ' + key
+        )
+
+    def test_key_is_not_stored(self):
+        prefix, secret = HashedToken.split_key(self.key)
+        assert prefix == self.token.prefix
+        assert secret not in self.token.digest
+        assert self.token.check_secret(secret)
+        assert not self.token.check_secret(secret + 'x')
+
+    def test_post_passing_token_auth(self):
+        assert self.post(self.key).status_code == status.HTTP_200_OK
+
+    def test_user_may_have_many_tokens(self):
+        token, key = HashedToken.objects.create_token(self.user, name='other')
+        assert key != self.key
+        assert self.post(key).status_code == status.HTTP_200_OK
+        assert self.post(self.key).status_code == status.HTTP_200_OK
+        assert self.user.hashed_tokens.count() == 2
+
+    def test_fail_wrong_secret(self):
+        assert self.post(self.token.prefix + '.wrong').status_code == status.HTTP_401_UNAUTHORIZED
+        assert self.post(self.token.prefix).status_code == status.HTTP_401_UNAUTHORIZED
+        assert self.post('unknown.secret').status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_fail_expired_token(self):
+        self.token.expires_at = timezone.now() - datetime.timedelta(seconds=1)
+        self.token.save()
+        response = self.post(self.key)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.data['detail'] == 'Token has expired.'
+
+        self.token.expires_at = timezone.now() + datetime.timedelta(days=1)
+        self.token.save()
+        assert self.post(self.key).status_code == status.HTTP_200_OK
+
+    def test_fail_inactive_user(self):
+        self.user.is_active = False
+        self.user.save()
+        assert self.post(self.key).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_last_used_writes_are_throttled(self):
+        with self.assertNumQueries(2):
+            assert self.post(self.key).status_code == status.HTTP_200_OK
+        self.token.refresh_from_db()
+        last_used = self.token.last_used
+        assert last_used is not None
+
+        # Within the interval, the token is only read.
+        with self.assertNumQueries(1):
+            assert self.post(self.key).status_code == status.HTTP_200_OK
+        self.token.refresh_from_db()
+        assert self.token.last_used == last_used
+
+        HashedToken.objects.filter(pk=self.token.pk).update(
+            last_used=last_used - datetime.timedelta(minutes=5)
+        )
+        with self.assertNumQueries(2):
+            assert self.post(self.key).status_code == status.HTTP_200_OK
+        self.token.refresh_from_db()
+        assert self.token.last_used > last_used
+
+    def test_obtain_hashed_token(self):
+        client = APIClient(enforce_csrf_checks=True)
+        response = client.post(
+            '/auth-hashed-token/', {'username': 'john', 'password': 'password'},
+            format='json'
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['expires_at'] is None
+        key = response.data['token']
+        assert key != self.key
+        assert self.post(key).status_code == status.HTTP_200_OK
+
+    def test_obtain_hashed_token_with_lifetime(self):
+        view = obtain_hashed_token.view_class.as_view(
+            token_model=HashedToken, token_lifetime=datetime.timedelta(hours=1)
+        )
+        request = factory.post('/', {'username': 'john', 'password': 'password'}, format='json')
+        response = view(request)
+        assert response.status_code == status.HTTP_200_OK
+        token = HashedToken.objects.get(prefix=HashedToken.split_key(response.data['token'])[0])
+        assert token.expires_at == response.data['expires_at']
+        assert token.expires_at > timezone.now() + datetime.timedelta(minutes=59)
+
+
 @override_settings(ROOT_URLCONF=__name__)
 class CustomTokenAuthTests(BaseTokenAuthTests, TestCase):
     model = CustomToken
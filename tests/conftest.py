@@ -8,6 +8,10 @@ def pytest_addoption(parser):
     parser.addoption('--staticfiles', action='store_true', default=False,
                      help='Run tests with static files collection, using manifest '
                           'staticfiles storage. Used for testing the distribution.')
+    parser.addoption('--compiled-representation', action='store_true', default=False,
+                     help='Run tests with the COMPILED_REPRESENTATION setting enabled.')
+    parser.addoption('--json-backend', default=None,
+                     help='Run tests with the given JSON_BACKEND setting.')
 
 
 def pytest_configure(config):
@@ -64,6 +68,14 @@ def pytest_configure(config):
         ),
     )
 
+    rest_framework_settings = {}
+    if config.getoption('--compiled-representation'):
+        rest_framework_settings['COMPILED_REPRESENTATION'] = True
+    if config.getoption('--json-backend'):
+        rest_framework_settings['JSON_BACKEND'] = config.getoption('--json-backend')
+    if rest_framework_settings:
+        settings.REST_FRAMEWORK = rest_framework_settings
+
     # guardian is optional
     try:
         import guardian  # NOQA
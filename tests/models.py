@@ -150,3 +150,9 @@ class CustomManagerModel(RESTFrameworkModel):
                                    help_text='OneToOneTarget',
                                    verbose_name='OneToOneTarget',
                                    on_delete=models.CASCADE)
+
+
+class CachedModel(RESTFrameworkModel):
+    text = models.CharField(max_length=100)
+    version = models.IntegerField(default=1)
+    modified = models.DateTimeField()
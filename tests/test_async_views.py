@@ -0,0 +1,296 @@
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase
+
+from rest_framework import exceptions, permissions, status, viewsets
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.throttling import BaseThrottle, UserRateThrottle
+from rest_framework.utils.async_hooks import call_async, has_async_variant
+from rest_framework.views import APIView
+
+factory = APIRequestFactory()
+
+
+class AsyncView(APIView):
+    async def get(self, request, *args, **kwargs):
+        return Response({'method': 'GET', 'user': str(request.user)})
+
+    async def post(self, request, *args, **kwargs):
+        return Response({'method': 'POST', 'data': request.data})
+
+
+class SyncView(APIView):
+    def get(self, request, *args, **kwargs):
+        return Response({'method': 'GET'})
+
+
+class AsyncErrorView(APIView):
+    async def get(self, request, *args, **kwargs):
+        raise exceptions.NotFound()
+
+
+class SyncAuthentication(BaseAuthentication):
+    def authenticate(self, request):
+        return (User(username='sync'), 'sync-token')
+
+
+class AsyncAuthentication(BaseAuthentication):
+    def authenticate(self, request):
+        raise AssertionError('.aauthenticate() should be awaited instead.')
+
+    async def aauthenticate(self, request):
+        return (User(username='async'), 'async-token')
+
+
+class FailingAsyncAuthentication(BaseAuthentication):
+    async def aauthenticate(self, request):
+        raise exceptions.AuthenticationFailed()
+
+    def authenticate_header(self, request):
+        return 'Failing'
+
+
+class DenyAsync(permissions.BasePermission):
+    message = 'Denied asynchronously.'
+
+    def has_permission(self, request, view):
+        raise AssertionError('.ahas_permission() should be awaited instead.')
+
+    async def ahas_permission(self, request, view):
+        return False
+
+
+class AllowSync(permissions.BasePermission):
+    def has_permission(self, request, view):
+        return True
+
+
+class DenyObjectSync(permissions.BasePermission):
+    def has_object_permission(self, request, view, obj):
+        return obj != 'denied'
+
+
+class IsAuthenticatedSync(permissions.IsAuthenticated):
+    def has_permission(self, request, view):
+        return False
+
+
+class AsyncThrottle(BaseThrottle):
+    async def aallow_request(self, request, view):
+        return False
+
+    def wait(self):
+        return 10
+
+
+class OncePerDayUserThrottle(UserRateThrottle):
+    rate = '1/day'
+
+
+class AsyncViewTests(TestCase):
+    def get(self, view, **initkwargs):
+        return async_to_sync(view.as_view(**initkwargs))(factory.get('/'))
+
+    def test_async_view_is_coroutine(self):
+        assert AsyncView.view_is_async
+        assert iscoroutinefunction(AsyncView.as_view())
+
+    def test_sync_view_is_unchanged(self):
+        assert not SyncView.view_is_async
+        assert not iscoroutinefunction(SyncView.as_view())
+        response = SyncView.as_view()(factory.get('/'))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {'method': 'GET'}
+
+    def test_get(self):
+        response = self.get(AsyncView)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {'method': 'GET', 'user': 'AnonymousUser'}
+
+    def test_post(self):
+        view = AsyncView.as_view()
+        request = factory.post('/', {'a': 1}, format='json')
+        response = async_to_sync(view)(request)
+        assert response.data == {'method': 'POST', 'data': {'a': 1}}
+
+    def test_sync_options_handler(self):
+        view = AsyncView.as_view()
+        response = async_to_sync(view)(factory.options('/'))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['name'] == 'Async'
+
+    def test_method_not_allowed(self):
+        view = AsyncView.as_view()
+        response = async_to_sync(view)(factory.put('/'))
+        assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+
+    def test_exception_is_handled(self):
+        response = self.get(AsyncErrorView)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_sync_authentication(self):
+        response = self.get(AsyncView, authentication_classes=[SyncAuthentication])
+        assert response.data['user'] == 'sync'
+
+    def test_async_authentication(self):
+        response = self.get(AsyncView, authentication_classes=[AsyncAuthentication])
+        assert response.data['user'] == 'async'
+
+    def test_failed_authentication(self):
+        response = self.get(
+            AsyncView,
+            authentication_classes=[FailingAsyncAuthentication],
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response['WWW-Authenticate'] == 'Failing'
+
+    def test_async_permission(self):
+        response = self.get(
+            AsyncView,
+            authentication_classes=[],
+            permission_classes=[AllowSync, DenyAsync],
+        )
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.data['detail'] == 'Denied asynchronously.'
+
+    def test_builtin_permission(self):
+        response = self.get(
+            AsyncView,
+            authentication_classes=[SyncAuthentication],
+            permission_classes=[permissions.IsAuthenticated],
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        response = self.get(
+            AsyncView,
+            authentication_classes=[FailingAsyncAuthentication],
+            permission_classes=[permissions.IsAuthenticated],
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_composed_permissions(self):
+        response = self.get(AsyncView, permission_classes=[AllowSync & ~DenyAsync])
+        assert response.status_code == status.HTTP_200_OK
+
+        response = self.get(AsyncView, permission_classes=[DenyAsync | IsAuthenticatedSync])
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_async_throttle(self):
+        response = self.get(AsyncView, throttle_classes=[AsyncThrottle])
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert response['Retry-After'] == '10'
+
+    def test_batched_throttle(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        response = self.get(AsyncView, throttle_classes=[OncePerDayUserThrottle])
+        assert response.status_code == status.HTTP_200_OK
+        response = self.get(AsyncView, throttle_classes=[OncePerDayUserThrottle])
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_object_permissions(self):
+        class ObjectView(APIView):
+            permission_classes = [DenyObjectSync]
+
+            async def get(self, request, *args, **kwargs):
+                await self.acheck_object_permissions(request, kwargs['obj'])
+                return Response()
+
+        view = ObjectView.as_view()
+        response = async_to_sync(view)(factory.get('/'), obj='allowed')
+        assert response.status_code == status.HTTP_200_OK
+        response = async_to_sync(view)(factory.get('/'), obj='denied')
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_overridden_sync_initial(self):
+        class InitialView(AsyncView):
+            def initial(self, request, *args, **kwargs):
+                super().initial(request, *args, **kwargs)
+                self.initialized = True
+
+            async def get(self, request, *args, **kwargs):
+                return Response({'initialized': self.initialized})
+
+        response = self.get(InitialView)
+        assert response.data == {'initialized': True}
+
+    def test_token_authentication(self):
+        from rest_framework.authentication import TokenAuthentication
+        from rest_framework.authtoken.models import Token
+
+        user = User.objects.create_user('token-user')
+        token = Token.objects.create(user=user)
+        view = AsyncView.as_view(authentication_classes=[TokenAuthentication])
+        request = factory.get('/', HTTP_AUTHORIZATION='Token %s' % token.key)
+        response = async_to_sync(view)(request)
+        assert response.data['user'] == 'token-user'
+
+
+class AsyncFunctionViewTests(TestCase):
+    def test_async_api_view(self):
+        @api_view(['GET'])
+        async def view(request):
+            return Response({'method': request.method})
+
+        assert iscoroutinefunction(view)
+        response = async_to_sync(view)(factory.get('/'))
+        assert response.data == {'method': 'GET'}
+
+    def test_sync_api_view(self):
+        @api_view(['GET'])
+        def view(request):
+            return Response({'method': request.method})
+
+        assert not iscoroutinefunction(view)
+        assert view(factory.get('/')).data == {'method': 'GET'}
+
+
+class AsyncViewSet(viewsets.ViewSet):
+    async def list(self, request):
+        return Response({'action': self.action})
+
+    async def retrieve(self, request, pk=None):
+        return Response({'action': self.action, 'pk': pk})
+
+    def create(self, request):
+        return Response({'action': self.action})
+
+
+class AsyncViewSetTests(TestCase):
+    def test_async_actions(self):
+        view = AsyncViewSet.as_view({'get': 'list'})
+        assert iscoroutinefunction(view)
+        response = async_to_sync(view)(factory.get('/'))
+        assert response.data == {'action': 'list'}
+
+        view = AsyncViewSet.as_view({'get': 'retrieve'})
+        response = async_to_sync(view)(factory.get('/'), pk='1')
+        assert response.data == {'action': 'retrieve', 'pk': '1'}
+
+    def test_sync_actions(self):
+        view = AsyncViewSet.as_view({'post': 'create'})
+        assert not iscoroutinefunction(view)
+        response = view(factory.post('/'))
+        assert response.data == {'action': 'create'}
+
+    def test_mixed_actions(self):
+        with self.assertRaises(ImproperlyConfigured):
+            AsyncViewSet.as_view({'get': 'list', 'post': 'create'})
+
+
+class AsyncHookTests(TestCase):
+    def test_has_async_variant(self):
+        assert has_async_variant(permissions.IsAuthenticated, 'has_permission')
+        assert not has_async_variant(IsAuthenticatedSync, 'has_permission')
+        assert not has_async_variant(SyncAuthentication, 'authenticate')
+        assert has_async_variant(AsyncAuthentication, 'authenticate')
+
+    def test_call_async_uses_sync_instance_override(self):
+        permission = permissions.AllowAny()
+        permission.has_permission = lambda request, view: False
+        assert not async_to_sync(call_async)(permission, 'has_permission', None, None)
@@ -1,3 +1,4 @@
+import datetime
 import importlib
 from io import StringIO
 
@@ -7,11 +8,14 @@ from django.contrib.auth.models import User
 from django.core.management import CommandError, call_command
 from django.db import IntegrityError
 from django.test import TestCase, modify_settings
+from django.utils import timezone
 
-from rest_framework.authtoken.admin import TokenAdmin
+from rest_framework.authtoken.admin import HashedTokenAdmin, TokenAdmin
 from rest_framework.authtoken.management.commands.drf_create_token import \
     Command as AuthTokenCommand
-from rest_framework.authtoken.models import Token
+from rest_framework.authtoken.management.commands.drf_purge_tokens import \
+    Command as PurgeTokensCommand
+from rest_framework.authtoken.models import HashedToken, Token
 from rest_framework.authtoken.serializers import AuthTokenSerializer
 from rest_framework.exceptions import ValidationError
 
@@ -133,3 +137,50 @@ class AuthTokenCommandTests(TestCase):
         self.assertIn('Generated token', out.getvalue())
         self.assertIn(self.user.username, out.getvalue())
         self.assertIn(token_saved.key, out.getvalue())
+
+
+class HashedTokenTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='test_user')
+
+    def test_create_token(self):
+        token, key = HashedToken.objects.create_token(self.user, name='laptop')
+        prefix, secret = HashedToken.split_key(key)
+        assert str(token) == prefix == token.prefix
+        assert token.digest == HashedToken.hash_secret(secret)
+        assert token.name == 'laptop'
+        assert not token.is_expired()
+
+    def test_split_malformed_key(self):
+        assert HashedToken.split_key('prefix') == ('prefix', '')
+        assert HashedToken.split_key('.secret') == ('', 'secret')
+
+    def test_model_admin_cannot_add_tokens(self):
+        token_admin = HashedTokenAdmin(HashedToken, site)
+        assert not token_admin.has_add_permission(object())
+
+
+class PurgeTokensCommandTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='test_user')
+        now = timezone.now()
+        for days in (-2, -1, 1):
+            HashedToken.objects.create_token(
+                self.user, expires_at=now + datetime.timedelta(days=days)
+            )
+        self.active, key = HashedToken.objects.create_token(self.user)
+
+    def test_purge_expired_tokens_in_batches(self):
+        with self.assertNumQueries(5):
+            deleted = PurgeTokensCommand().purge_expired_tokens(batch_size=1)
+        assert deleted == 2
+        assert HashedToken.objects.count() == 2
+        assert HashedToken.objects.filter(pk=self.active.pk).exists()
+
+    def test_command_output(self):
+        out = StringIO()
+        call_command('drf_purge_tokens', '--batch-size', '10', stdout=out)
+        self.assertIn('Deleted 2 expired tokens', out.getvalue())
+        assert HashedToken.objects.count() == 2
@@ -0,0 +1,320 @@
+import datetime
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from django.utils.http import http_date
+
+from rest_framework import permissions, serializers, status, viewsets
+from rest_framework.authentication import RemoteUserAuthentication
+from rest_framework.caching import (
+    ResponseCacheMixin, cache_response, etag_from_field,
+    last_modified_from_field
+)
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+from tests.models import CachedModel
+
+factory = APIRequestFactory()
+
+
+class CachedModelSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = CachedModel
+        fields = ('id', 'text', 'version')
+
+
+MODIFIED = datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+
+
+def fixed_etag(view, request, *args, **kwargs):
+    return 'abc'
+
+
+def fixed_last_modified(view, request, *args, **kwargs):
+    return MODIFIED
+
+
+class CountingView(APIView):
+    calls = 0
+
+    def handle(self, request):
+        type(self).calls += 1
+        return Response({'calls': self.calls, 'query': request.query_params.get('q')})
+
+
+class ConditionalView(CountingView):
+    @cache_response(etag_func=fixed_etag, last_modified_func=fixed_last_modified)
+    def get(self, request, *args, **kwargs):
+        return self.handle(request)
+
+
+class CachedView(CountingView):
+    @cache_response(timeout=60)
+    def get(self, request, *args, **kwargs):
+        return self.handle(request)
+
+    @cache_response(timeout=60)
+    def post(self, request, *args, **kwargs):
+        return self.handle(request)
+
+
+class HeadersView(CountingView):
+    @cache_response(etag_func=fixed_etag, timeout=60)
+    def get(self, request, *args, **kwargs):
+        response = self.handle(request)
+        response['Link'] = '</?page=2>; rel="next"'
+        response['Content-Language'] = 'en'
+        response['Vary'] = 'X-Tenant'
+        return response
+
+
+class UserView(CountingView):
+    authentication_classes = (RemoteUserAuthentication,)
+    permission_classes = (permissions.IsAuthenticated,)
+
+    @cache_response(timeout=60)
+    def get(self, request, *args, **kwargs):
+        response = self.handle(request)
+        response.data['username'] = request.user.username
+        return response
+
+
+class DeniedView(CountingView):
+    permission_classes = (permissions.IsAuthenticated,)
+
+    @cache_response(etag_func=fixed_etag, timeout=60)
+    def get(self, request, *args, **kwargs):
+        return self.handle(request)
+
+
+class AsyncCachedView(CountingView):
+    @cache_response(etag_func=fixed_etag, timeout=60)
+    async def get(self, request, *args, **kwargs):
+        return self.handle(request)
+
+
+class ConditionalRequestTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        ConditionalView.calls = 0
+
+    def test_validators_are_set(self):
+        response = ConditionalView.as_view()(factory.get('/'))
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] == '"abc"'
+        assert response['Last-Modified'] == http_date(MODIFIED.timestamp())
+
+    def test_if_none_match(self):
+        view = ConditionalView.as_view()
+        response = view(factory.get('/', HTTP_IF_NONE_MATCH='"abc"'))
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response['ETag'] == '"abc"'
+        assert ConditionalView.calls == 0
+
+        response = view(factory.get('/', HTTP_IF_NONE_MATCH='"other"'))
+        assert response.status_code == status.HTTP_200_OK
+        assert ConditionalView.calls == 1
+
+    def test_if_modified_since(self):
+        view = ConditionalView.as_view()
+        response = view(factory.get('/', HTTP_IF_MODIFIED_SINCE=http_date(MODIFIED.timestamp())))
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        earlier = MODIFIED - datetime.timedelta(days=1)
+        response = view(factory.get('/', HTTP_IF_MODIFIED_SINCE=http_date(earlier.timestamp())))
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_checks_run_first(self):
+        response = DeniedView.as_view()(factory.get('/', HTTP_IF_NONE_MATCH='"abc"'))
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_async_handler(self):
+        AsyncCachedView.calls = 0
+        view = AsyncCachedView.as_view()
+        response = async_to_sync(view)(factory.get('/', HTTP_IF_NONE_MATCH='"abc"'))
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        response = async_to_sync(view)(factory.get('/'))
+        response.render()
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] == '"abc"'
+
+        cached = async_to_sync(view)(factory.get('/'))
+        assert cached.content == response.content
+        assert cached['ETag'] == '"abc"'
+        assert AsyncCachedView.calls == 1
+
+
+class ResponseCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        CachedView.calls = 0
+
+    def get(self, path='/', **extra):
+        response = CachedView.as_view()(factory.get(path, **extra))
+        if hasattr(response, 'render'):
+            response.render()
+        return response
+
+    def test_response_is_cached(self):
+        first = self.get()
+        second = self.get()
+        assert first.status_code == second.status_code == status.HTTP_200_OK
+        assert first.content == second.content
+        assert first['Content-Type'] == second['Content-Type']
+        assert CachedView.calls == 1
+
+    def test_key_includes_query_and_renderer(self):
+        self.get('/?q=a')
+        assert self.get('/?q=b').data['query'] == 'b'
+        self.get('/?q=a', HTTP_ACCEPT='text/html')
+        assert CachedView.calls == 3
+        self.get('/?q=a', HTTP_ACCEPT='text/html')
+        assert CachedView.calls == 3
+
+    def test_key_includes_vary_headers(self):
+        self.get(HTTP_AUTHORIZATION='Token one')
+        self.get(HTTP_AUTHORIZATION='Token two')
+        self.get(HTTP_AUTHORIZATION='Token one')
+        assert CachedView.calls == 2
+
+    def test_headers_are_cached(self):
+        HeadersView.calls = 0
+        view = HeadersView.as_view()
+        first = view(factory.get('/')).render()
+        cached = view(factory.get('/'))
+        assert HeadersView.calls == 1
+        assert cached.content == first.content
+        for header in ('Content-Type', 'ETag', 'Link', 'Content-Language', 'Vary', 'Allow'):
+            assert cached[header] == first[header]
+
+    def test_key_includes_response_vary_headers(self):
+        HeadersView.calls = 0
+        view = HeadersView.as_view()
+        view(factory.get('/', HTTP_X_TENANT='one')).render()
+        view(factory.get('/', HTTP_X_TENANT='two')).render()
+        view(factory.get('/', HTTP_X_TENANT='one'))
+        assert HeadersView.calls == 2
+
+    @override_settings(AUTHENTICATION_BACKENDS=('django.contrib.auth.backends.RemoteUserBackend',))
+    def test_key_includes_user(self):
+        UserView.calls = 0
+        User.objects.create_user('alice')
+        User.objects.create_user('bob')
+        view = UserView.as_view()
+        for username in ('alice', 'bob', 'alice', 'bob'):
+            response = view(factory.get('/', REMOTE_USER=username))
+            if hasattr(response, 'render'):
+                response.render()
+            assert response.status_code == status.HTTP_200_OK
+            assert username.encode() in response.content
+        assert UserView.calls == 2
+
+    def test_unsafe_methods_are_not_cached(self):
+        view = CachedView.as_view()
+        view(factory.post('/'))
+        view(factory.post('/'))
+        assert CachedView.calls == 2
+
+
+class CachedModelViewSet(ResponseCacheMixin, viewsets.ModelViewSet):
+    queryset = CachedModel.objects.all()
+    serializer_class = CachedModelSerializer
+
+    @cache_response(etag_func=etag_from_field('version'), timeout=60)
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
+    @cache_response(etag_func=etag_from_field('version'), timeout=60)
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+
+class LastModifiedViewSet(CachedModelViewSet):
+    @cache_response(last_modified_func=last_modified_from_field('modified'))
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
+    @cache_response(last_modified_func=last_modified_from_field('modified'))
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+
+class GenericViewCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.instance = CachedModel.objects.create(text='one', modified=MODIFIED)
+        self.retrieve = CachedModelViewSet.as_view({'get': 'retrieve', 'put': 'update'})
+        self.list = CachedModelViewSet.as_view({'get': 'list', 'post': 'create'})
+
+    def test_etag_from_field(self):
+        response = self.retrieve(factory.get('/'), pk=self.instance.pk)
+        etag = response['ETag']
+
+        # The ETag is determined without fetching the object.
+        with self.assertNumQueries(1):
+            response = self.retrieve(factory.get('/', HTTP_IF_NONE_MATCH=etag), pk=self.instance.pk)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        CachedModel.objects.filter(pk=self.instance.pk).update(version=2)
+        response = self.retrieve(factory.get('/', HTTP_IF_NONE_MATCH=etag), pk=self.instance.pk)
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != etag
+
+    def test_missing_object(self):
+        response = self.retrieve(factory.get('/', HTTP_IF_NONE_MATCH='*'), pk=0)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_list_etag_reflects_every_object(self):
+        other = CachedModel.objects.create(text='two', version=5, modified=MODIFIED)
+        etag = self.list(factory.get('/'))['ETag']
+
+        # Changing an object other than the one with the greatest version.
+        CachedModel.objects.filter(pk=self.instance.pk).update(version=2)
+        response = self.list(factory.get('/', HTTP_IF_NONE_MATCH=etag))
+        assert response.status_code == status.HTTP_200_OK
+        etag = response['ETag']
+
+        other.delete()
+        response = self.list(factory.get('/', HTTP_IF_NONE_MATCH=etag))
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != etag
+
+    def test_last_modified_from_field(self):
+        retrieve = LastModifiedViewSet.as_view({'get': 'retrieve'})
+        response = retrieve(factory.get('/'), pk=self.instance.pk)
+        assert response['Last-Modified'] == http_date(MODIFIED.timestamp())
+
+        modified = http_date(MODIFIED.timestamp())
+        response = retrieve(factory.get('/', HTTP_IF_MODIFIED_SINCE=modified), pk=self.instance.pk)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        CachedModel.objects.filter(pk=self.instance.pk).update(modified=timezone.now())
+        response = retrieve(factory.get('/', HTTP_IF_MODIFIED_SINCE=modified), pk=self.instance.pk)
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_list_has_no_last_modified(self):
+        response = LastModifiedViewSet.as_view({'get': 'list'})(factory.get('/'))
+        assert response.status_code == status.HTTP_200_OK
+        assert not response.has_header('Last-Modified')
+
+    def get_list_content(self):
+        response = self.list(factory.get('/'))
+        if hasattr(response, 'render'):
+            response.render()
+        return response.content
+
+    def test_updates_invalidate_cached_responses(self):
+        content = self.get_list_content()
+        # The validators are unchanged, so the cached content is served.
+        CachedModel.objects.filter(pk=self.instance.pk).update(text='changed')
+        assert self.get_list_content() == content
+
+        data = {'text': 'updated'}
+        response = self.retrieve(factory.put('/', data, format='json'), pk=self.instance.pk)
+        assert response.status_code == status.HTTP_200_OK
+        assert b'updated' in self.get_list_content()
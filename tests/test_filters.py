@@ -1,9 +1,10 @@
 import datetime
+import gc
 from importlib import reload as reload_module
 
 import pytest
 from django.core.exceptions import ImproperlyConfigured
-from django.db import models
+from django.db import connection, models
 from django.db.models import CharField, Transform
 from django.db.models.functions import Concat, Upper
 from django.test import SimpleTestCase, TestCase
@@ -12,6 +13,7 @@ from django.test.utils import override_settings
 from rest_framework import filters, generics, serializers
 from rest_framework.compat import coreschema
 from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
 from rest_framework.test import APIRequestFactory
 
 factory = APIRequestFactory()
@@ -305,6 +307,137 @@ class SearchFilterTests(TestCase):
         ]
 
 
+class SearchBackendTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Virtual tables can't be created inside the test transaction.
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "CREATE VIRTUAL TABLE tests_searchfiltermodel_fts "
+                "USING fts5(title, text, content='')"
+            )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        with connection.cursor() as cursor:
+            cursor.execute('DROP TABLE tests_searchfiltermodel_fts')
+
+    def setUp(self):
+        texts = [
+            'red apples',
+            'apples, red apples and green apples',
+            'green pears',
+            'pineapples',
+        ]
+        for idx, text in enumerate(texts):
+            SearchFilterModel.objects.create(title='z' * (idx + 1), text=text)
+
+        with connection.cursor() as cursor:
+            for instance in SearchFilterModel.objects.all():
+                cursor.execute(
+                    'INSERT INTO tests_searchfiltermodel_fts (rowid, title, text) '
+                    'VALUES (%s, %s, %s)',
+                    [instance.pk, instance.title, instance.text]
+                )
+
+        class FTS5SearchFilter(filters.SearchFilter):
+            search_backend = filters.SQLiteFTS5SearchBackend
+
+        class SearchListView(generics.ListAPIView):
+            queryset = SearchFilterModel.objects.order_by('title')
+            serializer_class = SearchFilterSerializer
+            filter_backends = (FTS5SearchFilter,)
+            search_fields = ('title', 'text')
+
+        self.filter_class = FTS5SearchFilter
+        self.view = SearchListView
+
+    def search(self, term, **kwargs):
+        view = self.view.as_view(**kwargs)
+        response = view(factory.get('/', {'search': term}))
+        return [item['text'] for item in response.data]
+
+    def test_search_matches_words(self):
+        assert self.search('apples') == ['apples, red apples and green apples', 'red apples']
+        assert self.search('pears') == ['green pears']
+        assert self.search('pear') == []
+
+    def test_search_terms_must_all_match(self):
+        assert self.search('red green') == ['apples, red apples and green apples']
+        assert self.search('"red apples"') == ['red apples', 'apples, red apples and green apples']
+        assert self.search('"green red"') == []
+
+    def test_search_is_ordered_by_existing_ordering_without_rank(self):
+        self.filter_class.search_backend = type(
+            'UnrankedBackend', (filters.SQLiteFTS5SearchBackend,), {'order_by_rank': False}
+        )
+        assert self.search('apples') == ['red apples', 'apples, red apples and green apples']
+
+    def test_lookup_prefixes(self):
+        # Prefixed fields are still matched with lookups.
+        search_fields = ('=title', 'text')
+        assert self.search('zzz', search_fields=search_fields) == ['green pears']
+        assert self.search('zzz pears', search_fields=search_fields) == ['green pears']
+        assert self.search('zz', search_fields=search_fields) == ['apples, red apples and green apples']
+        search_fields = ('^text', '@title')
+        assert self.search('pine', search_fields=search_fields) == ['pineapples']
+
+    def test_uses_search_backend(self):
+        filter_ = self.filter_class()
+        queryset = SearchFilterModel.objects.all()
+        assert filter_.uses_search_backend('title', queryset)
+        assert filter_.uses_search_backend('@title', queryset)
+        assert not filter_.uses_search_backend('^title', queryset)
+        assert not filter_.uses_search_backend('title__iexact', queryset)
+
+
+class SearchPlanCacheTests(TestCase):
+    def setUp(self):
+        filters.clear_cache()
+        SearchFilterModel.objects.create(title='zz', text='abc')
+        SearchFilterModel.objects.create(title='z', text='bcd')
+
+        class SearchListView(generics.ListAPIView):
+            queryset = SearchFilterModel.objects.all()
+            serializer_class = SearchFilterSerializer
+            search_fields = ('=title', 'text')
+
+        self.view = SearchListView()
+
+    def search(self, term):
+        filter_ = filters.SearchFilter()
+        request = Request(factory.get('/', {'search': term}))
+        queryset = filter_.filter_queryset(request, SearchFilterModel.objects.all(), self.view)
+        return [instance.title for instance in queryset], filter_.meta_lookups
+
+    def test_search_plan_is_cached(self):
+        assert self.search('zz') == (['zz'], 2)
+        assert self.search('b') == (['zz', 'z'], 0)
+        assert self.search('z') == (['z'], 0)
+
+    def test_search_plan_depends_on_search_fields(self):
+        self.search('zz')
+        self.view.search_fields = ('title',)
+        assert self.search('zz') == (['zz'], 2)
+
+    def test_clear_cache(self):
+        self.search('zz')
+        filters.clear_cache()
+        assert self.search('zz') == (['zz'], 2)
+
+    def test_meta_lookups_are_recorded_on_the_view(self):
+        class SearchListView(type(self.view)):
+            filter_backends = (filters.SearchFilter,)
+
+        view = SearchListView.as_view()
+        response = view(factory.get('/', {'search': 'zz'}))
+        assert response.renderer_context['view'].filter_meta_lookups == 2
+        response = view(factory.get('/', {'search': 'b'}))
+        assert response.renderer_context['view'].filter_meta_lookups == 0
+
+
 class AttributeModel(models.Model):
     label = models.CharField(max_length=32)
 
@@ -688,6 +821,55 @@ class OrderingFilterTests(TestCase):
             {'id': 1, 'title': 'zyx', 'text': 'abc', 'description': 'zyx: abc'},
         ]
 
+    def test_default_valid_fields_are_cached(self):
+        filters.clear_cache()
+
+        class OrderingListView(generics.ListAPIView):
+            serializer_class = OrderingFilterSerializer
+
+        queryset = OrderingFilterModel.objects.all()
+        filter_ = filters.OrderingFilter()
+        expected = filter_.get_valid_fields(queryset, OrderingListView())
+        assert filter_.meta_lookups == 1
+
+        filter_ = filters.OrderingFilter()
+        assert filter_.get_valid_fields(queryset, OrderingListView()) == expected
+        assert filter_.meta_lookups == 0
+
+    def test_cached_valid_fields_are_dropped_with_the_serializer_class(self):
+        filters.clear_cache()
+
+        class TemporarySerializer(OrderingFilterSerializer):
+            pass
+
+        class OrderingListView(generics.ListAPIView):
+            serializer_class = TemporarySerializer
+
+        filters.OrderingFilter().get_valid_fields(OrderingFilterModel.objects.all(), OrderingListView())
+        assert len(filters._ordering_fields) == 1
+        del TemporarySerializer, OrderingListView
+        gc.collect()
+        assert len(filters._ordering_fields) == 0
+
+    def test_default_valid_fields_of_dynamic_serializers_are_not_cached(self):
+        class DynamicSerializer(OrderingFilterSerializer):
+            def get_fields(self):
+                fields = super().get_fields()
+                if not self.context.get('show_text'):
+                    fields.pop('text')
+                return fields
+
+        class OrderingListView(generics.ListAPIView):
+            serializer_class = DynamicSerializer
+
+        queryset = OrderingFilterModel.objects.all()
+        filter_ = filters.OrderingFilter()
+        valid_fields = filter_.get_valid_fields(queryset, OrderingListView(), {'show_text': True})
+        assert 'text' in [name for name, label in valid_fields]
+        valid_fields = filter_.get_valid_fields(queryset, OrderingListView())
+        assert 'text' not in [name for name, label in valid_fields]
+        assert filter_.meta_lookups == 2
+
     def test_default_ordering(self):
         class OrderingListView(generics.ListAPIView):
             queryset = OrderingFilterModel.objects.all()
@@ -1,13 +1,16 @@
 import pytest
 from django.db import models
-from django.http import Http404
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.test import TestCase
 
-from rest_framework import generics, renderers, serializers, status
+from rest_framework import (
+    generics, mixins, pagination, renderers, serializers, status, views
+)
 from rest_framework.exceptions import ErrorDetail
-from rest_framework.response import Response
+from rest_framework.response import Response, StreamingResponse
 from rest_framework.test import APIRequestFactory
+from rest_framework.utils import json
 from tests.models import (
     BasicModel, ForeignKeySource, ForeignKeyTarget, RESTFrameworkModel,
     UUIDForeignKeyTarget
@@ -171,6 +174,89 @@ class TestRootView(TestCase):
 EXPECTED_QUERIES_FOR_PUT = 2
 
 
+class StreamingRootView(RootView):
+    stream_list = True
+    stream_chunk_size = 2
+
+
+class TestStreamingListView(TestCase):
+    def setUp(self):
+        for item in ['foo', 'bar', 'baz']:
+            BasicModel(text=item).save()
+        self.data = [
+            {'id': obj.id, 'text': obj.text}
+            for obj in BasicModel.objects.all()
+        ]
+
+    def test_get_streaming_list(self):
+        request = factory.get('/')
+        response = StreamingRootView.as_view()(request)
+        assert isinstance(response, StreamingResponse)
+        assert isinstance(response, StreamingHttpResponse)
+        with self.assertNumQueries(1):
+            content = b''.join(response.render().streaming_content)
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == 'application/json'
+        assert content == RootView.as_view()(request).render().content
+
+    def test_streaming_list_with_indent(self):
+        request = factory.get('/', HTTP_ACCEPT='application/json; indent=4')
+        response = StreamingRootView.as_view()(request).render()
+        content = b''.join(response.streaming_content)
+        assert content == RootView.as_view()(request).render().content
+
+    def test_streaming_list_with_browsable_api(self):
+        request = factory.get('/', HTTP_ACCEPT='text/html')
+        response = StreamingRootView.as_view()(request).render()
+        content = b''.join(response.streaming_content).decode()
+        assert response.data == self.data
+        assert 'baz' in content
+
+    def test_streaming_list_with_ndjson(self):
+        class NDJSONStreamingView(StreamingRootView):
+            renderer_classes = (renderers.JSONRenderer, renderers.NDJSONRenderer)
+
+        request = factory.get('/', HTTP_ACCEPT='application/x-ndjson')
+        response = NDJSONStreamingView.as_view()(request).render()
+        content = b''.join(response.streaming_content)
+        assert response['Content-Type'] == 'application/x-ndjson'
+        assert [json.loads(line) for line in content.splitlines()] == self.data
+
+    def test_paginated_list_is_not_streamed(self):
+        class PaginatedStreamingView(StreamingRootView):
+            pagination_class = pagination.LimitOffsetPagination
+
+        request = factory.get('/', {'limit': 2})
+        response = PaginatedStreamingView.as_view()(request).render()
+        assert isinstance(response, Response)
+        assert response.data['results'] == self.data[:2]
+
+
+class ListWithoutGenericAPIView(mixins.ListModelMixin, views.APIView):
+    def get_queryset(self):
+        return BasicModel.objects.all()
+
+    def filter_queryset(self, queryset):
+        return queryset
+
+    def paginate_queryset(self, queryset):
+        return None
+
+    def get_serializer(self, *args, **kwargs):
+        return BasicSerializer(*args, **kwargs)
+
+    def get(self, request, *args, **kwargs):
+        return self.list(request, *args, **kwargs)
+
+
+class TestListMixinWithoutGenericAPIView(TestCase):
+    def test_list(self):
+        BasicModel.objects.create(text='foo')
+        response = ListWithoutGenericAPIView.as_view()(factory.get('/'))
+        assert response.status_code == status.HTTP_200_OK
+        assert [item['text'] for item in response.data] == ['foo']
+
+
 class TestInstanceView(TestCase):
     def setUp(self):
         """
@@ -0,0 +1,200 @@
+import datetime
+import decimal
+import io
+import uuid
+from collections import OrderedDict
+from unittest import mock
+
+import pytest
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.compat import orjson
+from rest_framework.exceptions import ErrorDetail, ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import json
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.utils.json_backends import (
+    OrjsonBackend, StandardJSONBackend
+)
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+backends = [
+    StandardJSONBackend,
+    pytest.param(OrjsonBackend, marks=pytest.mark.skipif(orjson is None, reason='orjson is not installed')),
+]
+
+utc = datetime.timezone.utc
+offset = datetime.timezone(datetime.timedelta(hours=5, minutes=30))
+
+DATA = [
+    None, True, False, 0, -1, 2 ** 63 - 1, 2 ** 64, -(2 ** 70), 1.5, -0.0, 0.1,
+    '', 'text', 'unicode ★ é', '  ', '"\\/\n\t\x00\x1f\x7f',
+    '\U0001f600', [], {}, [[], {}], {'a': [1, {'b': None}], 'c': ''},
+    (1, 2), OrderedDict([('b', 1), ('a', 2)]), {1: 'int key'},
+    decimal.Decimal('1.25'), uuid.UUID('12345678-1234-5678-1234-567812345678'),
+    datetime.datetime(2020, 1, 2, 3, 4, 5),
+    datetime.datetime(2020, 1, 2, 3, 4, 5, 678, tzinfo=utc),
+    datetime.datetime(2020, 1, 2, 3, 4, 5, tzinfo=offset),
+    datetime.date(2020, 1, 2), datetime.time(3, 4, 5, 6),
+    datetime.timedelta(days=1, seconds=2), _('lazy'), b'bytes',
+    ReturnDict({'a': 1}, serializer=None), ReturnList([1], serializer=None),
+    ErrorDetail('error', code='invalid'), {'nested': [_('lazy'), decimal.Decimal('2')]},
+]
+
+
+def get_renderer(backend, **attrs):
+    renderer = JSONRenderer()
+    renderer.json_backend = backend
+    for key, value in attrs.items():
+        setattr(renderer, key, value)
+    return renderer
+
+
+def get_parser(backend, **attrs):
+    parser = JSONParser()
+    parser.json_backend = backend
+    for key, value in attrs.items():
+        setattr(parser, key, value)
+    return parser
+
+
+def parse(parser, content, encoding='utf-8'):
+    return parser.parse(io.BytesIO(content), parser_context={'encoding': encoding})
+
+
+def generate():
+    yield 1
+    yield decimal.Decimal('2.5')
+
+
+@pytest.mark.parametrize('backend', backends)
+class TestJSONRendererConformance:
+    """
+    Every backend renders the same output as the builtin json module.
+    """
+
+    @pytest.mark.parametrize('value', DATA)
+    @pytest.mark.parametrize('attrs', [
+        {},
+        {'compact': False},
+        {'ensure_ascii': True},
+    ])
+    def test_render(self, backend, value, attrs):
+        expected = get_renderer(StandardJSONBackend, **attrs).render(value)
+        assert get_renderer(backend, **attrs).render(value) == expected
+
+    @pytest.mark.parametrize('value', DATA)
+    @pytest.mark.parametrize('media_type', [
+        'application/json; indent=2',
+        'application/json; indent=4',
+    ])
+    def test_render_indented(self, backend, value, media_type):
+        expected = get_renderer(StandardJSONBackend).render(value, media_type)
+        assert get_renderer(backend).render(value, media_type) == expected
+
+    def test_render_generator(self, backend):
+        assert get_renderer(backend).render(generate()) == b'[1,2.5]'
+
+    def test_render_generator_with_fallback(self, backend):
+        data = {'items': generate(), 'big': 2 ** 64}
+        assert get_renderer(backend).render(data) == b'{"items":[1,2.5],"big":18446744073709551616}'
+
+    def test_render_escapes_line_separators(self, backend):
+        assert get_renderer(backend).render(['  ']) == b'["\\u2028\\u2029"]'
+
+    @pytest.mark.parametrize('value', [
+        float('nan'), [float('inf')], {'a': {'b': -float('inf')}},
+        decimal.Decimal('NaN'), [generate(), float('nan')],
+    ])
+    def test_strict_rejects_non_finite_floats(self, backend, value):
+        with pytest.raises(ValueError):
+            get_renderer(backend, strict=True).render(value)
+
+    def test_non_strict_renders_non_finite_floats(self, backend):
+        renderer = get_renderer(backend, strict=False)
+        data = [float('nan'), float('inf'), decimal.Decimal('-Infinity'), None]
+        assert renderer.render(data) == b'[NaN,Infinity,-Infinity,null]'
+
+    def test_render_floats_in_exponent_notation(self, backend):
+        data = [1e16, 1e-7, 1e22, 5e-324, 1.7976931348623157e308]
+        assert json.loads(get_renderer(backend).render(data)) == data
+
+    def test_aware_time_is_rejected(self, backend):
+        with pytest.raises(ValueError):
+            get_renderer(backend).render(datetime.time(1, tzinfo=utc))
+
+    def test_unsupported_type_is_rejected(self, backend):
+        with pytest.raises(TypeError):
+            get_renderer(backend).render({'a': object()})
+
+    def test_custom_encoder_class(self, backend):
+        class CustomEncoder(JSONEncoder):
+            def default(self, obj):
+                if isinstance(obj, complex):
+                    return [obj.real, obj.imag]
+                return super().default(obj)
+
+        renderer = get_renderer(backend, encoder_class=CustomEncoder)
+        assert renderer.render({'z': 1 + 2j}) == b'{"z":[1.0,2.0]}'
+
+    def test_render_stream(self, backend):
+        renderer = get_renderer(backend)
+        data = DATA[:20]
+        assert b''.join(renderer.render_stream(iter(data))) == renderer.render(data)
+
+
+@pytest.mark.parametrize('backend', backends)
+class TestJSONParserConformance:
+    """
+    Every backend parses the same data as the builtin json module.
+    """
+
+    @pytest.mark.parametrize('content', [
+        b'null', b'true', b'0', b'-0', b'1.5', b'1e400', b'""', b'"\\u2028"',
+        b' [1, 2] ', b'{"a": 1, "a": 2}', b'"\\ud800"', b'"\\ud83d\\ude00"',
+        b'18446744073709551615', b'123456789012345678901234567890',
+        b'-9223372036854775809', b'0.12345678901234567890123',
+        '{"unicode": "★"}'.encode(),
+    ])
+    def test_parse(self, backend, content):
+        expected = parse(get_parser(StandardJSONBackend), content)
+        assert parse(get_parser(backend), content) == expected
+
+    @pytest.mark.parametrize('content', [
+        b'', b'{', b'[1,]', b'"\x1f"', b'\xef\xbb\xbf{}', b'"\xff"', b'NaN', b'[Infinity]',
+    ])
+    def test_parse_error(self, backend, content):
+        with pytest.raises(ParseError):
+            parse(get_parser(backend), content)
+
+    def test_non_strict_parses_constants(self, backend):
+        data = parse(get_parser(backend, strict=False), b'[NaN, Infinity, -Infinity]')
+        assert [str(value) for value in data] == ['nan', 'inf', '-inf']
+
+    def test_parse_other_encoding(self, backend):
+        content = '{"text": "caf\xe9"}'.encode('latin-1')
+        assert parse(get_parser(backend), content, encoding='latin-1') == {'text': 'caf\xe9'}
+
+
+@pytest.mark.skipif(orjson is None, reason='orjson is not installed')
+class TestOrjsonBackend:
+    def render(self, data, **kwargs):
+        encode = JSONEncoder.encode
+        with mock.patch.object(JSONEncoder, 'encode', autospec=True, side_effect=encode) as mock_encode:
+            get_renderer(OrjsonBackend, **kwargs).render(data)
+        return mock_encode.called
+
+    def test_compact_output_uses_orjson(self):
+        assert not self.render([{'a': None, 'b': 1.5, 'c': decimal.Decimal('1')}])
+
+    def test_unicode_escaped_output_uses_builtin_json(self):
+        assert self.render({'a': 1}, ensure_ascii=True)
+
+    def test_non_finite_float_uses_builtin_json(self):
+        assert self.render({'a': None, 'b': [float('nan')]}, strict=False)
+
+    def test_parse_uses_orjson(self):
+        with mock.patch.object(StandardJSONBackend, 'loads', autospec=True) as loads:
+            parse(get_parser(OrjsonBackend), b'{"a": [1, 2.5, null]}')
+        assert not loads.called
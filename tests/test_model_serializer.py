@@ -10,6 +10,7 @@ import decimal
 import json  # noqa
 import re
 import tempfile
+from unittest import mock
 
 import pytest
 from django.core.exceptions import ImproperlyConfigured
@@ -20,7 +21,8 @@ from django.core.validators import (
 from django.db import models
 from django.db.models.signals import m2m_changed
 from django.dispatch import receiver
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from django.utils import translation
 
 from rest_framework import serializers
 from rest_framework.compat import postgres_fields
@@ -1395,3 +1397,80 @@ class Issue6751Test(TestCase):
         serializer.save()
 
         self.assertEqual(instance.char_field, 'value changed by signal')
+
+
+class TestFieldTemplates(TestCase):
+    def setUp(self):
+        serializers.clear_field_templates()
+
+    def get_serializer_class(self):
+        class TestSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = RegularFieldsModel
+                fields = ('auto_field', 'char_field', 'decimal_field')
+
+        return TestSerializer
+
+    def test_fields_are_built_once_per_class(self):
+        TestSerializer = self.get_serializer_class()
+        build_fields = serializers.ModelSerializer.build_fields
+        with mock.patch.object(serializers.ModelSerializer, 'build_fields', autospec=True, side_effect=build_fields) as mocked:
+            TestSerializer().fields
+            TestSerializer().fields
+        assert mocked.call_count == 1
+
+    def test_cloned_fields_are_independent(self):
+        TestSerializer = self.get_serializer_class()
+        first = TestSerializer()
+        second = TestSerializer()
+        assert first.fields['char_field'] is not second.fields['char_field']
+        assert repr(first) == repr(second)
+
+        num_validators = len(second.fields['char_field'].validators)
+        first.fields['char_field'].validators.append(MinLengthValidator(5))
+        first.fields['char_field'].error_messages['blank'] = 'changed'
+        assert len(second.fields['char_field'].validators) == num_validators
+        assert second.fields['char_field'].error_messages['blank'] != 'changed'
+        assert TestSerializer(data={'char_field': 'abc', 'decimal_field': '1.0'}).is_valid()
+
+    def test_meta_changes_are_picked_up(self):
+        TestSerializer = self.get_serializer_class()
+        assert list(TestSerializer().fields) == ['auto_field', 'char_field', 'decimal_field']
+
+        TestSerializer.Meta.fields = ('auto_field', 'char_field')
+        TestSerializer.Meta.extra_kwargs = {'char_field': {'required': False}}
+        fields = TestSerializer().fields
+        assert list(fields) == ['auto_field', 'char_field']
+        assert not fields['char_field'].required
+
+    def test_overridden_construction_methods_are_not_cached(self):
+        class TestSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = RegularFieldsModel
+                fields = ('auto_field', 'char_field')
+
+            def get_extra_kwargs(self):
+                return {'char_field': {'label': self.context['label']}}
+
+        assert TestSerializer(context={'label': 'One'}).fields['char_field'].label == 'One'
+        assert TestSerializer(context={'label': 'Two'}).fields['char_field'].label == 'Two'
+
+    def test_settings_change_clears_templates(self):
+        TestSerializer = self.get_serializer_class()
+        TestSerializer().fields
+        assert TestSerializer in serializers._field_templates
+
+        with override_settings(REST_FRAMEWORK={'URL_FIELD_NAME': 'link'}):
+            assert TestSerializer not in serializers._field_templates
+
+    def test_templates_are_built_per_language(self):
+        class TestSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = UniqueChoiceModel
+                fields = ('name',)
+
+        with translation.override('en'):
+            en_message = TestSerializer().fields['name'].validators[-1].message
+        with translation.override('fr'):
+            fr_message = TestSerializer().fields['name'].validators[-1].message
+        assert en_message != fr_message
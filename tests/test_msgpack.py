@@ -0,0 +1,201 @@
+import datetime
+import decimal
+import io
+import uuid
+from unittest import mock
+
+import pytest
+from django.test import TestCase
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework import serializers, status
+from rest_framework.compat import msgpack as msgpack_library
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser, MessagePackParser
+from rest_framework.renderers import JSONRenderer, MessagePackRenderer
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.utils import json, msgpack
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+from rest_framework.views import APIView
+
+factory = APIRequestFactory()
+
+implementations = [pytest.param(None, id='fallback')]
+if msgpack_library is not None:
+    implementations.append(pytest.param(msgpack_library, id='msgpack'))
+
+
+@pytest.fixture(params=implementations)
+def implementation(request):
+    with mock.patch('rest_framework.utils.msgpack.msgpack', request.param):
+        yield request.param
+
+
+class TestPackb:
+    @pytest.mark.parametrize('value, expected', [
+        (None, 'c0'),
+        (True, 'c3'),
+        (False, 'c2'),
+        (0, '00'),
+        (127, '7f'),
+        (128, 'cc80'),
+        (-1, 'ff'),
+        (-32, 'e0'),
+        (-33, 'd0df'),
+        (65536, 'ce00010000'),
+        (-2 ** 63, 'd38000000000000000'),
+        (1.5, 'cb3ff8000000000000'),
+        ('a', 'a161'),
+        ('a' * 32, 'd920' + '61' * 32),
+        (b'\x01', 'c40101'),
+        ([1, [2]], '92019102'),
+        ({'a': None}, '81a161c0'),
+    ])
+    def test_encoding(self, implementation, value, expected):
+        assert msgpack.packb(value).hex() == expected
+
+    @pytest.mark.parametrize('value', [
+        2 ** 64 - 1, -2 ** 63, 'é' * 300, 'x' * 70000, b'\x00' * 300,
+        list(range(20)), {str(index): index for index in range(20)},
+        [[]] * 70000, {1: 'a', None: [{}]},
+    ])
+    def test_round_trip(self, implementation, value):
+        assert msgpack.unpackb(msgpack.packb(value)) == value
+
+    def test_default(self, implementation):
+        assert msgpack.packb({'a': decimal.Decimal('1')}, default=str) == msgpack.packb({'a': '1'})
+        with pytest.raises(TypeError):
+            msgpack.packb(decimal.Decimal('1'))
+
+    def test_out_of_range(self, implementation):
+        with pytest.raises(OverflowError):
+            msgpack.packb(2 ** 64)
+
+    @pytest.mark.parametrize('data', [
+        '', '92', 'a261', 'c001', 'd40000', '81' + '9100' + 'c0',
+    ])
+    def test_invalid_data(self, implementation, data):
+        with pytest.raises(ValueError):
+            msgpack.unpackb(bytes.fromhex(data))
+
+
+class ItemSerializer(serializers.Serializer):
+    name = serializers.CharField()
+    price = serializers.DecimalField(max_digits=5, decimal_places=2, coerce_to_string=False)
+
+
+class MessagePackView(APIView):
+    renderer_classes = (JSONRenderer, MessagePackRenderer)
+    parser_classes = (JSONParser, MessagePackParser)
+
+    def get(self, request):
+        return Response([{'name': 'a', 'price': 1}, {'name': 'b', 'price': 2}])
+
+    def post(self, request):
+        serializer = ItemSerializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        return Response(serializer.data)
+
+
+class TestMessagePackRenderer(TestCase):
+    data = {
+        'decimal': decimal.Decimal('1.5'),
+        'datetime': datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+        'date': datetime.date(2024, 1, 2),
+        'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+        'timedelta': datetime.timedelta(hours=1),
+        'lazy': _('text'),
+        'tuple': (1, 2),
+        'nested': ReturnDict({'list': ReturnList([1], serializer=None)}, serializer=None),
+    }
+
+    def test_type_mapping_matches_json(self):
+        rendered = MessagePackRenderer().render(self.data)
+        assert msgpack.unpackb(rendered) == json.loads(JSONRenderer().render(self.data))
+
+    def test_columnar(self):
+        renderer = MessagePackRenderer()
+        renderer.columnar = True
+        data = [{'id': 1, 'name': 'a'}, {'name': 'b', 'id': 2}]
+        assert msgpack.unpackb(renderer.render(data)) == {
+            'fields': ['id', 'name'],
+            'columns': [[1, 2], ['a', 'b']],
+        }
+
+        paginated = {'count': 2, 'next': None, 'results': data}
+        assert msgpack.unpackb(renderer.render(paginated))['results']['columns'] == [[1, 2], ['a', 'b']]
+
+        # Objects with different keys have `None` values for missing keys.
+        assert msgpack.unpackb(renderer.render([{'id': 1}, {'name': 'b'}])) == {
+            'fields': ['id', 'name'],
+            'columns': [[1, None], [None, 'b']],
+        }
+        assert msgpack.unpackb(renderer.render([])) == {'fields': [], 'columns': []}
+
+        # Lists of other values are unchanged.
+        for data in ([1, 2], [{'id': 1}, 2], {'id': 1}):
+            assert msgpack.unpackb(renderer.render(data)) == data
+
+    def test_columnar_round_trip(self):
+        renderer = MessagePackRenderer()
+        renderer.columnar = True
+        for data in ([], [{'id': 1, 'name': 'a'}], [{'id': 1}, {'id': 2, 'name': 'b'}]):
+            parsed = MessagePackParser().parse(
+                io.BytesIO(renderer.render(data)), 'application/msgpack; columnar=1'
+            )
+            assert parsed == [{'id': None, 'name': None, **item} for item in data]
+
+    def test_columnar_from_accepted_media_type(self):
+        renderer = MessagePackRenderer()
+        data = [{'id': 1}]
+        rendered = renderer.render(data, accepted_media_type='application/msgpack; columnar=1')
+        assert msgpack.unpackb(rendered) == {'fields': ['id'], 'columns': [[1]]}
+        assert msgpack.unpackb(renderer.render(data, accepted_media_type='application/msgpack')) == data
+
+    def test_content_negotiation(self):
+        view = MessagePackView.as_view()
+        response = view(factory.get('/', HTTP_ACCEPT='application/msgpack')).render()
+        assert response['Content-Type'] == 'application/msgpack'
+        assert msgpack.unpackb(response.content) == [{'name': 'a', 'price': 1}, {'name': 'b', 'price': 2}]
+
+        response = view(factory.get('/', HTTP_ACCEPT='application/msgpack; columnar=1')).render()
+        assert msgpack.unpackb(response.content)['fields'] == ['name', 'price']
+
+        response = view(factory.get('/', HTTP_ACCEPT='application/json')).render()
+        assert response['Content-Type'] == 'application/json'
+
+
+class TestMessagePackParser(TestCase):
+    def parse(self, data, media_type='application/msgpack'):
+        return MessagePackParser().parse(io.BytesIO(data), media_type)
+
+    def test_parse(self):
+        assert self.parse(msgpack.packb({'a': [1, 'b']})) == {'a': [1, 'b']}
+        with pytest.raises(ParseError):
+            self.parse(b'\x92\x01')
+
+    def test_parse_columnar(self):
+        data = msgpack.packb({'fields': ['id', 'name'], 'columns': [[1, 2], ['a', 'b']]})
+        assert self.parse(data, 'application/msgpack; columnar=1') == [
+            {'id': 1, 'name': 'a'}, {'id': 2, 'name': 'b'}
+        ]
+
+        for invalid in ([], {'fields': ['id']}, {'fields': ['id'], 'columns': [[1], [2]]},
+                        {'fields': ['id', 'name'], 'columns': [[1], []]}):
+            with pytest.raises(ParseError):
+                self.parse(msgpack.packb(invalid), 'application/msgpack; columnar=1')
+
+    def test_view_parses_request(self):
+        view = MessagePackView.as_view()
+        rows = [{'name': 'a', 'price': '1.50'}]
+        request = factory.post('/', msgpack.packb(rows), content_type='application/msgpack')
+        response = view(request)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == [{'name': 'a', 'price': decimal.Decimal('1.50')}]
+
+        columns = {'fields': ['name'], 'columns': [['a']]}
+        request = factory.post('/', msgpack.packb(columns), content_type='application/msgpack; columnar=1')
+        response = view(request)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data[0]['price'][0].code == 'required'
@@ -1,7 +1,13 @@
+from base64 import b64encode
+from unittest import mock
+from urllib import parse
+
 import pytest
+from django.core.cache import cache
 from django.core.paginator import Paginator as DjangoPaginator
-from django.db import models
+from django.db import connection, models
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from rest_framework import (
     exceptions, filters, generics, pagination, serializers, status
@@ -1101,6 +1107,379 @@ class TestCursorPaginationWithValueQueryset(CursorPaginationTestsMixin, TestCase
         return (previous, current, next, previous_url, next_url)
 
 
+class KeysetAuthor(models.Model):
+    name = models.CharField(max_length=50)
+
+
+class KeysetBook(models.Model):
+    author = models.ForeignKey(KeysetAuthor, null=True, on_delete=models.CASCADE)
+    rank = models.IntegerField(null=True)
+    title = models.CharField(max_length=50)
+
+
+class TestKeysetCursorPagination(TestCase):
+    def setUp(self):
+        authors = [KeysetAuthor.objects.create(name=name) for name in ('b', 'a', 'c')]
+        for idx in range(40):
+            KeysetBook.objects.create(
+                author=None if idx % 7 == 0 else authors[idx % 3],
+                rank=None if idx % 5 == 0 else idx % 4,
+                title='title-%d' % (idx % 6),
+            )
+
+        class ExamplePagination(pagination.CursorPagination):
+            page_size = 7
+            keyset = True
+
+        self.pagination = ExamplePagination()
+
+    def get_expected(self, ordering):
+        books = list(KeysetBook.objects.select_related('author'))
+        # Nulls sort as the greatest value, and the pk breaks any ties.
+        for order in reversed((*ordering, '-pk' if ordering[-1].startswith('-') else 'pk')):
+            name = order.lstrip('-')
+            # Ordering by a relation orders by its foreign key column.
+            if name == 'author':
+                name = 'author_id'
+
+            def key(book, name=name):
+                value = book
+                for attr in name.split('__'):
+                    value = None if value is None else getattr(value, attr)
+                return (value is None, value if value is not None else 0)
+
+            books.sort(key=key, reverse=order.startswith('-'))
+        return [book.pk for book in books]
+
+    def paginate(self, url, queryset=None):
+        request = Request(factory.get(url))
+        if queryset is None:
+            queryset = KeysetBook.objects.all()
+        page = self.pagination.paginate_queryset(queryset, request)
+        pks = [item['pk'] if isinstance(item, dict) else item.pk for item in page]
+        return pks, self.pagination.get_previous_link(), self.pagination.get_next_link()
+
+    def walk(self, ordering, queryset=None):
+        self.pagination.ordering = ordering
+        forward = []
+        url = '/'
+        previous_url = None
+        while url is not None:
+            with self.assertNumQueries(1):
+                pks, previous_url, url = self.paginate(url, queryset)
+            assert len(pks) <= 7
+            forward.extend(pks)
+            last_url = previous_url
+
+        # Walk back from the last page.
+        backward = pks
+        url = last_url
+        while url is not None:
+            pks, url, next_url = self.paginate(url, queryset)
+            assert next_url is not None
+            backward = pks + backward
+        return forward, backward
+
+    def test_orderings(self):
+        orderings = [
+            ('rank',),
+            ('-rank',),
+            ('rank', '-title'),
+            ('-rank', 'title'),
+            ('author__name', '-rank'),
+            ('-author__name', 'title'),
+            ('author', 'rank'),
+            ('-pk',),
+        ]
+        for ordering in orderings:
+            with self.subTest(ordering=ordering):
+                expected = self.get_expected(ordering)
+                forward, backward = self.walk(ordering)
+                assert forward == expected
+                assert backward == expected
+
+    def test_value_queryset(self):
+        ordering = ('-rank', 'title')
+        queryset = KeysetBook.objects.values('pk', 'title')
+        forward, backward = self.walk(ordering, queryset)
+        assert forward == self.get_expected(ordering)
+        assert backward == forward
+
+    def test_pk_is_added_to_ordering(self):
+        self.pagination.ordering = ('-rank', 'title')
+        keyset_fields = self.pagination.get_keyset_fields(KeysetBook.objects.all())
+        assert keyset_fields == [
+            pagination.KeysetField('rank', True, True, False),
+            pagination.KeysetField('title', False, False, False),
+            pagination.KeysetField('pk', False, False, True),
+        ]
+        self.pagination.ordering = ('-id', 'title')
+        keyset_fields = self.pagination.get_keyset_fields(KeysetBook.objects.all())
+        assert [keyset_field.name for keyset_field in keyset_fields] == ['id', 'title']
+
+    def test_no_offset_is_used(self):
+        self.pagination.ordering = ('rank', 'title')
+        pks, previous_url, next_url = self.paginate('/')
+        with CaptureQueriesContext(connection) as context:
+            self.paginate(next_url)
+        sql = context.captured_queries[0]['sql']
+        assert 'OFFSET' not in sql
+        assert 'LIMIT 8' in sql
+
+    def test_invalid_cursor(self):
+        self.pagination.ordering = ('rank', 'title')
+        for position in ('1', '["1"]', '[1, 2, 3]', '{}'):
+            cursor = b64encode(parse.urlencode({'p': position}).encode()).decode()
+            with self.subTest(position=position), pytest.raises(exceptions.NotFound):
+                self.paginate('/?cursor=' + cursor)
+
+
+class TestUniqueOrderingCursorPagination(TestCase):
+    def setUp(self):
+        for idx in range(12):
+            CursorPaginationModel.objects.create(created=idx % 3)
+
+        class ExamplePagination(pagination.CursorPagination):
+            page_size = 5
+            ordering = '-pk'
+            unique_ordering = True
+
+        self.pagination = ExamplePagination()
+        self.queryset = CursorPaginationModel.objects.all()
+        self.pks = list(self.queryset.order_by('-pk').values_list('pk', flat=True))
+
+    def paginate(self, url):
+        request = Request(factory.get(url))
+        page = self.pagination.paginate_queryset(self.queryset, request)
+        pks = [item.pk for item in page]
+        return pks, self.pagination.get_previous_link(), self.pagination.get_next_link()
+
+    def test_cursor_pagination(self):
+        with self.assertNumQueries(1):
+            current, previous_url, next_url = self.paginate('/')
+        assert current == self.pks[:5]
+        assert previous_url is None
+
+        # Later pages check for a previous page with an `EXISTS` query.
+        with CaptureQueriesContext(connection) as context:
+            current, previous_url, next_url = self.paginate(next_url)
+        assert current == self.pks[5:10]
+        assert len(context.captured_queries) == 2
+        exists_sql, page_sql = [query['sql'] for query in context.captured_queries]
+        assert 'OFFSET' not in page_sql
+        assert 'LIMIT 6' in page_sql
+        assert 'LIMIT 1' in exists_sql
+
+        current, previous_url, next_url = self.paginate(next_url)
+        assert current == self.pks[10:]
+        assert next_url is None
+
+        current, previous_url, next_url = self.paginate(previous_url)
+        assert current == self.pks[5:10]
+        current, previous_url, next_url = self.paginate(previous_url)
+        assert current == self.pks[:5]
+        assert previous_url is None
+        assert next_url is not None
+
+    def test_previous_page_is_checked(self):
+        current, previous_url, next_url = self.paginate('/')
+        self.queryset.filter(pk__in=current).delete()
+        current, previous_url, next_url = self.paginate(next_url)
+        assert current == self.pks[5:10]
+        assert previous_url is None
+
+    def test_offset_cursor_is_invalid(self):
+        self.pagination.base_url = '/'
+        cursor = pagination.Cursor(offset=1, reverse=False, position=self.pks[0])
+        with pytest.raises(exceptions.NotFound):
+            self.paginate(self.pagination.encode_cursor(cursor))
+
+    def test_ordering_must_be_unique(self):
+        self.pagination.ordering = ('created', 'pk')
+        with pytest.raises(AssertionError):
+            self.paginate('/')
+
+    def test_uniqueness_is_looked_up_once(self):
+        self.paginate('/')
+        with mock.patch('rest_framework.pagination._get_keyset_field') as get_keyset_field:
+            paginator = type(self.pagination)()
+            paginator.paginate_queryset(self.queryset, Request(factory.get('/')))
+        assert not get_keyset_field.called
+
+    def test_client_ordering_that_is_not_unique(self):
+        class MockView:
+            filter_backends = (filters.OrderingFilter,)
+            ordering_fields = ['created', 'pk']
+
+        view = MockView()
+        expected = list(self.queryset.order_by('created', 'pk').values_list('pk', flat=True))
+        pks = []
+        url = '/?ordering=created'
+        while url:
+            request = Request(factory.get(url))
+            page = self.pagination.paginate_queryset(self.queryset, request, view=view)
+            pks.extend(item.pk for item in page)
+            url = self.pagination.get_next_link()
+        assert pks == expected
+
+        # The ordering declared on the pagination class is still unique.
+        self.pagination.ordering = '-pk'
+        assert self.paginate('/?ordering=-pk')[0] == self.pks[:5]
+
+
+class CountedModel(models.Model):
+    value = models.IntegerField()
+
+
+class TestCounters(TestCase):
+    def setUp(self):
+        CountedModel.objects.bulk_create([CountedModel(value=idx) for idx in range(25)])
+        self.queryset = CountedModel.objects.order_by('value')
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def paginate(self, paginator_class, url, queryset=None):
+        paginator = paginator_class()
+        request = Request(factory.get(url))
+        results = paginator.paginate_queryset(self.queryset if queryset is None else queryset, request)
+        response = paginator.get_paginated_response([item.value for item in results])
+        return response.data
+
+    def test_default_counts_have_no_flag(self):
+        class ExamplePagination(pagination.LimitOffsetPagination):
+            default_limit = 10
+
+        data = self.paginate(ExamplePagination, '/')
+        assert data['count'] == 25
+        assert 'count_is_exact' not in data
+
+    def test_cached_counter(self):
+        class ExamplePagination(pagination.PageNumberPagination):
+            page_size = 10
+            counter_class = pagination.CachedCounter
+
+        with self.assertNumQueries(2):
+            data = self.paginate(ExamplePagination, '/')
+        assert data['count'] == 25
+        assert 'count_is_exact' not in data
+
+        CountedModel.objects.create(value=100)
+        with self.assertNumQueries(1):
+            data = self.paginate(ExamplePagination, '/?page=3')
+        assert data['count'] == 25
+        assert data['results'] == [20, 21, 22, 23, 24]
+
+        # A different query has its own count.
+        with self.assertNumQueries(2):
+            data = self.paginate(ExamplePagination, '/', self.queryset.filter(value__lt=5))
+        assert data['count'] == 5
+
+    def test_cached_counter_ignores_ordering(self):
+        counter = pagination.CachedCounter()
+        key = counter.get_cache_key(self.queryset)
+        assert key == counter.get_cache_key(CountedModel.objects.order_by('-value'))
+        assert key != counter.get_cache_key(self.queryset.filter(value=1))
+        assert counter.get_cache_key(CountedModel.objects.none()) is None
+        assert counter.get_cache_key(list(range(5))) is None
+
+    def test_capped_counter(self):
+        class ExamplePagination(pagination.LimitOffsetPagination):
+            default_limit = 5
+            counter_class = pagination.CappedCounter
+
+        pagination.CappedCounter.cap, cap = 10, pagination.CappedCounter.cap
+        self.addCleanup(setattr, pagination.CappedCounter, 'cap', cap)
+
+        data = self.paginate(ExamplePagination, '/')
+        assert data['count'] == 10
+        assert data['count_is_exact'] is False
+        assert data['next'] == 'http://testserver/?limit=5&offset=5'
+
+        # Counting continues far enough to link to the next page.
+        data = self.paginate(ExamplePagination, '/?offset=10')
+        assert data['count'] == 16
+        assert data['count_is_exact'] is False
+        assert data['results'] == [10, 11, 12, 13, 14]
+        assert data['next'] == 'http://testserver/?limit=5&offset=15'
+
+        data = self.paginate(ExamplePagination, '/?offset=20')
+        assert data['count'] == 25
+        assert data['count_is_exact'] is True
+        assert data['next'] is None
+
+    def test_capped_counter_page_numbers(self):
+        class ExamplePagination(pagination.PageNumberPagination):
+            page_size = 5
+            counter_class = pagination.CappedCounter
+
+        pagination.CappedCounter.cap, cap = 10, pagination.CappedCounter.cap
+        self.addCleanup(setattr, pagination.CappedCounter, 'cap', cap)
+
+        data = self.paginate(ExamplePagination, '/?page=4')
+        assert data['count'] == 21
+        assert data['count_is_exact'] is False
+        assert data['results'] == [15, 16, 17, 18, 19]
+        assert data['next'] == 'http://testserver/?page=5'
+
+        data = self.paginate(ExamplePagination, '/?page=5')
+        assert data['count'] == 25
+        assert data['count_is_exact'] is True
+        assert data['next'] is None
+
+    def test_capped_counter_list(self):
+        counter = pagination.CappedCounter()
+        counter.cap = 10
+        assert counter.get_count(list(range(25))) == (10, False)
+        assert counter.get_count(list(range(5))) == (5, True)
+
+    def test_estimated_counter(self):
+        class ExamplePagination(pagination.LimitOffsetPagination):
+            default_limit = 5
+            counter_class = pagination.EstimatedCounter
+
+        pagination.EstimatedCounter.threshold, threshold = 10, pagination.EstimatedCounter.threshold
+        self.addCleanup(setattr, pagination.EstimatedCounter, 'threshold', threshold)
+
+        # Without table statistics the count is exact.
+        data = self.paginate(ExamplePagination, '/')
+        assert data == {
+            'count_is_exact': True, 'count': 25,
+            'next': 'http://testserver/?limit=5&offset=5', 'previous': None,
+            'results': [0, 1, 2, 3, 4]
+        }
+
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+        CountedModel.objects.bulk_create([CountedModel(value=idx) for idx in range(25, 30)])
+
+        data = self.paginate(ExamplePagination, '/')
+        assert data['count'] == 25
+        assert data['count_is_exact'] is False
+
+        # Filtered querysets are counted exactly.
+        data = self.paginate(ExamplePagination, '/', self.queryset.filter(value__gte=1))
+        assert data['count'] == 29
+        assert data['count_is_exact'] is True
+
+        # As are pages beyond the estimate.
+        data = self.paginate(ExamplePagination, '/?offset=25')
+        assert data['count'] == 30
+        assert data['count_is_exact'] is True
+
+    def test_schema(self):
+        class ExamplePagination(pagination.PageNumberPagination):
+            counter_class = pagination.CappedCounter
+
+        schema = ExamplePagination().get_paginated_response_schema({})
+        assert list(schema['properties']) == ['count_is_exact', 'count', 'next', 'previous', 'results']
+        assert schema['properties']['count_is_exact'] == {'type': 'boolean', 'example': True}
+        assert 'description' in schema['properties']['count']
+
+        schema = pagination.LimitOffsetPagination().get_paginated_response_schema({})
+        assert 'count_is_exact' not in schema['properties']
+        assert 'description' not in schema['properties']['count']
+
+
 def test_get_displayed_page_numbers():
     """
     Test our contextual page display function.
@@ -1,5 +1,6 @@
 import io
 import math
+import time
 
 import pytest
 from django import forms
@@ -7,14 +8,18 @@ from django.core.files.uploadhandler import (
     MemoryFileUploadHandler, TemporaryFileUploadHandler
 )
 from django.http.request import RawPostDataException
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
+from rest_framework import serializers, status
 from rest_framework.exceptions import ParseError
 from rest_framework.parsers import (
-    FileUploadParser, FormParser, JSONParser, MultiPartParser
+    FileUploadParser, FormParser, JSONParser, MultiPartParser, NDJSONParser,
+    StreamingJSONParser
 )
 from rest_framework.request import Request
+from rest_framework.response import Response
 from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
 
 
 class Form(forms.Form):
@@ -142,6 +147,154 @@ class TestJSONParser(TestCase):
         assert math.isnan(parser.parse(self.bytes('NaN')))
 
 
+class ByteStream(io.BytesIO):
+    """
+    Returns a single byte from each read, to test items split across reads.
+    """
+    def read(self, size=-1):
+        return super().read(1)
+
+
+class ItemSerializer(serializers.Serializer):
+    name = serializers.CharField()
+
+
+class BulkView(APIView):
+    parser_classes = (StreamingJSONParser,)
+
+    def post(self, request):
+        counts = []
+        for chunk in request.data.chunks(2):
+            serializer = ItemSerializer(data=chunk, many=True)
+            serializer.is_valid(raise_exception=True)
+            counts.append(len(serializer.validated_data))
+        return Response(counts)
+
+
+class TestStreamingJSONParser(TestCase):
+    data = '[1, "a, [b]", {"c": ["]", "\\"", {}]}, [], null, -2.5e3, true]'
+    expected = [1, 'a, [b]', {'c': [']', '"', {}]}, [], None, -2.5e3, True]
+
+    def parse(self, value, stream_class=io.BytesIO, parser=None):
+        parser = parser or StreamingJSONParser()
+        return list(parser.parse(stream_class(value.encode())))
+
+    def test_parse(self):
+        assert self.parse(self.data) == self.expected
+        assert self.parse(' \n[ ]\n') == []
+        assert self.parse('[{"a": 1}]') == [{'a': 1}]
+
+    def test_items_split_across_reads(self):
+        assert self.parse(self.data, stream_class=ByteStream) == self.expected
+
+    def test_items_are_decoded_lazily(self):
+        stream = StreamingJSONParser().parse(io.BytesIO(b'[1, 2, x]'))
+        assert next(stream) == 1
+        assert next(stream) == 2
+        with pytest.raises(ParseError, match='item 2'):
+            next(stream)
+
+    def test_invalid_data(self):
+        for value in ['{"a": 1}', '', '[1, 2', '[1,]', '[1,,2]', '[1] 2', '[1}]', '["a]']:
+            with pytest.raises(ParseError):
+                self.parse(value)
+
+    def test_whitespace_runs_are_parsed_in_linear_time(self):
+        assert self.parse('[1 ' + ' ' * 1024 + ', 2 ]') == [1, 2]
+        with pytest.raises(ParseError):
+            self.parse('[1 2]')
+
+        start = time.perf_counter()
+        with pytest.raises(ParseError):
+            self.parse('[1' + ' ' * 64 * 1024 + 'x')
+        assert time.perf_counter() - start < 1
+
+    def test_float_strictness(self):
+        with pytest.raises(ParseError):
+            self.parse('[NaN]')
+        parser = StreamingJSONParser()
+        parser.strict = False
+        assert self.parse('[Infinity]', parser=parser) == [float('inf')]
+
+    @override_settings(DATA_UPLOAD_MAX_MEMORY_SIZE=10)
+    def test_max_item_size(self):
+        assert self.parse('["123456", "12345678"]') == ['123456', '12345678']
+        with pytest.raises(ParseError, match='item 1 - Item exceeds the maximum size of 10 bytes'):
+            self.parse('["123456", "123456789"]', stream_class=ByteStream)
+
+        parser = StreamingJSONParser()
+        parser.max_item_size = 100
+        assert self.parse('["123456789"]', parser=parser) == ['123456789']
+
+    def test_view_validates_chunks(self):
+        factory = APIRequestFactory()
+        data = [{'name': 'a'}, {'name': 'b'}, {'name': 'c'}]
+        response = BulkView.as_view()(factory.post('/', data, format='json'))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == [2, 1]
+
+        response = BulkView.as_view()(factory.post('/', '[{"name": "a"}, {', content_type='application/json'))
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class NDJSONBulkView(APIView):
+    parser_classes = (NDJSONParser,)
+
+    def post(self, request):
+        errors = {}
+        for offset, chunk in enumerate(request.data.chunks(2)):
+            serializer = ItemSerializer(data=chunk, many=True)
+            if not serializer.is_valid():
+                for index, error in enumerate(serializer.errors):
+                    if error:
+                        errors['line %d' % (offset * 2 + index + 1)] = error
+        if errors:
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class TestNDJSONParser(TestCase):
+    def parse(self, value, parser=None):
+        parser = parser or NDJSONParser()
+        return list(parser.parse(io.BytesIO(value.encode())))
+
+    def test_parse(self):
+        assert self.parse('{"a": 1}\n[1, 2]\r\n"b"\nnull') == [{'a': 1}, [1, 2], 'b', None]
+        assert self.parse('{"a": "\\n"}\n') == [{'a': '\n'}]
+        assert self.parse('') == []
+
+    def test_errors_report_line_numbers(self):
+        with pytest.raises(ParseError, match='line 2, column 7 - Expecting value'):
+            self.parse('{"a": 1}\n{"a": }\n')
+        with pytest.raises(ParseError, match='line 2, column 1 - Expecting value'):
+            self.parse('{"a": 1}\n\n{"a": 2}\n')
+
+    def test_records_are_decoded_lazily(self):
+        stream = NDJSONParser().parse(io.BytesIO(b'1\n2\nx\n'))
+        assert next(stream) == 1
+        assert next(stream) == 2
+        with pytest.raises(ParseError, match='line 3'):
+            next(stream)
+
+    @override_settings(DATA_UPLOAD_MAX_MEMORY_SIZE=10)
+    def test_max_line_size(self):
+        assert self.parse('"12345678"\n"12345678"') == ['12345678', '12345678']
+        with pytest.raises(ParseError, match='line 2 - Line exceeds the maximum size of 10 bytes'):
+            self.parse('"12345678"\n"123456789"\n')
+
+    def test_view_reports_validation_errors_by_line(self):
+        factory = APIRequestFactory()
+        content = '{"name": "a"}\n{"name": "b"}\n{}\n'
+        request = factory.post('/', content, content_type='application/x-ndjson')
+        response = NDJSONBulkView.as_view()(request)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert list(response.data) == ['line 3']
+
+        request = factory.post('/', content[:-3], content_type='application/x-ndjson')
+        response = NDJSONBulkView.as_view()(request)
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+
 class TestPOSTAccessed(TestCase):
     def setUp(self):
         self.factory = APIRequestFactory()
@@ -1,8 +1,19 @@
 from django.contrib.auth.models import Group, User
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from rest_framework import generics, serializers
+from rest_framework.pagination import CursorPagination
 from rest_framework.test import APIRequestFactory
+from rest_framework.utils.prefetch import (
+    get_related_lookups, optimize_queryset
+)
+
+from .models import (
+    ForeignKeySource, ForeignKeyTarget, ManyToManySource, ManyToManyTarget,
+    NestedForeignKeySource, NullableForeignKeySource
+)
 
 factory = APIRequestFactory()
 
@@ -70,3 +81,245 @@ class TestPrefetchRelatedUpdates(TestCase):
         assert response.data['username'] == 'new'
         self.user.refresh_from_db()
         assert self.user.username == 'new'
+
+
+class NullableSourceSerializer(serializers.ModelSerializer):
+    target = serializers.SlugRelatedField(slug_field='name', read_only=True)
+
+    class Meta:
+        model = NullableForeignKeySource
+        fields = ('name', 'target')
+
+
+class NestedSourceSerializer(serializers.ModelSerializer):
+    target = NullableSourceSerializer()
+    target_name = serializers.CharField(source='target.target.name')
+
+    class Meta:
+        model = NestedForeignKeySource
+        fields = ('id', 'name', 'target', 'target_name')
+
+
+class ManyToManySourceSerializer(serializers.ModelSerializer):
+    targets = serializers.StringRelatedField(many=True)
+    target_ids = serializers.PrimaryKeyRelatedField(source='targets', many=True, read_only=True)
+
+    class Meta:
+        model = ManyToManySource
+        fields = ('name', 'targets', 'target_ids')
+
+
+class SourceSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ForeignKeySource
+        fields = ('name', 'target')
+
+
+class TargetWithSourcesSerializer(serializers.ModelSerializer):
+    sources = SourceSerializer(many=True)
+
+    class Meta:
+        model = ForeignKeyTarget
+        fields = ('name', 'sources')
+
+
+class TestRelatedLookups(TestCase):
+    def test_foreign_key_chain(self):
+        lookups = get_related_lookups(NestedSourceSerializer(), NestedForeignKeySource)
+        assert lookups.select_related == ['target', 'target__target']
+        assert lookups.prefetch_related == []
+        assert lookups.only == ['name', 'target', 'target__name', 'target__target']
+
+    def test_many_to_many(self):
+        lookups = get_related_lookups(ManyToManySourceSerializer(many=True), ManyToManySource)
+        assert lookups.select_related == []
+        assert lookups.prefetch_related == ['targets']
+        assert lookups.only == ['name']
+
+    def test_reverse_foreign_key(self):
+        lookups = get_related_lookups(TargetWithSourcesSerializer(), ForeignKeyTarget)
+        assert lookups.select_related == []
+        assert lookups.prefetch_related == ['sources']
+        assert lookups.only == ['name']
+
+    def test_primary_key_relation_reads_foreign_key_column(self):
+        lookups = get_related_lookups(SourceSerializer(), ForeignKeySource)
+        assert lookups.select_related == []
+        assert lookups.only == ['name', 'target']
+
+    def test_method_field_disables_only(self):
+        class MethodSerializer(serializers.ModelSerializer):
+            description = serializers.SerializerMethodField()
+
+            class Meta:
+                model = ForeignKeySource
+                fields = ('name', 'target', 'description')
+
+            def get_description(self, obj):
+                return str(obj)
+
+        lookups = get_related_lookups(MethodSerializer(), ForeignKeySource)
+        assert lookups.only is None
+
+
+class NestedSourceList(generics.ListAPIView):
+    queryset = NestedForeignKeySource.objects.order_by('pk')
+    serializer_class = NestedSourceSerializer
+    auto_prefetch = True
+
+
+class ManyToManySourceList(generics.ListAPIView):
+    queryset = ManyToManySource.objects.order_by('pk')
+    serializer_class = ManyToManySourceSerializer
+    auto_prefetch = True
+
+
+class TargetWithSourcesList(generics.ListAPIView):
+    queryset = ForeignKeyTarget.objects.order_by('pk')
+    serializer_class = TargetWithSourcesSerializer
+    auto_prefetch = True
+
+
+class TestAutoPrefetch(TestCase):
+    def create_rows(self, count):
+        for index in range(count):
+            target = ForeignKeyTarget.objects.create(name='target-%d' % index)
+            ForeignKeySource.objects.create(name='source-%d' % index, target=target)
+            intermediate = NullableForeignKeySource.objects.create(name='intermediate-%d' % index, target=target)
+            NestedForeignKeySource.objects.create(name='nested-%d' % index, target=intermediate)
+            source = ManyToManySource.objects.create(name='source-%d' % index)
+            source.targets.add(ManyToManyTarget.objects.create(name='target-%d' % index))
+
+    def count_queries(self, view_class):
+        view = view_class.as_view()
+        with CaptureQueriesContext(connection) as context:
+            response = view(factory.get('/'))
+        assert response.status_code == 200
+        return len(context), response.data
+
+    def assert_constant_queries(self, view_class, expected):
+        self.create_rows(2)
+        num_queries, data = self.count_queries(view_class)
+        assert num_queries == expected
+        assert len(data) == 2
+
+        self.create_rows(5)
+        num_queries, data = self.count_queries(view_class)
+        assert num_queries == expected
+        assert len(data) == 7
+        return data
+
+    def test_foreign_key_chain(self):
+        data = self.assert_constant_queries(NestedSourceList, expected=1)
+        assert data[0]['target'] == {'name': 'intermediate-0', 'target': 'target-0'}
+        assert data[0]['target_name'] == 'target-0'
+
+    def test_many_to_many(self):
+        data = self.assert_constant_queries(ManyToManySourceList, expected=2)
+        assert data[0] == {'name': 'source-0', 'targets': ['ManyToManyTarget object (1)'], 'target_ids': [1]}
+
+    def test_reverse_foreign_key(self):
+        data = self.assert_constant_queries(TargetWithSourcesList, expected=2)
+        assert data[0]['sources'] == [{'name': 'source-0', 'target': data[0]['sources'][0]['target']}]
+
+    def test_cursor_pagination_ordering_fields_are_loaded(self):
+        class TargetSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = ForeignKeySource
+                fields = ('id', 'target')
+
+        class Pagination(CursorPagination):
+            ordering = 'name'
+            page_size = 5
+
+        class SourceList(generics.ListAPIView):
+            queryset = ForeignKeySource.objects.all()
+            serializer_class = TargetSerializer
+            pagination_class = Pagination
+            auto_prefetch = True
+
+        self.create_rows(7)
+        num_queries, data = self.count_queries(SourceList)
+        assert num_queries == 1
+        assert len(data['results']) == 5
+        assert data['next'] is not None
+
+    def test_disabled_by_default(self):
+        class DefaultList(NestedSourceList):
+            auto_prefetch = False
+
+        self.create_rows(2)
+        num_queries, data = self.count_queries(DefaultList)
+        assert num_queries == 5
+
+
+class TargetNameSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ForeignKeyTarget
+        fields = ('id', 'name')
+
+
+class TargetNameList(generics.ListAPIView):
+    queryset = ForeignKeyTarget.objects.order_by('pk')
+    serializer_class = TargetNameSerializer
+    project_columns = True
+
+
+class TestColumnProjection(TestCase):
+    def setUp(self):
+        for index in range(3):
+            ForeignKeyTarget.objects.create(name='target-%d' % index)
+
+    def test_plain_fields_use_values(self):
+        lookups = get_related_lookups(TargetNameSerializer(), ForeignKeyTarget)
+        assert lookups.values == ['id', 'name']
+
+        queryset = optimize_queryset(ForeignKeyTarget.objects.all(), TargetNameSerializer(), use_values=True)
+        assert queryset._fields == ('id', 'name')
+
+    def test_relations_and_methods_require_instances(self):
+        assert get_related_lookups(SourceSerializer(), ForeignKeySource).values is None
+        assert get_related_lookups(NestedSourceSerializer(), NestedForeignKeySource).values is None
+
+        class MethodSerializer(TargetNameSerializer):
+            first_source = serializers.ReadOnlyField()
+
+            class Meta(TargetNameSerializer.Meta):
+                fields = ('id', 'name', 'first_source')
+
+        assert get_related_lookups(MethodSerializer(), ForeignKeyTarget).values is None
+
+    def test_overridden_to_representation_requires_instances(self):
+        class CustomSerializer(TargetNameSerializer):
+            def to_representation(self, instance):
+                return {'name': instance.name.upper()}
+
+        assert get_related_lookups(CustomSerializer(), ForeignKeyTarget).values is None
+
+    def test_list_output_is_unchanged(self):
+        class InstanceList(TargetNameList):
+            project_columns = False
+
+        expected = InstanceList.as_view()(factory.get('/')).data
+        with CaptureQueriesContext(connection) as context:
+            response = TargetNameList.as_view()(factory.get('/'))
+        assert len(context) == 1
+        assert response.data == expected
+
+    def test_cursor_pagination_ordering_fields_are_included(self):
+        class NameSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = ForeignKeyTarget
+                fields = ('name',)
+
+        class Pagination(CursorPagination):
+            ordering = 'id'
+            page_size = 2
+
+        class PaginatedList(TargetNameList):
+            serializer_class = NameSerializer
+            pagination_class = Pagination
+
+        response = PaginatedList.as_view()(factory.get('/'))
+        assert response.data['results'] == [{'name': 'target-0'}, {'name': 'target-1'}]
+        assert response.data['next'] is not None
@@ -447,3 +447,50 @@ class HyperlinkedNullableOneToOneTests(TestCase):
             {'url': 'http://testserver/onetoonetarget/2/', 'name': 'target-2', 'nullable_source': None},
         ]
         assert serializer.data == expected
+
+
+@override_settings(ROOT_URLCONF='tests.test_relations_hyperlink')
+class HyperlinkedBatchedLookupTests(TestCase):
+    def setUp(self):
+        for idx in range(1, 4):
+            ForeignKeyTarget.objects.create(name='target-%d' % idx)
+            ManyToManyTarget.objects.create(name='target-%d' % idx)
+
+    def test_list_serializer_fetches_related_objects_together(self):
+        data = [
+            {'name': 'source-%d' % idx, 'target': 'http://testserver/foreignkeytarget/%d/' % (idx % 3 + 1)}
+            for idx in range(10)
+        ]
+        serializer = ForeignKeySourceSerializer(data=data, many=True, context={'request': request})
+        with self.assertNumQueries(1):
+            assert serializer.is_valid(), serializer.errors
+        targets = [item['target'].pk for item in serializer.validated_data]
+        assert targets == [idx % 3 + 1 for idx in range(10)]
+
+    def test_many_related_field_fetches_objects_together(self):
+        data = {
+            'name': 'source',
+            'targets': ['http://testserver/manytomanytarget/%d/' % idx for idx in range(1, 4)]
+        }
+        serializer = ManyToManySourceSerializer(data=data, context={'request': request})
+        with self.assertNumQueries(1):
+            assert serializer.is_valid(), serializer.errors
+        assert [target.pk for target in serializer.validated_data['targets']] == [1, 2, 3]
+
+    def test_errors_are_unchanged(self):
+        data = [
+            {'name': 'source-1', 'target': 'http://testserver/foreignkeytarget/1/'},
+            {'name': 'source-2', 'target': 'http://testserver/foreignkeytarget/4/'},
+            {'name': 'source-3', 'target': 'http://testserver/foreignkeysource/1/'},
+            {'name': 'source-4', 'target': 'http://testserver/invalid/'},
+            {'name': 'source-5', 'target': 1},
+        ]
+        serializer = ForeignKeySourceSerializer(data=data, many=True, context={'request': request})
+        assert not serializer.is_valid()
+        assert serializer.errors == [
+            {},
+            {'target': ['Invalid hyperlink - Object does not exist.']},
+            {'target': ['Invalid hyperlink - Incorrect URL match.']},
+            {'target': ['Invalid hyperlink - No URL match.']},
+            {'target': ['Incorrect type. Expected URL string, received int.']},
+        ]
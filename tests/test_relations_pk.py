@@ -617,3 +617,91 @@ class OneToOnePrimaryKeyTests(TestCase):
         self.assertFalse(source.is_valid())
         self.assertIn("Invalid pk", source.errors['target'][0])
         self.assertIn("object does not exist", source.errors['target'][0])
+
+
+class PKBatchedLookupTests(TestCase):
+    def setUp(self):
+        for idx in range(1, 4):
+            ForeignKeyTarget.objects.create(name='target-%d' % idx)
+            ManyToManyTarget.objects.create(name='target-%d' % idx)
+
+    def test_list_serializer_fetches_related_objects_together(self):
+        data = [
+            {'name': 'source-%d' % idx, 'target': idx % 3 + 1}
+            for idx in range(10)
+        ]
+        serializer = ForeignKeySourceSerializer(data=data, many=True)
+        with self.assertNumQueries(1):
+            assert serializer.is_valid(), serializer.errors
+        targets = [item['target'] for item in serializer.validated_data]
+        assert [target.pk for target in targets] == [idx % 3 + 1 for idx in range(10)]
+        assert targets[0] is targets[3]
+
+    def test_list_serializer_fetches_many_related_objects_together(self):
+        data = [
+            {'name': 'source-%d' % idx, 'targets': [1, 2, '3']}
+            for idx in range(10)
+        ]
+        serializer = ManyToManySourceSerializer(data=data, many=True)
+        with self.assertNumQueries(1):
+            assert serializer.is_valid(), serializer.errors
+        for item in serializer.validated_data:
+            assert [target.pk for target in item['targets']] == [1, 2, 3]
+
+    def test_many_related_field_fetches_objects_together(self):
+        serializer = ManyToManySourceSerializer(data={'name': 'source', 'targets': [1, 2, 3]})
+        with self.assertNumQueries(1):
+            assert serializer.is_valid(), serializer.errors
+        assert [target.pk for target in serializer.validated_data['targets']] == [1, 2, 3]
+
+    def test_errors_are_unchanged(self):
+        data = [
+            {'name': 'source-1', 'target': 1},
+            {'name': 'source-2', 'target': 4},
+            {'name': 'source-3', 'target': 'invalid'},
+            {'name': 'source-4', 'target': True},
+            {'name': 'source-5', 'target': [1]},
+        ]
+        serializer = ForeignKeySourceSerializer(data=data, many=True)
+        assert not serializer.is_valid()
+        assert serializer.errors == [
+            {},
+            {'target': ['Invalid pk "4" - object does not exist.']},
+            {'target': ['Incorrect type. Expected pk value, received str.']},
+            {'target': ['Incorrect type. Expected pk value, received bool.']},
+            {'target': ['Incorrect type. Expected pk value, received list.']},
+        ]
+
+    def test_pk_field(self):
+        target = UUIDForeignKeyTarget.objects.create(name='target')
+        data = [
+            {'name': 'source-1', 'target': str(target.pk)},
+            {'name': 'source-2', 'target': str(target.pk).upper()},
+            {'name': 'source-3', 'target': 'invalid'},
+        ]
+        serializer = NullableUUIDForeignKeySourceSerializer(data=data, many=True)
+        assert not serializer.is_valid()
+        assert serializer.errors == [{}, {}, {'target': ['Must be a valid UUID.']}]
+
+    def test_queryset_is_respected(self):
+        class LimitedSerializer(serializers.Serializer):
+            target = serializers.PrimaryKeyRelatedField(
+                queryset=ForeignKeyTarget.objects.exclude(name='target-2')
+            )
+
+        serializer = LimitedSerializer(data=[{'target': 1}, {'target': 2}], many=True)
+        assert not serializer.is_valid()
+        assert serializer.errors == [{}, {'target': ['Invalid pk "2" - object does not exist.']}]
+
+    def test_overridden_to_internal_value_is_not_batched(self):
+        class TargetField(serializers.PrimaryKeyRelatedField):
+            def to_internal_value(self, data):
+                return super().to_internal_value(data['id'])
+
+        class NestedPKSerializer(serializers.Serializer):
+            target = TargetField(queryset=ForeignKeyTarget.objects.all())
+
+        data = [{'target': {'id': 1}}, {'target': {'id': 2}}]
+        serializer = NestedPKSerializer(data=data, many=True)
+        with self.assertNumQueries(2):
+            assert serializer.is_valid(), serializer.errors
@@ -285,3 +285,43 @@ class SlugNullableForeignKeyTests(TestCase):
             {'id': 3, 'name': 'source-3', 'target': None}
         ]
         assert serializer.data == expected
+
+
+class SlugBatchedLookupTests(TestCase):
+    def setUp(self):
+        for idx in range(1, 4):
+            ForeignKeyTarget.objects.create(name='target-%d' % idx)
+        ForeignKeyTarget.objects.create(name='duplicate')
+        ForeignKeyTarget.objects.create(name='duplicate')
+
+    def test_list_serializer_fetches_related_objects_together(self):
+        data = [
+            {'name': 'source-%d' % idx, 'target': 'target-%d' % (idx % 3 + 1)}
+            for idx in range(10)
+        ]
+        serializer = ForeignKeySourceSerializer(data=data, many=True)
+        with self.assertNumQueries(1):
+            assert serializer.is_valid(), serializer.errors
+        targets = [item['target'].name for item in serializer.validated_data]
+        assert targets == ['target-%d' % (idx % 3 + 1) for idx in range(10)]
+
+    def test_errors_are_unchanged(self):
+        data = [
+            {'name': 'source-1', 'target': 'target-1'},
+            {'name': 'source-2', 'target': 'missing'},
+        ]
+        serializer = ForeignKeySourceSerializer(data=data, many=True)
+        assert not serializer.is_valid()
+        assert serializer.errors == [
+            {},
+            {'target': ['Object with name=missing does not exist.']},
+        ]
+
+    def test_multiple_objects_are_looked_up_individually(self):
+        data = [
+            {'name': 'source-1', 'target': 'target-1'},
+            {'name': 'source-2', 'target': 'duplicate'},
+        ]
+        serializer = ForeignKeySourceSerializer(data=data, many=True)
+        with self.assertRaises(ForeignKeyTarget.MultipleObjectsReturned):
+            serializer.is_valid()
@@ -16,13 +16,15 @@ from rest_framework.compat import coreapi
 from rest_framework.decorators import action
 from rest_framework.renderers import (
     AdminRenderer, BaseRenderer, BrowsableAPIRenderer, DocumentationRenderer,
-    HTMLFormRenderer, JSONRenderer, SchemaJSRenderer, StaticHTMLRenderer
+    HTMLFormRenderer, JSONRenderer, NDJSONRenderer, SchemaJSRenderer,
+    StaticHTMLRenderer
 )
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.routers import SimpleRouter
 from rest_framework.settings import api_settings
 from rest_framework.test import APIRequestFactory, URLPatternsTestCase
+from rest_framework.urlpatterns import format_suffix_patterns
 from rest_framework.utils import json
 from rest_framework.views import APIView
 from rest_framework.viewsets import ViewSet
@@ -475,6 +477,117 @@ class TestJSONIndentationStyles:
         assert renderer.render(data) == b'{"a": 1, "b": 2}'
 
 
+class TestJSONRenderStream:
+    data = [
+        {"a": 1, "b": [1, 2]},
+        {"a": "\u2028", "b": {"c": None}},
+        "text",
+        3.5,
+    ]
+
+    def render_stream(self, renderer, data, **kwargs):
+        return b''.join(renderer.render_stream(iter(data), **kwargs))
+
+    @pytest.mark.parametrize('data', [data, [], [{}]])
+    @pytest.mark.parametrize('compact', [True, False])
+    def test_matches_render(self, data, compact):
+        renderer = JSONRenderer()
+        renderer.compact = compact
+        assert self.render_stream(renderer, data) == renderer.render(data)
+
+    @pytest.mark.parametrize('data', [data, [], [{}]])
+    @pytest.mark.parametrize('indent', [1, 4])
+    def test_indented_matches_render(self, data, indent):
+        renderer = JSONRenderer()
+        context = {'indent': indent}
+        assert (
+            self.render_stream(renderer, data, renderer_context=context) ==
+            renderer.render(data, renderer_context=context)
+        )
+
+    def test_indent_from_accepted_media_type(self):
+        renderer = JSONRenderer()
+        media_type = 'application/json; indent=2'
+        assert (
+            self.render_stream(renderer, self.data, accepted_media_type=media_type) ==
+            renderer.render(self.data, accepted_media_type=media_type)
+        )
+
+    def test_output_is_chunked(self):
+        renderer = JSONRenderer()
+        renderer.stream_buffer_size = 10
+        data = [{"value": index} for index in range(5)]
+        chunks = list(renderer.render_stream(iter(data)))
+        assert len(chunks) == 6
+        assert b''.join(chunks) == renderer.render(data)
+
+    def test_items_are_encoded_lazily(self):
+        consumed = []
+
+        def items():
+            for index in range(3):
+                consumed.append(index)
+                yield index
+
+        renderer = JSONRenderer()
+        renderer.stream_buffer_size = 1
+        chunks = renderer.render_stream(items())
+        assert next(chunks) == b'[0'
+        assert consumed == [0]
+
+
+class NDJSONView(APIView):
+    renderer_classes = (JSONRenderer, NDJSONRenderer)
+
+    def get(self, request, format=None):
+        if 'page' in request.query_params:
+            return Response({
+                'count': 4,
+                'next': 'http://testserver/items?page=3',
+                'previous': 'http://testserver/items?page=1',
+                'results': [{'a': 3}, {'a': 4}],
+            })
+        return Response([{'a': 1}, {'a': '\n'}])
+
+
+class TestNDJSONRenderer(URLPatternsTestCase):
+    urlpatterns = format_suffix_patterns([path('items', NDJSONView.as_view())])
+
+    def test_render(self):
+        renderer = NDJSONRenderer()
+        assert renderer.render([{'a': 1, 'b': [1, 2]}, 'text', 3.5]) == b'{"a":1,"b":[1,2]}\n"text"\n3.5\n'
+        assert renderer.render({'detail': 'Not found.'}) == b'{"detail":"Not found."}\n'
+        assert renderer.render([]) == b''
+        assert renderer.render(None) == b''
+
+    def test_indent_is_ignored(self):
+        renderer = NDJSONRenderer()
+        context = {'indent': 4}
+        assert renderer.render([{'a': 1}], renderer_context=context) == b'{"a":1}\n'
+
+    def test_output_is_chunked(self):
+        renderer = NDJSONRenderer()
+        renderer.stream_buffer_size = 10
+        data = [{"value": index} for index in range(5)]
+        chunks = list(renderer.render_stream(iter(data)))
+        assert len(chunks) == 5
+        assert b''.join(chunks) == renderer.render(data)
+
+    def test_format_suffix(self):
+        for url in ('/items.ndjson', '/items?format=ndjson'):
+            response = self.client.get(url)
+            assert response['Content-Type'] == 'application/x-ndjson'
+            assert response.content == b'{"a":1}\n{"a":"\\n"}\n'
+
+    def test_paginated_response(self):
+        response = self.client.get('/items?page=2', HTTP_ACCEPT='application/x-ndjson')
+        assert response.content == b'{"a":3}\n{"a":4}\n'
+        assert response['Link'] == (
+            '<http://testserver/items?page=3>; rel="next", '
+            '<http://testserver/items?page=1>; rel="previous"'
+        )
+
+
 class TestHiddenFieldHTMLFormRenderer(TestCase):
     def test_hidden_field_rendering(self):
         class TestSerializer(serializers.Serializer):
@@ -1,9 +1,18 @@
-from django.test import TestCase, override_settings
-from django.urls import NoReverseMatch, path
+import uuid
 
-from rest_framework.reverse import reverse
+from django.test import TestCase, override_settings
+from django.urls import (
+    NoReverseMatch, include, path, re_path, register_converter,
+    set_script_prefix
+)
+from django.urls.converters import StringConverter
+
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.reverse import get_url_template, reverse, reverse_lookup
+from rest_framework.routers import DefaultRouter, SimpleRouter
 from rest_framework.test import APIRequestFactory
-from rest_framework.versioning import BaseVersioning
+from rest_framework.versioning import BaseVersioning, NamespaceVersioning
 
 factory = APIRequestFactory()
 
@@ -12,8 +21,68 @@ def null_view(request):
     pass
 
 
+class UpperConverter(StringConverter):
+    def to_url(self, value):
+        return str(value).upper()
+
+
+register_converter(UpperConverter, 'upper')
+
+
+class RouteViewSet(viewsets.ViewSet):
+    def list(self, request):
+        pass
+
+    def retrieve(self, request, pk=None):
+        pass
+
+    @action(detail=True)
+    def detail_action(self, request, pk=None):
+        pass
+
+
+class DigitsViewSet(RouteViewSet):
+    lookup_value_regex = '[0-9]+'
+
+
+class SlugViewSet(RouteViewSet):
+    lookup_field = 'slug'
+    lookup_value_converter = 'slug'
+
+
+class IntViewSet(RouteViewSet):
+    lookup_value_converter = 'int'
+
+
+class UUIDViewSet(RouteViewSet):
+    lookup_value_converter = 'uuid'
+
+
+simple_router = SimpleRouter()
+simple_router.register('routes', RouteViewSet, basename='simple-route')
+simple_router.register('digits', DigitsViewSet, basename='simple-digits')
+
+default_router = DefaultRouter()
+default_router.register('routes', RouteViewSet, basename='default-route')
+default_router.register('digits', DigitsViewSet, basename='default-digits')
+
+path_router = SimpleRouter(trailing_slash=False, use_regex_path=False)
+path_router.register('slugs', SlugViewSet, basename='path-slug')
+path_router.register('ints', IntViewSet, basename='path-int')
+path_router.register('uuids', UUIDViewSet, basename='path-uuid')
+
+routers = [simple_router, default_router, path_router]
+
 urlpatterns = [
     path('view', null_view, name='view'),
+    path('simple/', include(simple_router.urls)),
+    path('default/', include(default_router.urls)),
+    path('path/', include(path_router.urls)),
+    path('v1/', include((default_router.urls, 'routes'), namespace='v1')),
+    re_path(r'^shadowed/(?P<pk>[a-z]+)/$', null_view, name='shadowed'),
+    re_path(r'^shadowed/(?P<pk>\w+)/$', null_view, name='shadowing'),
+    path('upper/<upper:pk>/', null_view, name='upper'),
+    re_path(r'^optional/(?:(?P<pk>[0-9]+)/)?$', null_view, name='optional'),
 ]
 
 
@@ -52,3 +121,90 @@ class ReverseTests(TestCase):
 
         url = reverse('view', request=request)
         assert url == 'http://testserver/view'
+
+
+LOOKUP_VALUES = [
+    1, 42, 'abc', 'a.b', 'a b', 'a/b', '..', '.', 'ünïcode', 'a%20b', '?x=1#y',
+    "!$&'()*+,;=:@~", '', None, uuid.UUID('12345678-1234-5678-1234-567812345678'),
+    '12345678-1234-5678-1234-567812345678', 'drflookupsentinel',
+]
+
+
+@override_settings(ROOT_URLCONF='tests.test_reverse')
+class ReverseLookupTests(TestCase):
+    """
+    Tests that `reverse_lookup` returns the same URLs as `reverse`.
+    """
+    def assert_same_urls(self, viewname, lookup_url_kwarg, request, format=None):
+        for value in LOOKUP_VALUES:
+            kwargs = {lookup_url_kwarg: value}
+            try:
+                expected = reverse(viewname, kwargs=kwargs, request=request, format=format)
+            except NoReverseMatch:
+                with self.assertRaises(NoReverseMatch):
+                    reverse_lookup(viewname, lookup_url_kwarg, value, request, format)
+            else:
+                url = reverse_lookup(viewname, lookup_url_kwarg, value, request, format)
+                assert url == expected, (viewname, value)
+
+    def test_router_routes(self):
+        for router in routers:
+            for url_pattern in router.urls:
+                if url_pattern.name.endswith('-detail') or '-detail-' in url_pattern.name:
+                    _, viewset = url_pattern.name.split('-')[:2]
+                    lookup = 'slug' if viewset == 'slug' else 'pk'
+                    for format in (None, 'json'):
+                        request = factory.get('/view')
+                        self.assert_same_urls(url_pattern.name, lookup, request, format)
+                        if format is None or router is default_router:
+                            assert get_url_template(url_pattern.name, lookup, request, format) is not None
+
+    def test_router_routes_with_url_format_override(self):
+        request = factory.get('/view', {'format': 'api'})
+        self.assert_same_urls('simple-route-detail', 'pk', request)
+
+    def test_namespaced_routes(self):
+        request = factory.get('/view')
+        request.version = 'v1'
+        request.versioning_scheme = NamespaceVersioning()
+        self.assert_same_urls('default-route-detail', 'pk', request)
+        assert get_url_template('default-route-detail', 'pk', request) is not None
+
+    def test_script_prefix(self):
+        request = factory.get('/view', SCRIPT_NAME='/prefix')
+        set_script_prefix('/prefix/')
+        self.addCleanup(set_script_prefix, '/')
+        self.assert_same_urls('simple-route-detail', 'pk', request)
+
+    def test_converter_routes(self):
+        request = factory.get('/view')
+        self.assert_same_urls('path-int-detail', 'pk', request)
+        self.assert_same_urls('path-uuid-detail', 'pk', request)
+        assert get_url_template('path-int-detail', 'pk', request) is not None
+        assert get_url_template('path-uuid-detail', 'pk', request) is not None
+
+    def test_custom_converter_is_not_templated(self):
+        request = factory.get('/view')
+        self.assert_same_urls('upper', 'pk', request)
+        assert get_url_template('upper', 'pk', request) is None
+
+    def test_shadowed_pattern_is_not_templated(self):
+        request = factory.get('/view')
+        self.assert_same_urls('shadowing', 'pk', request)
+        assert get_url_template('shadowing', 'pk', request) is None
+
+    def test_optional_group(self):
+        request = factory.get('/view')
+        self.assert_same_urls('optional', 'pk', request)
+
+    def test_template_is_cached_on_request(self):
+        request = factory.get('/view')
+        reverse_lookup('simple-route-detail', 'pk', 1, request)
+        templates = request._url_templates
+        assert len(templates) == 1
+        reverse_lookup('simple-route-detail', 'pk', 2, request)
+        assert request._url_templates is templates and len(templates) == 1
+
+    def test_without_request(self):
+        url = reverse_lookup('simple-route-detail', 'pk', 1)
+        assert url == '/simple/routes/1/'
@@ -6,6 +6,7 @@ from collections.abc import Mapping
 
 import pytest
 from django.db import models
+from django.test import override_settings
 
 from rest_framework import exceptions, fields, relations, serializers
 from rest_framework.fields import Field
@@ -774,3 +775,107 @@ class TestSetValueMethod:
         ret = {'a': 1}
         self.s.set_value(ret, ['x', 'y'], 2)
         assert ret == {'a': 1, 'x': {'y': 2}}
+
+
+class TestCompiledRepresentation:
+    class Target:
+        def __init__(self, pk, name):
+            self.pk = pk
+            self.name = name
+
+    class Example:
+        def __init__(self, **kwargs):
+            self.__dict__.update(kwargs)
+
+        def get_label(self):
+            return 'label-%s' % self.char
+
+        @property
+        def missing(self):
+            raise AttributeError('missing')
+
+    def get_serializer_class(self):
+        class NestedSerializer(serializers.Serializer):
+            name = serializers.CharField()
+
+        class ExampleSerializer(serializers.Serializer):
+            char = serializers.CharField()
+            integer = serializers.IntegerField()
+            label = serializers.CharField(source='get_label')
+            dotted = serializers.CharField(source='target.name')
+            nullable = serializers.CharField(allow_null=True)
+            optional = serializers.CharField(source='missing', required=False)
+            default = serializers.CharField(source='missing', default='x', read_only=True)
+            target = NestedSerializer()
+            target_pk = serializers.PrimaryKeyRelatedField(source='target', read_only=True)
+            whole = serializers.SerializerMethodField()
+            secret = serializers.CharField(write_only=True)
+
+            def get_whole(self, obj):
+                return obj.char * 2
+
+        return ExampleSerializer
+
+    def get_instances(self):
+        return [
+            self.Example(
+                char='a', integer=1, nullable=None,
+                target=self.Target(pk=1, name='one'),
+            ),
+            self.Example(
+                char='b', integer=2, nullable='c',
+                target=self.Target(pk=None, name='two'),
+            ),
+            {
+                'char': 'c', 'integer': 3, 'get_label': 'from-dict', 'nullable': None,
+                'target': {'name': 'three'}, 'secret': 'hidden',
+            },
+        ]
+
+    def serialize(self, compiled):
+        with override_settings(REST_FRAMEWORK={'COMPILED_REPRESENTATION': compiled}):
+            serializer = self.get_serializer_class()(self.get_instances()[:2], many=True)
+            return serializer.data
+
+    def test_compiled_matches_default(self):
+        assert self.serialize(compiled=True) == self.serialize(compiled=False)
+
+    def test_compiled_output(self):
+        data = self.serialize(compiled=True)
+        assert data[0] == {
+            'char': 'a', 'integer': 1, 'label': 'label-a', 'dotted': 'one',
+            'nullable': None, 'default': 'x', 'target': {'name': 'one'},
+            'target_pk': 1, 'whole': 'aa',
+        }
+        assert data[1]['target_pk'] is None
+
+    def test_compiled_mapping_instance(self):
+        class DictSerializer(serializers.Serializer):
+            char = serializers.CharField()
+            label = serializers.CharField(source='get_label')
+            nullable = serializers.CharField(allow_null=True)
+
+        instance = self.get_instances()[2]
+        expected = DictSerializer(instance).data
+        with override_settings(REST_FRAMEWORK={'COMPILED_REPRESENTATION': True}):
+            assert DictSerializer(instance).data == expected
+
+    def test_compiled_missing_attribute_error(self):
+        class MissingSerializer(serializers.Serializer):
+            missing = serializers.CharField()
+
+        with override_settings(REST_FRAMEWORK={'COMPILED_REPRESENTATION': True}):
+            serializer = MissingSerializer(self.Example(char='a'))
+            with pytest.raises(AttributeError) as exc_info:
+                serializer.data
+        assert 'serializer `MissingSerializer`' in str(exc_info.value)
+
+    def test_plan_is_reused_and_discarded_on_field_changes(self):
+        serializer = self.get_serializer_class()()
+        plan = serializer._representation_plan
+        assert serializer._representation_plan is plan
+        assert [entry[0] for entry in plan][-1] == 'whole'
+
+        serializer.fields.pop('whole')
+        assert serializer._representation_plan is not plan
+        assert 'whole' not in [entry[0] for entry in serializer._representation_plan]
@@ -1,11 +1,15 @@
 import pytest
+from django.db import connection
 from django.http import QueryDict
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils.datastructures import MultiValueDict
 
 from rest_framework import serializers
 from rest_framework.exceptions import ErrorDetail
 from tests.models import (
-    CustomManagerModel, NullableOneToOneSource, OneToOneTarget
+    CustomManagerModel, ForeignKeySource, ForeignKeyTarget, ManyToManySource,
+    ManyToManyTarget, NullableOneToOneSource, OneToOneTarget
 )
 
 
@@ -775,3 +779,199 @@ class TestToRepresentationManagerCheck:
         queryset = NullableOneToOneSource.objects.all()
         serializer = self.serializer(queryset, many=True)
         assert serializer.data
+
+
+class BulkForeignKeySourceSerializer(serializers.ModelSerializer):
+    id = serializers.IntegerField(required=False)
+
+    class Meta:
+        model = ForeignKeySource
+        fields = ('id', 'name', 'target')
+
+
+class BulkManyToManySourceSerializer(serializers.ModelSerializer):
+    id = serializers.IntegerField(required=False)
+
+    class Meta:
+        model = ManyToManySource
+        fields = ('id', 'name', 'targets')
+
+
+class TestBulkListSerializer(TestCase):
+    def setUp(self):
+        self.targets = [
+            ManyToManyTarget.objects.create(name='target-%d' % idx)
+            for idx in range(3)
+        ]
+        self.target = ForeignKeyTarget.objects.create(name='target')
+
+    def count_queries(self, serializer):
+        assert serializer.is_valid(), serializer.errors
+        with CaptureQueriesContext(connection) as context:
+            serializer.save()
+        return len(context.captured_queries)
+
+    def test_bulk_create(self):
+        data = [{'name': 'source-%d' % idx, 'target': self.target.pk} for idx in range(10)]
+        serializer = BulkForeignKeySourceSerializer(data=data, many=True, bulk=True)
+        assert serializer.is_valid(), serializer.errors
+        instances = serializer.save()
+        assert [instance.name for instance in instances] == ['source-%d' % idx for idx in range(10)]
+        assert all(instance.pk is not None for instance in instances)
+        assert ForeignKeySource.objects.filter(target=self.target).count() == 10
+        assert serializer.data[0] == {'id': instances[0].pk, 'name': 'source-0', 'target': self.target.pk}
+
+    def test_bulk_create_uses_fewer_queries(self):
+        data = [{'name': 'source-%d' % idx, 'target': self.target.pk} for idx in range(10)]
+        per_row = self.count_queries(BulkForeignKeySourceSerializer(data=data, many=True))
+        bulk = self.count_queries(BulkForeignKeySourceSerializer(data=data, many=True, bulk=True))
+        assert per_row >= 10
+        assert bulk <= 3
+
+    def test_bulk_create_batch_size(self):
+        data = [{'name': 'source-%d' % idx, 'target': self.target.pk} for idx in range(10)]
+        serializer = BulkForeignKeySourceSerializer(data=data, many=True, bulk=True, batch_size=4)
+        assert serializer.batch_size == 4
+        assert 'batch_size' not in serializer.child._kwargs
+        assert serializer.is_valid(), serializer.errors
+        with CaptureQueriesContext(connection) as context:
+            serializer.save()
+        inserts = [query for query in context.captured_queries if query['sql'].startswith('INSERT')]
+        assert len(inserts) == 3
+
+    def test_bulk_create_many_to_many(self):
+        target_pks = [target.pk for target in self.targets]
+        data = [
+            {'name': 'source-%d' % idx, 'targets': target_pks[:idx % 3 + 1]}
+            for idx in range(10)
+        ]
+        per_row = self.count_queries(BulkManyToManySourceSerializer(data=data, many=True))
+        serializer = BulkManyToManySourceSerializer(data=data, many=True, bulk=True)
+        bulk = self.count_queries(serializer)
+        assert per_row >= 20
+        assert bulk <= 4
+        for idx, instance in enumerate(serializer.instance):
+            assert sorted(instance.targets.values_list('pk', flat=True)) == target_pks[:idx % 3 + 1]
+
+    def test_bulk_update(self):
+        sources = [
+            ForeignKeySource.objects.create(name='source-%d' % idx, target=self.target)
+            for idx in range(10)
+        ]
+        other = ForeignKeyTarget.objects.create(name='other')
+        data = [
+            {'id': source.pk, 'name': 'updated-%d' % idx, 'target': other.pk}
+            for idx, source in enumerate(sources[:5])
+        ]
+        serializer = BulkForeignKeySourceSerializer(
+            ForeignKeySource.objects.all(), data=data, many=True, bulk=True
+        )
+        assert serializer.is_valid(), serializer.errors
+        instances = serializer.save()
+        assert [instance.pk for instance in instances] == [source.pk for source in sources[:5]]
+        assert list(ForeignKeySource.objects.order_by('pk').values_list('name', 'target')) == [
+            ('updated-%d' % idx, other.pk) for idx in range(5)
+        ] + [
+            ('source-%d' % idx, self.target.pk) for idx in range(5, 10)
+        ]
+
+    def test_bulk_update_uses_fewer_queries(self):
+        sources = [
+            ForeignKeySource.objects.create(name='source-%d' % idx, target=self.target)
+            for idx in range(10)
+        ]
+        data = [{'id': source.pk, 'name': 'updated', 'target': self.target.pk} for source in sources]
+
+        class PerRowListSerializer(serializers.ListSerializer):
+            def update(self, instance, validated_data):
+                instances = {obj.pk: obj for obj in instance}
+                return [
+                    self.child.update(instances[attrs['id']], attrs)
+                    for attrs in validated_data
+                ]
+
+        per_row = self.count_queries(PerRowListSerializer(
+            ForeignKeySource.objects.all(), data=data, child=BulkForeignKeySourceSerializer()
+        ))
+        bulk = self.count_queries(BulkForeignKeySourceSerializer(
+            ForeignKeySource.objects.all(), data=data, many=True, bulk=True
+        ))
+        assert per_row >= 10
+        assert bulk <= 3
+
+    def test_bulk_update_many_to_many(self):
+        sources = [ManyToManySource.objects.create(name='source-%d' % idx) for idx in range(3)]
+        for source in sources:
+            source.targets.set(self.targets[:2])
+        target_pks = [target.pk for target in self.targets]
+        data = [
+            {'id': sources[0].pk, 'name': 'updated-0', 'targets': target_pks[1:]},
+            {'id': sources[1].pk, 'name': 'updated-1', 'targets': target_pks[2:]},
+        ]
+        serializer = BulkManyToManySourceSerializer(sources, data=data, many=True, bulk=True)
+        assert serializer.is_valid(), serializer.errors
+        serializer.save()
+        assert sorted(sources[0].targets.values_list('pk', flat=True)) == target_pks[1:]
+        assert list(sources[1].targets.values_list('pk', flat=True)) == target_pks[2:]
+        assert sorted(sources[2].targets.values_list('pk', flat=True)) == target_pks[:2]
+        assert ManyToManySource.objects.get(pk=sources[0].pk).name == 'updated-0'
+
+    def test_bulk_update_validates_pk(self):
+        source = ForeignKeySource.objects.create(name='source', target=self.target)
+        data = [
+            {'id': source.pk, 'name': 'updated', 'target': self.target.pk},
+            {'name': 'missing', 'target': self.target.pk},
+            {'id': source.pk + 100, 'name': 'unknown', 'target': self.target.pk},
+            {'id': 'invalid', 'name': 'invalid', 'target': self.target.pk},
+        ]
+        serializer = BulkForeignKeySourceSerializer([source], data=data, many=True, bulk=True)
+        assert not serializer.is_valid()
+        assert serializer.errors == [
+            {},
+            {'id': ['This field is required.']},
+            {'id': ['Invalid pk "%d" - object does not exist.' % (source.pk + 100)]},
+            {'id': ['A valid integer is required.']},
+        ]
+
+    def test_bulk_update_requires_pk_field(self):
+        class SourceSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = ForeignKeySource
+                fields = ('id', 'name', 'target')
+
+        source = ForeignKeySource.objects.create(name='source', target=self.target)
+        serializer = SourceSerializer([source], data=[{'name': 'updated'}], many=True, bulk=True)
+        with pytest.raises(AssertionError):
+            serializer.is_valid()
+
+    def test_update_without_bulk_is_not_implemented(self):
+        source = ForeignKeySource.objects.create(name='source', target=self.target)
+        data = [{'id': source.pk, 'name': 'updated', 'target': self.target.pk}]
+        serializer = BulkForeignKeySourceSerializer([source], data=data, many=True)
+        assert serializer.is_valid(), serializer.errors
+        with pytest.raises(NotImplementedError):
+            serializer.save()
+
+    def test_custom_create_is_not_bypassed(self):
+        class SourceSerializer(BulkForeignKeySourceSerializer):
+            def create(self, validated_data):
+                return super().create(validated_data)
+
+        data = [{'name': 'source', 'target': self.target.pk}]
+        serializer = SourceSerializer(data=data, many=True, bulk=True)
+        assert serializer.is_valid(), serializer.errors
+        with pytest.raises(AssertionError):
+            serializer.save()
+
+    def test_bulk_list_serializer_class(self):
+        class BulkListSerializer(serializers.ListSerializer):
+            bulk = True
+            batch_size = 100
+
+        class SourceSerializer(BulkForeignKeySourceSerializer):
+            class Meta(BulkForeignKeySourceSerializer.Meta):
+                list_serializer_class = BulkListSerializer
+
+        serializer = SourceSerializer(data=[{'name': 'source', 'target': self.target.pk}], many=True)
+        assert serializer.bulk
+        assert serializer.batch_size == 100
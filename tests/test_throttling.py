@@ -5,6 +5,8 @@ Tests for the throttling implementations in the permissions module.
 import pytest
 from django.contrib.auth.models import User
 from django.core.cache import cache
+from django.core.cache.backends.base import BaseCache
+from django.core.cache.backends.locmem import LocMemCache
 from django.core.exceptions import ImproperlyConfigured
 from django.http import HttpRequest
 from django.test import TestCase
@@ -14,8 +16,9 @@ from rest_framework.response import Response
 from rest_framework.settings import api_settings
 from rest_framework.test import APIRequestFactory, force_authenticate
 from rest_framework.throttling import (
-    AnonRateThrottle, BaseThrottle, ScopedRateThrottle, SimpleRateThrottle,
-    UserRateThrottle
+    AnonRateThrottle, BaseThrottle, ScopedRateThrottle,
+    ScopedSlidingWindowRateThrottle, SimpleRateThrottle,
+    SlidingWindowRateThrottle, UserRateThrottle, UserSlidingWindowRateThrottle
 )
 from rest_framework.views import APIView
 
@@ -439,6 +442,227 @@ class XffUniqueMachinesTest(XffTestingBase):
         assert self.view(self.request).status_code == 200
 
 
+class NonAtomicLocMemCache(LocMemCache):
+    incr = BaseCache.incr
+
+
+class SlidingWindowRateThrottleTests(TestCase):
+    """
+    Tests for the sliding window counter throttles.
+    """
+
+    def setUp(self):
+        cache.clear()
+
+        class User3MinSlidingWindowThrottle(UserSlidingWindowRateThrottle):
+            TIMER_SECONDS = 0
+            rate = '3/min'
+
+            def timer(self):
+                return self.TIMER_SECONDS
+
+        class MockSlidingWindowView(APIView):
+            throttle_classes = (User3MinSlidingWindowThrottle,)
+
+            def get(self, request):
+                return Response('foo')
+
+        self.throttle_class = User3MinSlidingWindowThrottle
+        self.view = MockSlidingWindowView.as_view()
+        self.factory = APIRequestFactory()
+
+    def set_timer(self, seconds):
+        self.throttle_class.TIMER_SECONDS = seconds
+
+    def get_responses(self, count):
+        request = self.factory.get('/')
+        return [self.view(request) for dummy in range(count)]
+
+    def test_requests_are_throttled(self):
+        responses = self.get_responses(4)
+        assert [response.status_code for response in responses] == [200, 200, 200, 429]
+
+    def test_only_counters_are_stored(self):
+        self.get_responses(5)
+        assert cache.get('throttle_user_127.0.0.1_0') == 3
+
+    def test_wait_for_next_window(self):
+        self.set_timer(10)
+        response = self.get_responses(4)[-1]
+        # The count of 3 must be weighted by 2/3 in the next window.
+        assert response['Retry-After'] == '70'
+
+    def test_previous_window_is_weighted(self):
+        self.get_responses(3)
+        # Halfway through the next window, the previous window counts as
+        # 1.5 requests.
+        self.set_timer(90)
+        responses = self.get_responses(2)
+        assert [response.status_code for response in responses] == [200, 429]
+        assert responses[-1]['Retry-After'] == '10'
+
+        self.set_timer(100)
+        assert self.get_responses(1)[0].status_code == 200
+
+    def test_requests_are_allowed_after_two_windows(self):
+        self.get_responses(4)
+        self.set_timer(120)
+        responses = self.get_responses(4)
+        assert [response.status_code for response in responses] == [200, 200, 200, 429]
+
+    def test_non_atomic_cache_backend(self):
+        self.throttle_class.cache = NonAtomicLocMemCache('throttling', {})
+        try:
+            responses = self.get_responses(5)
+            assert [response.status_code for response in responses] == [200, 200, 200, 429, 429]
+            assert self.throttle_class.cache.get('throttle_user_127.0.0.1_0') == 3
+        finally:
+            self.throttle_class.cache.clear()
+            del self.throttle_class.cache
+
+    def test_scoped_sliding_window_throttle(self):
+        class XScopedThrottle(ScopedSlidingWindowRateThrottle):
+            THROTTLE_RATES = {'x': '1/min'}
+
+        class XView(APIView):
+            throttle_classes = (XScopedThrottle,)
+            throttle_scope = 'x'
+
+            def get(self, request):
+                return Response('x')
+
+        request = self.factory.get('/')
+        assert XView.as_view()(request).status_code == 200
+        assert XView.as_view()(request).status_code == 429
+
+    def test_wait_returns_none_if_rate_is_zero(self):
+        throttle = SlidingWindowRateThrottle.__new__(SlidingWindowRateThrottle)
+        throttle.num_requests = 0
+        assert throttle.wait() is None
+
+
+class CallCountingLocMemCache(LocMemCache):
+    """
+    Records the cache operations that are called, ignoring the ones that
+    `get_many()` and `set_many()` are implemented with.
+    """
+    def __init__(self):
+        super().__init__('throttling-calls', {})
+        self.calls = []
+        self.nested = False
+
+    def record(self, name, method, *args, **kwargs):
+        if self.nested:
+            return method(*args, **kwargs)
+        self.calls.append(name)
+        self.nested = True
+        try:
+            return method(*args, **kwargs)
+        finally:
+            self.nested = False
+
+    def get(self, *args, **kwargs):
+        return self.record('get', super().get, *args, **kwargs)
+
+    def set(self, *args, **kwargs):
+        return self.record('set', super().set, *args, **kwargs)
+
+    def get_many(self, *args, **kwargs):
+        return self.record('get_many', super().get_many, *args, **kwargs)
+
+    def set_many(self, data, timeout=None, *args, **kwargs):
+        return self.record(('set_many', timeout), super().set_many, data, timeout, *args, **kwargs)
+
+
+class BatchedThrottlingTests(TestCase):
+    """
+    Tests for evaluating the throttles of a view together.
+    """
+
+    def setUp(self):
+        self.cache = CallCountingLocMemCache()
+        self.cache.clear()
+        self.factory = APIRequestFactory()
+
+    def get_view(self, *throttle_classes, **attrs):
+        attrs.update({
+            'throttle_classes': throttle_classes,
+            'get': lambda self, request: Response('foo')
+        })
+        return type('BatchedView', (APIView,), attrs).as_view()
+
+    def get_throttle(self, base=UserRateThrottle, **attrs):
+        attrs.setdefault('cache', self.cache)
+        attrs.setdefault('timer', lambda self: 0)
+        return type('BatchedThrottle', (base,), attrs)
+
+    def test_throttles_use_one_round_trip_each_way(self):
+        view = self.get_view(
+            self.get_throttle(scope='burst', rate='3/min'),
+            self.get_throttle(scope='sustained', rate='5/min'),
+            self.get_throttle(base=ScopedRateThrottle, THROTTLE_RATES={'x': '4/min'}),
+            throttle_scope='x'
+        )
+        response = view(self.factory.get('/'))
+        assert response.status_code == 200
+        assert self.cache.calls == ['get_many', ('set_many', 60)]
+
+    def test_set_many_for_each_timeout(self):
+        view = self.get_view(
+            self.get_throttle(scope='burst', rate='3/sec'),
+            self.get_throttle(scope='sustained', rate='5/day'),
+        )
+        view(self.factory.get('/'))
+        assert self.cache.calls == ['get_many', ('set_many', 1), ('set_many', 86400)]
+        assert self.cache.get_many([
+            'throttle_burst_127.0.0.1', 'throttle_sustained_127.0.0.1'
+        ]) == {
+            'throttle_burst_127.0.0.1': [0],
+            'throttle_sustained_127.0.0.1': [0]
+        }
+
+    def test_requests_are_throttled(self):
+        view = self.get_view(
+            self.get_throttle(scope='burst', rate='3/min'),
+            self.get_throttle(scope='sustained', rate='5/min'),
+        )
+        request = self.factory.get('/')
+        responses = [view(request) for dummy in range(4)]
+        assert [response.status_code for response in responses] == [200, 200, 200, 429]
+        assert responses[-1]['Retry-After'] == '60'
+        assert len(self.cache.get('throttle_sustained_127.0.0.1')) == 4
+
+    def test_throttles_sharing_a_key_see_each_others_requests(self):
+        view = self.get_view(
+            self.get_throttle(scope='shared', rate='3/min'),
+            self.get_throttle(scope='shared', rate='5/min'),
+        )
+        view(self.factory.get('/'))
+        assert self.cache.get('throttle_shared_127.0.0.1') == [0, 0]
+
+    def test_unbatched_throttles_are_evaluated(self):
+        class DenyThrottle(BaseThrottle):
+            def allow_request(self, request, view):
+                return False
+
+        class OverriddenThrottle(UserRateThrottle):
+            cache = self.cache
+            rate = '3/min'
+
+            def allow_request(self, request, view):
+                return super().allow_request(request, view)
+
+        view = self.get_view(OverriddenThrottle, DenyThrottle)
+        response = view(self.factory.get('/'))
+        assert response.status_code == 429
+        assert self.cache.calls == ['get', 'set']
+
+    def test_unthrottled_requests_are_not_fetched(self):
+        view = self.get_view(self.get_throttle(base=ScopedRateThrottle))
+        assert view(self.factory.get('/')).status_code == 200
+        assert self.cache.calls == []
+
+
 class BaseThrottleTests(TestCase):
 
     def test_allow_request_raises_not_implemented_error(self):
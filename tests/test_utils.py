@@ -1,19 +1,21 @@
 from unittest import mock
 
+from django.core.signals import setting_changed
+from django.db import models
 from django.test import TestCase, override_settings
 from django.urls import path
 
 from rest_framework.decorators import action
 from rest_framework.routers import SimpleRouter
 from rest_framework.serializers import ModelSerializer
-from rest_framework.utils import json
+from rest_framework.utils import field_mapping, json, model_meta
 from rest_framework.utils.breadcrumbs import get_breadcrumbs
 from rest_framework.utils.formatting import lazy_format
 from rest_framework.utils.model_meta import FieldInfo, RelationInfo
 from rest_framework.utils.urls import remove_query_param, replace_query_param
 from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet
-from tests.models import BasicModel
+from tests.models import BasicModel, ForeignKeySource, ForeignKeyTarget
 
 
 class Root(APIView):
@@ -274,3 +276,70 @@ class ModelMetaNamedTupleNames(TestCase):
     def test_named_tuple_names(self):
         assert FieldInfo.__name__ == 'FieldInfo'
         assert RelationInfo.__name__ == 'RelationInfo'
+
+
+def limit_targets():
+    limit_targets.calls += 1
+    return {'name__startswith': 'limited-%d' % limit_targets.calls}
+
+
+limit_targets.calls = 0
+
+
+class CallableLimitedChoicesSource(models.Model):
+    target = models.ForeignKey(ForeignKeyTarget, limit_choices_to=limit_targets,
+                               on_delete=models.CASCADE)
+
+
+class UniqueTogetherPosition(models.Model):
+    race_name = models.CharField(max_length=100, unique=True)
+    position = models.IntegerField()
+
+    class Meta:
+        unique_together = ('race_name', 'position')
+
+
+class ModelMetaCacheTests(TestCase):
+    def setUp(self):
+        model_meta.clear_cache()
+
+    def test_field_info_is_cached(self):
+        info = model_meta.get_field_info(ForeignKeySource)
+        assert model_meta.get_field_info(ForeignKeySource) is info
+        assert model_meta.get_field_info(ForeignKeySource(name='source')) is info
+
+        model_meta.clear_cache()
+        assert model_meta.get_field_info(ForeignKeySource) is not info
+
+    def test_unique_together_constraints_are_cached(self):
+        constraints = model_meta.get_unique_together_constraints(UniqueTogetherPosition)
+        assert [fields for fields, *_ in constraints] == [('race_name', 'position')]
+        assert model_meta.get_unique_together_constraints(UniqueTogetherPosition) is constraints
+
+    def test_installed_apps_change_clears_cache(self):
+        info = model_meta.get_field_info(ForeignKeySource)
+        setting_changed.send(sender=None, setting='INSTALLED_APPS', value=(), enter=True)
+        assert model_meta.get_field_info(ForeignKeySource) is not info
+
+
+class FieldMappingCacheTests(TestCase):
+    def setUp(self):
+        field_mapping.clear_cache()
+
+    def test_field_kwargs_are_copied(self):
+        model_field = UniqueTogetherPosition._meta.get_field('race_name')
+        kwargs = field_mapping.get_field_kwargs('race_name', model_field)
+        kwargs['validators'].append(None)
+        kwargs['label'] = 'Changed'
+
+        fresh = field_mapping.get_field_kwargs('race_name', model_field)
+        assert fresh is not kwargs
+        assert None not in fresh['validators']
+        assert 'label' not in fresh
+
+    def test_callable_limit_choices_to_is_not_cached(self):
+        info = model_meta.get_field_info(CallableLimitedChoicesSource)
+        relation_info = info.forward_relations['target']
+        first = field_mapping.get_relation_kwargs('target', relation_info)
+        second = field_mapping.get_relation_kwargs('target', relation_info)
+        assert str(first['queryset'].query) != str(second['queryset'].query)
@@ -554,6 +554,101 @@ class TestUniquenessTogetherValidation(TestCase):
         assert repr(serializer) == expected
 
 
+class TestBatchedUniquenessValidation(TestCase):
+    def setUp(self):
+        UniquenessModel.objects.create(username='existing')
+        UniquenessTogetherModel.objects.create(race_name='example', position=1)
+
+    def test_unique_values_are_checked_together(self):
+        data = [{'username': 'user-%d' % idx} for idx in range(10)]
+        serializer = UniquenessSerializer(data=data, many=True)
+        with self.assertNumQueries(1):
+            assert serializer.is_valid(), serializer.errors
+
+    def test_unique_errors_map_to_items(self):
+        data = [
+            {'username': 'new'},
+            {'username': 'existing'},
+            {'username': 'other'},
+            {'username': 'new'},
+        ]
+        serializer = UniquenessSerializer(data=data, many=True)
+        with self.assertNumQueries(1):
+            assert not serializer.is_valid()
+        message = 'uniqueness model with this username already exists.'
+        assert serializer.errors == [{}, {'username': [message]}, {}, {'username': [message]}]
+
+    def test_unique_together_values_are_checked_together(self):
+        data = [{'race_name': 'example', 'position': idx} for idx in range(2, 12)]
+        serializer = UniquenessTogetherSerializer(data=data, many=True)
+        with self.assertNumQueries(1):
+            assert serializer.is_valid(), serializer.errors
+
+    def test_unique_together_errors_map_to_items(self):
+        data = [
+            {'race_name': 'example', 'position': 1},
+            {'race_name': 'example', 'position': 2},
+            {'race_name': 'other', 'position': 1},
+            {'race_name': 'example', 'position': '2'},
+            {'race_name': 'example'},
+        ]
+        serializer = UniquenessTogetherSerializer(data=data, many=True)
+        with self.assertNumQueries(1):
+            assert not serializer.is_valid()
+        message = 'The fields race_name, position must make a unique set.'
+        assert serializer.errors == [
+            {'non_field_errors': [message]},
+            {},
+            {},
+            {'non_field_errors': [message]},
+            {'position': ['This field is required.']},
+        ]
+
+    def test_null_values_are_not_duplicates(self):
+        data = [
+            {'race_name': 'example', 'position': None},
+            {'race_name': 'example', 'position': None},
+        ]
+        serializer = NullUniquenessTogetherSerializer(data=data, many=True)
+        assert serializer.is_valid(), serializer.errors
+
+    def test_lookup_other_than_exact_is_checked_individually(self):
+        data = [
+            {'username': 'Existing', 'email': 'first@example.com'},
+            {'username': 'new', 'email': 'second@example.com'},
+        ]
+        serializer = RelatedModelSerializer(data=data, many=True)
+        assert not serializer.is_valid()
+        assert serializer.errors == [{'username': ['This field must be unique.']}, {}]
+
+    def test_invalid_values_are_checked_individually(self):
+        serializer = UniquenessIntegerSerializer(data=[{'integer': 'abc'}, {'integer': 'abc'}], many=True)
+        assert serializer.is_valid(), serializer.errors
+
+    def test_updated_instance_excluded(self):
+        instance = UniquenessModel.objects.get(username='existing')
+        other = UniquenessModel.objects.create(username='other')
+
+        class UpdateListSerializer(serializers.ListSerializer):
+            def run_child_validation(self, data):
+                self.child.instance = self.instance[data['index']]
+                return super().run_child_validation({'username': data['username']})
+
+        class UpdateSerializer(UniquenessSerializer):
+            class Meta(UniquenessSerializer.Meta):
+                list_serializer_class = UpdateListSerializer
+
+        data = [
+            {'index': 0, 'username': 'existing'},
+            {'index': 1, 'username': 'existing'},
+        ]
+        serializer = UpdateSerializer([instance, other], data=data, many=True)
+        with self.assertNumQueries(1):
+            assert not serializer.is_valid()
+        message = 'uniqueness model with this username already exists.'
+        assert serializer.errors == [{}, {'username': [message]}]
+
+
 class UniqueConstraintModel(models.Model):
     race_name = models.CharField(max_length=100)
     position = models.IntegerField()
@@ -1012,3 +1107,20 @@ class ValidatorsTests(TestCase):
         assert validator == validator2
         validator2.date_field = "bar2"
         assert validator != validator2
+
+
+class TestBatchedUniqueConstraintValidation(TestCase):
+    def test_conditional_constraints_are_checked_individually(self):
+        UniqueConstraintModel.objects.create(race_name='example', position=1, global_id=1, fancy_conditions=1)
+        data = [
+            {'race_name': 'example', 'position': 1, 'global_id': 2, 'fancy_conditions': 2},
+            {'race_name': 'other', 'position': 1, 'global_id': 3, 'fancy_conditions': 3},
+            {'race_name': 'other', 'position': 1, 'global_id': 1, 'fancy_conditions': 4},
+        ]
+        serializer = UniqueConstraintSerializer(data=data, many=True)
+        assert not serializer.is_valid()
+        assert serializer.errors == [
+            {'non_field_errors': ['The fields race_name, position must make a unique set.']},
+            {},
+            {'global_id': ['unique constraint model with this global id already exists.']},
+        ]